@@ -0,0 +1,240 @@
+# Python implementation of contraction hierarchies for repeated shortest path queries on a static graph
+# Preprocessing contracts the nodes one by one in order of importance, adding shortcut edges that preserve shortest paths
+# Queries are then a bidirectional dijkstra that only ever moves to more important nodes, settling a tiny part of the graph
+# Works on UWGraph and DWGraph (or their CSR versions), edge weights must be non-negative
+# Build once with construct_via_Graph, then save/load the index to skip preprocessing entirely
+
+from heapq import *
+from array import array
+import pickle
+
+class ContractionHierarchy:
+
+    """
+    The index consists of two graphs over node ids, both in compressed sparse row form
+    1. up, edges from each node to neighbours contracted later (forward search from the source)
+    2. down, reversed edges from neighbours contracted later into each node (backward search from the target)
+    3. middles, a dictionary mapping u*n+v to the contracted node a shortcut u -> v bypasses, used to unpack paths
+
+    Node names are interned to contiguous integers, names[i] is the name of node i.
+    """
+
+    def __init__(self, names: list, upoffsets: array, uptargets: array, upweights: array, downoffsets: array, downtargets: array, downweights: array, middles: dict) -> None:
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.nodecount = len(names)
+        self.up = (upoffsets, uptargets, upweights)
+        self.down = (downoffsets, downtargets, downweights)
+        self.middles = middles
+        self.shortcutcount = len(middles)
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_Graph(graph, witnesslimit=500) -> 'ContractionHierarchy':
+        """
+        Builds the index from a UWGraph, DWGraph, CSRUWGraph or CSRDWGraph
+
+        Nodes are contracted lazily in order of twice the edge difference (shortcuts added minus edges removed), plus the number of contracted neighbours and the depth in the hierarchy
+        Before adding a shortcut u -> x around v, a witness search (dijkstra from u avoiding v) looks for a path at most as short
+        witnesslimit caps the nodes settled per witness search, a smaller limit is faster but may add unnecessary shortcuts
+        Self loops are dropped and only the lightest of parallel edges is kept
+        """
+        AdjacencyTable = graph.graph if hasattr(graph, "graph") else graph.to_adjacency_table()
+        names = list(AdjacencyTable)
+        index = {name: i for i, name in enumerate(names)}
+        n = len(names)
+        out = [{} for i in range(n)] # remaining graph, out[u][v] is the weight of edge u -> v
+        into = [{} for i in range(n)] # into[v][u] is the weight of edge u -> v
+        integral = True
+        for node in AdjacencyTable:
+            u = index[node]
+            for neighbour, weight in AdjacencyTable[node]:
+                v = index[neighbour]
+                if u != v and (v not in out[u] or weight < out[u][v]):
+                    out[u][v] = weight
+                    into[v][u] = weight
+                if not isinstance(weight, int):
+                    integral = False
+        middles = {}
+        up = [None]*n # edges to nodes contracted later, fixed once the node is contracted
+        down = [None]*n
+        deleted = [0]*n # contracted neighbours of every node
+        level = [0]*n # depth in the hierarchy, contracting in level order keeps the query search spaces shallow
+
+        def shortcuts(v: int) -> list: # shortcuts (u, x, weight) needed to contract v
+            needed = []
+            if not into[v] or not out[v]:
+                return needed
+            targets = out[v]
+            maxout = max(targets.values())
+            for u, w1 in into[v].items():
+                # dijkstra from u in the remaining graph without v, until every target is settled or the limit is reached
+                maxcost = w1 + maxout
+                dist = {u: 0}
+                heap = [(0, u)]
+                settled = 0
+                remaining = len(targets) - (u in targets) # targets not yet settled
+                while heap and remaining:
+                    d, a = heappop(heap)
+                    if d > dist[a]:
+                        continue
+                    if d > maxcost or settled == witnesslimit:
+                        break
+                    settled += 1
+                    if a in targets and a != u:
+                        remaining -= 1
+                    for b, w in out[a].items():
+                        if b != v and d + w < dist.get(b, maxcost + 1):
+                            dist[b] = d + w
+                            heappush(heap, (d + w, b))
+                for x, w2 in targets.items():
+                    if x != u and dist.get(x, maxcost + 1) > w1 + w2: # no witness, the path through v must be kept
+                        needed.append((u, x, w1 + w2))
+            return needed
+
+        heap = [(2*(len(shortcuts(v)) - len(into[v]) - len(out[v])), v) for v in range(n)]
+        heapify(heap)
+        while heap:
+            p, v = heappop(heap)
+            needed = shortcuts(v)
+            p = 2*(len(needed) - len(into[v]) - len(out[v])) + deleted[v] + level[v] # priorities go stale as neighbours are contracted, recompute lazily
+            if heap and p > heap[0][0]:
+                heappush(heap, (p, v))
+                continue
+            for u, x, weight in needed:
+                if x not in out[u] or weight < out[u][x]:
+                    out[u][x] = weight
+                    into[x][u] = weight
+                    middles[u*n + x] = v
+            up[v] = out[v]
+            down[v] = into[v]
+            for x in out[v]:
+                del into[x][v]
+                deleted[x] += 1
+                level[x] = max(level[x], level[v] + 1)
+            for u in into[v]:
+                del out[u][v]
+                deleted[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            out[v] = into[v] = None
+
+        typecode = 'q' if integral else 'd'
+        def to_csr(edges: list) -> tuple:
+            offsets = array('q', [0])
+            targets = array('i')
+            weights = array(typecode)
+            for u in range(n):
+                targets.extend(edges[u].keys())
+                weights.extend(edges[u].values())
+                offsets.append(len(targets))
+            return offsets, targets, weights
+        return ContractionHierarchy(names, *to_csr(up), *to_csr(down), middles)
+
+    # ==============================================================================
+
+    # QUERIES
+
+    def _search(self, s: int, t: int) -> tuple: # bidirectional upward dijkstra, returns (cost, meeting node, forward parents, backward parents)
+        best = float("inf")
+        meet = -1
+        dist = ({s: 0}, {t: 0})
+        parent = ({s: -1}, {t: -1})
+        heaps = ([(0, s)], [(0, t)])
+        graphs = (self.up, self.down)
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                if heap[0][0] >= best: # nothing cheaper can be found in this direction
+                    heap.clear()
+                    continue
+                cost, u = heappop(heap)
+                mine = dist[side]
+                if cost > mine[u]:
+                    continue
+                other = dist[1-side]
+                if u in other and cost + other[u] < best:
+                    best = cost + other[u]
+                    meet = u
+                offsets, targets, weights = graphs[side]
+                for j in range(offsets[u], offsets[u+1]):
+                    v = targets[j]
+                    newcost = cost + weights[j]
+                    if newcost < mine.get(v, best):
+                        mine[v] = newcost
+                        parent[side][v] = u
+                        heappush(heap, (newcost, v))
+        return best, meet, parent[0], parent[1]
+
+    def _unpack(self, u: int, x: int, path: list) -> None: # appends the original nodes of edge u -> x after u, up to x
+        n = self.nodecount
+        stack = [(u, x)]
+        while stack:
+            a, b = stack.pop()
+            middle = self.middles.get(a*n + b)
+            if middle is None:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def distance(self, srcNode, dstNode):
+        """
+        Returns the minimum cost from srcNode to dstNode, or float("inf") if dstNode is unreachable
+        """
+        return self._search(self.index[srcNode], self.index[dstNode])[0]
+
+    def shortest_path(self, srcNode, dstNode):
+        """
+        Returns (cost, path) where path is the list of nodes from srcNode to dstNode, or None if dstNode is unreachable
+        Shortcuts on the path found by the search are unpacked back into the original edges
+        """
+        s = self.index[srcNode]
+        t = self.index[dstNode]
+        best, meet, forward, backward = self._search(s, t)
+        if meet == -1:
+            return None
+        hubs = [meet] # search path s -> meet -> t over the hierarchy
+        while forward[hubs[-1]] != -1:
+            hubs.append(forward[hubs[-1]])
+        hubs.reverse()
+        while backward[hubs[-1]] != -1:
+            hubs.append(backward[hubs[-1]])
+        path = [s]
+        for i in range(len(hubs)-1):
+            self._unpack(hubs[i], hubs[i+1], path)
+        return best, [self.names[i] for i in path]
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the index to a file, so that later runs can skip the preprocessing
+        """
+        state = (self.names, self.up, self.down, array('q', self.middles.keys()), array('i', self.middles.values()))
+        with open(path, "wb") as file:
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(path) -> 'ContractionHierarchy':
+        """
+        Reads an index written by save
+        Only load files from trusted sources, the file is unpickled
+        """
+        with open(path, "rb") as file:
+            names, up, down, keys, values = pickle.load(file)
+        return ContractionHierarchy(names, *up, *down, dict(zip(keys, values)))
+
+
+# from Undirected.Weighted import UWGraph
+
+# mygraph = UWGraph.construct_via_EdgeList([("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 5), ("C", "D", 8), ("D", "E", 3)])
+# ch = ContractionHierarchy.construct_via_Graph(mygraph)
+# print(ch.shortest_path("A", "E")) # (11, ['A', 'C', 'B', 'D', 'E'])
+# print(ch.distance("E", "A")) # 11
+# ch.save("roads.ch")
+# print(ContractionHierarchy.load("roads.ch").shortest_path("A", "D")) # (8, ['A', 'C', 'B', 'D'])
@@ -1,215 +1,1343 @@
-from copy import deepcopy
-from collections import defaultdict
-
-class DUGraph: # directed unweighted simple graph
-    
-    """
-    Graph Representations
-    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours
-    2. Adjacency matrix, a 2D list where matrix[a][b] represents if there is an edge from a to b
-    3. Edge list, an unordered list of edges in the form [a, b] representing an edge from a to b
-    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
-
-    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
-    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
-
-    The graph is directed, therefore edges are one-directional.
-    """
-
-    def __init__(self, AdjacencyTable) -> None:
-        self.graph = AdjacencyTable
-        self.nodecount = len(AdjacencyTable)
-
-    # CONSTRUCTORS
-
-    # ==============================================================================
-
-    def construct_via_AdjacencyList(AdjacencyList) -> 'DUGraph':
-        """
-        Format:
-        [[node1, node2, node3], [node2, node4], ...]
-        where inner lists contain neighbours
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
-        """
-        AdjacencyTable = {}
-        for i in range(len(AdjacencyList)):
-            AdjacencyTable[i] = set(AdjacencyList[i])
-        return DUGraph(AdjacencyTable)
-
-    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'DUGraph':
-        """
-        Format:
-        [
-            [1, 0, 1], 
-            [1, 1, 0], 
-            ...
-        ]
-        where matrix[a][b] contains 1 if there is an edge from a to b and 0 if there is no edge between them
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
-        """
-        l = len(AdjacencyMatrix)
-        AdjacencyTable = {}
-        all_nodes = {i for i in range(l)}
-        included_nodes = set()
-        for i in range(l):
-            AdjacencyTable[i] = set(j for j in range(l) if AdjacencyMatrix[i][j] != 0)
-            included_nodes.add(i)
-        for node in all_nodes: # make empty entries for nodes with an out degree of 0
-            if node not in included_nodes:
-                AdjacencyTable[node] = set()
-        return DUGraph(AdjacencyTable)
-
-    def construct_via_EdgeList(EdgeList) -> 'DUGraph':
-        """
-        Format:
-        [[node1, node2], [node2, node3] ...]
-        where inner lists contain edges between two nodes
-
-        Note that node names are supported by this method.
-        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
-        """
-        AdjacencyTable = {}
-        all_nodes = set()
-        included_nodes = set()
-        for node1, node2 in EdgeList:
-            all_nodes.add(node1)
-            all_nodes.add(node2)
-        for edge in EdgeList:
-            srcNode, dstNode = edge
-            if srcNode in AdjacencyTable:
-                AdjacencyTable[srcNode].add(dstNode)
-            else:
-                AdjacencyTable[srcNode] = {dstNode}
-            included_nodes.add(srcNode)
-        for node in all_nodes: # make empty entries for nodes with an out degree of 0
-            if node not in included_nodes:
-                AdjacencyTable[node] = set()
-        return DUGraph(AdjacencyTable)
-
-    def construct_via_AdjacencyTable(AdjacencyTable) -> 'DUGraph':
-        """
-        Format:
-        {node0: {node1, node2, node3}, node1: {node2, node4}, ...}
-        where inner lists contain neighbours
-
-        Note that node names are supported by this method.
-        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
-        """
-        return DUGraph(AdjacencyTable)
-
-    # ==============================================================================
-
-    # CONVERTERS
-
-    def convert_to_bidirectional(self) -> 'DUGraph': # returns a new graph
-        """
-        Necessary for bipartite property check.
-        Every edge becomes bi-directional after conversion.
-        Runs in O(VE) time.
-        """
-        newgraph = deepcopy(self.graph)
-        for node in newgraph:
-            for neighbour in newgraph[node]:
-                newgraph[neighbour].add(node)
-        return DUGraph.construct_via_AdjacencyTable(newgraph)
-    
-    # ==============================================================================
-
-    # TRAVERSALS
-
-    def dfs(self, srcNode): # depth first search from srcNode
-        order = []
-        stack = [srcNode]
-        visited = set()
-        while stack:
-            current_node = stack.pop()
-            if current_node in visited:
-                continue
-            visited.add(current_node)
-            order.append(current_node)
-            for neighbour in self.graph[current_node]:
-                stack.append(neighbour)
-        return order
-    
-    def bfs(self, srcNode): # breadth first search from srcNode
-        order = []
-        queue = [srcNode]
-        visited = set()
-        while queue:
-            current_node = queue.pop()            
-            if current_node in visited:
-                continue
-            visited.add(current_node)
-            order.append(current_node)
-            for neighbour in self.graph[current_node]:
-                queue.insert(0, neighbour)
-        return order
-    
-    # ==============================================================================
-
-    # TOPOLOGICAL SORT
-
-    def _topological_sort(self, node, visited: dict, stack: list):
-        visited[node] = True
-        for neighbour in self.graph[node]:
-            if visited[neighbour] == False:
-                self._topological_sort(neighbour, visited, stack)
-        stack.append(node)
-
-    def topological_sort(self):
-        visited = defaultdict(lambda: False)
-        stack = []
-        for node in self.graph:
-            if visited[node] == False:
-                self._topological_sort(node, visited, stack)
-        return stack[::-1]
-    
-    # ==============================================================================
-
-    # PROPERTY CHECKS
-
-    def is_bipartite(self) -> bool:
-        """
-        Detects cycles of odd length using dfs
-        Each node is assigned a depth upon exploration
-        When a visited node is encountered, compare its depth with that of the source node
-        If the difference is even, then the graph is not bipartite
-
-        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
-        Runs in O(V+E) time 
-        """
-        srcNode = tuple(self.graph.keys())[0] # any starting node would work
-        visited = dict() # node: depth
-        stack = [(srcNode, 0)]
-        while stack:
-            current_node, depth = stack.pop()
-            visited[current_node] = depth
-            for neighbour in self.graph[current_node]:
-                if neighbour in visited:
-                    diff = depth - visited[neighbour]
-                    if not diff % 2:
-                        return False
-                else:
-                    stack.append((neighbour, depth+1))
-        return True
-
-
-
-# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "B"), ("C", "D")])
-# print(mygraph.dfs("A"))
-# print(mygraph.bfs("A"))
-# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
-
-# mygraph = DUGraph.construct_via_AdjacencyList([(1, 2), (2,), (3, 4), {}, {}])
-# print(mygraph.dfs(0))
-# print(mygraph.bfs(0))
-# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
-
-# mygraph = DUGraph.construct_via_EdgeList([(4, 1), (4, 5), (1, 2), (5, 2), (2, 3), (5, 3), (3, 6)])
-# print(mygraph.topological_sort())
\ No newline at end of file
+from heapq import *
+from collections import deque
+from array import array
+from struct import Struct
+from mmap import mmap, ACCESS_READ
+from sys import byteorder
+import pickle
+
+_SNAPSHOT_HEADER = Struct("<4sBcBcqqq") # magic, version, byte order, name encoding, weight typecode, nodes, arcs, name table size
+
+def _multi_source_bfs(nodecount: int, offsets, targets, sources: list) -> list:
+    """
+    Bit-parallel bfs (MS-BFS) from every node id in sources at once, the edges of node i are targets[offsets[i]:offsets[i+1]]
+    Every node carries a bitmask of the searches that reached it, bit k standing for sources[k], so a single scan of an edge
+    advances all searches whose frontiers share that node, Python ints make the masks as wide as needed
+    Returns one array per source holding the number of edges from it to every node, -1 if unreachable
+    """
+    distances = [array('i', [-1]) * nodecount for k in range(len(sources))]
+    seen = [0] * nodecount
+    frontier = {} # node id: searches that reached it in the last level
+    for k, s in enumerate(sources):
+        seen[s] |= 1 << k
+        frontier[s] = frontier.get(s, 0) | 1 << k
+        distances[k][s] = 0
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = {}
+        for u, mask in frontier.items():
+            for v in targets[offsets[u]:offsets[u+1]]:
+                new = mask & ~seen[v]
+                if new:
+                    seen[v] |= new
+                    next_frontier[v] = next_frontier.get(v, 0) | new
+                    while new: # record the depth for every search that reached v just now
+                        bit = new & -new
+                        distances[bit.bit_length() - 1][v] = depth
+                        new ^= bit
+        frontier = next_frontier
+    return distances
+
+class DUGraph: # directed unweighted simple graph
+    
+    """
+    Graph Representations
+    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours
+    2. Adjacency matrix, a 2D list where matrix[a][b] represents if there is an edge from a to b
+    3. Edge list, an unordered list of edges in the form [a, b] representing an edge from a to b
+    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
+
+    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
+    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
+
+    The graph is directed, therefore edges are one-directional.
+    """
+
+    def __init__(self, AdjacencyTable) -> None:
+        self.graph = AdjacencyTable
+        self.nodecount = len(AdjacencyTable)
+        self.edgecount = sum(len(AdjacencyTable[node]) for node in AdjacencyTable)
+        self.reversegraph = None # reverse adjacency table, built on first use by reverse_table and kept current by the mutators
+        self._reach = None # reachability index, see _reachability
+        self._frozen = None # (interned copy of the graph, node and edge counts when it was built), see _interned
+        self._work = 0 # nodes visited on self.graph since the last change, see _charge
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_AdjacencyList(AdjacencyList) -> 'DUGraph':
+        """
+        Format:
+        [[node1, node2, node3], [node2, node4], ...]
+        where inner lists contain neighbours
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
+        """
+        AdjacencyTable = {}
+        for i in range(len(AdjacencyList)):
+            AdjacencyTable[i] = set(AdjacencyList[i])
+        return DUGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'DUGraph':
+        """
+        Format:
+        [
+            [1, 0, 1], 
+            [1, 1, 0], 
+            ...
+        ]
+        where matrix[a][b] contains 1 if there is an edge from a to b and 0 if there is no edge between them
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
+        """
+        l = len(AdjacencyMatrix)
+        AdjacencyTable = {}
+        all_nodes = {i for i in range(l)}
+        included_nodes = set()
+        for i in range(l):
+            AdjacencyTable[i] = set(j for j in range(l) if AdjacencyMatrix[i][j] != 0)
+            included_nodes.add(i)
+        for node in all_nodes: # make empty entries for nodes with an out degree of 0
+            if node not in included_nodes:
+                AdjacencyTable[node] = set()
+        return DUGraph(AdjacencyTable)
+
+    def construct_via_EdgeList(EdgeList) -> 'DUGraph':
+        """
+        Format:
+        [[node1, node2], [node2, node3] ...]
+        where inner lists contain edges between two nodes
+
+        Note that node names are supported by this method.
+        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once.
+        """
+        AdjacencyTable = {}
+        for edge in EdgeList:
+            srcNode, dstNode = edge
+            if srcNode in AdjacencyTable:
+                AdjacencyTable[srcNode].add(dstNode)
+            else:
+                AdjacencyTable[srcNode] = {dstNode}
+            if dstNode not in AdjacencyTable: # make empty entries for nodes with an out degree of 0
+                AdjacencyTable[dstNode] = set()
+        return DUGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyTable(AdjacencyTable) -> 'DUGraph':
+        """
+        Format:
+        {node0: {node1, node2, node3}, node1: {node2, node4}, ...}
+        where inner lists contain neighbours
+
+        Note that node names are supported by this method.
+        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
+        """
+        return DUGraph(AdjacencyTable)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def convert_to_bidirectional(self) -> 'DUGraph': # returns a new graph
+        """
+        Necessary for bipartite property check.
+        Every edge becomes bi-directional after conversion.
+        Runs in O(V+E) time.
+        """
+        newgraph = {node: set(self.graph[node]) for node in self.graph} # node names are immutable, so copying the sets is enough
+        for node in self.graph:
+            for neighbour in self.graph[node]:
+                newgraph[neighbour].add(node)
+        return DUGraph.construct_via_AdjacencyTable(newgraph)
+
+    def to_csr(self) -> 'CSRDUGraph': # returns a new frozen graph
+        """
+        Converts the adjacency table into compressed sparse row storage, see CSRDUGraph.
+        Runs in O(V+E) time.
+        """
+        return CSRDUGraph._construct_via_Arcs(self.graph)
+
+    def reverse_table(self) -> dict:
+        """
+        Returns the adjacency table with every edge reversed, i.e. {node: {predecessor, ...}}
+        Built once in O(V+E) time on first call and cached in self.reversegraph, the mutators keep it up to date afterwards
+        NOTE: Call clear_cache after modifying self.graph directly instead of through the mutators
+        """
+        if self.reversegraph is None:
+            reversegraph = {node: set() for node in self.graph}
+            for node in self.graph:
+                for neighbour in self.graph[node]:
+                    if neighbour in reversegraph:
+                        reversegraph[neighbour].add(node)
+                    else:
+                        reversegraph[neighbour] = {node}
+            self.reversegraph = reversegraph
+        return self.reversegraph
+    
+    # ==============================================================================
+
+    # MUTATORS
+
+    def add_node(self, node) -> None:
+        """
+        Adds a node without any edges, does nothing if the node already exists
+        """
+        if node not in self.graph:
+            self.graph[node] = set()
+            self.nodecount += 1
+            self._reach = self._frozen = None
+            self._work = 0
+            if self.reversegraph is not None:
+                self.reversegraph[node] = set()
+
+    def add_edge(self, srcNode, dstNode) -> None:
+        """
+        Adds an edge from srcNode to dstNode, missing nodes are created
+        Does nothing if the edge already exists
+        Runs in O(1) time
+        """
+        self.add_node(srcNode)
+        self.add_node(dstNode)
+        if dstNode not in self.graph[srcNode]:
+            self.graph[srcNode].add(dstNode)
+            self.edgecount += 1
+            self._reach = self._frozen = None
+            self._work = 0
+            if self.reversegraph is not None:
+                self.reversegraph[dstNode].add(srcNode)
+
+    def remove_edge(self, srcNode, dstNode) -> None:
+        """
+        Removes the edge from srcNode to dstNode
+        Raises KeyError if there is no such edge
+        Runs in O(1) time
+        """
+        self.graph[srcNode].remove(dstNode)
+        if self.reversegraph is not None:
+            self.reversegraph[dstNode].remove(srcNode)
+        self.edgecount -= 1
+        self._reach = self._frozen = None
+        self._work = 0
+
+    def remove_node(self, node) -> None:
+        """
+        Removes a node together with all edges into and out of it
+        Raises KeyError if there is no such node
+        Runs in O(in degree + out degree) time, building the reverse table first if necessary
+        """
+        reversegraph = self.reverse_table()
+        for neighbour in self.graph[node]:
+            reversegraph[neighbour].discard(node) # also clears self-loops from reversegraph[node]
+        for predecessor in reversegraph[node]:
+            self.graph[predecessor].discard(node)
+        self.edgecount -= len(self.graph[node]) + len(reversegraph[node])
+        del self.graph[node]
+        del reversegraph[node]
+        self.nodecount -= 1
+        self._reach = self._frozen = None
+        self._work = 0
+    
+    # ==============================================================================
+
+    # INTERNING
+
+    def _interned(self, build=False) -> 'CSRDUGraph':
+        """
+        Frozen copy of the graph with node names interned to dense ints, see CSRDUGraph
+        Whole graph algorithms run on it with list/array state instead of hashing node names at every edge, names are translated back only in their results
+        Returns None if there is no valid copy, unless build is True, in which case it is built in O(V+E) time
+        The copy is dropped by the mutators and by clear_cache, and is only used while the node and edge counts match those it was built with, an O(1) check,
+        so direct edits to self.graph that add or remove nodes are caught, call clear_cache after any other direct edit
+        Generators and searches that may stop early never use it, they read self.graph directly
+        """
+        if self._frozen is not None:
+            frozen, built = self._frozen
+            if built == (len(self.graph), self.edgecount):
+                return frozen
+            self._frozen = None # self.graph was edited directly
+        if not build:
+            return None
+        self._frozen = (self.to_csr(), (len(self.graph), self.edgecount))
+        self._work = 0
+        return self._frozen[0]
+
+    def _charge(self, work: int) -> None:
+        """
+        Records work nodes visited on self.graph by a search that could have run on the interned copy
+        The copy is built once the work since the last change reaches the number of nodes, so a single search after a change
+        never pays for interning, while repeated searches of an unchanged graph move to the copy after at most twice their cost
+        """
+        self._work += work
+        if self._work >= len(self.graph):
+            self._interned(build=True)
+
+    def clear_cache(self) -> None:
+        """
+        Drops everything derived from the graph: the interned copy, the reachability index and the reverse table
+        Call it after editing self.graph directly instead of through the mutators
+        """
+        self._reach = self._frozen = self.reversegraph = None
+        self._work = 0
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    # whole graph searches run on the interned copy once it exists, see _interned
+
+    def dfs(self, srcNode): # depth first search from srcNode
+        frozen = self._interned()
+        if frozen is not None:
+            return frozen.dfs(srcNode)
+        order = []
+        stack = [srcNode]
+        visited = set()
+        while stack:
+            current_node = stack.pop()
+            if current_node in visited:
+                continue
+            visited.add(current_node)
+            order.append(current_node)
+            for neighbour in self.graph[current_node]:
+                stack.append(neighbour)
+        self._charge(len(order))
+        return order
+
+    def bfs(self, srcNode): # breadth first search from srcNode
+        frozen = self._interned()
+        if frozen is not None:
+            return frozen.bfs(srcNode)
+        order = [srcNode] # nodes are marked on discovery, so the list doubles as the queue
+        visited = {srcNode}
+        for current_node in order:
+            for neighbour in self.graph[current_node]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    order.append(neighbour)
+        self._charge(len(order))
+        return order
+
+    def iter_dfs(self, srcNode):
+        """
+        Generator version of dfs, yields the nodes in the same order as they are visited
+        Stopping early skips the rest of the search, the visiting order is never stored
+        """
+        stack = [srcNode]
+        visited = set()
+        while stack:
+            current_node = stack.pop()
+            if current_node in visited:
+                continue
+            visited.add(current_node)
+            yield current_node
+            stack.extend(self.graph[current_node])
+
+    def iter_bfs(self, srcNode):
+        """
+        Generator version of bfs, yields (node, depth) in the same order as bfs, depth being the number of edges from srcNode
+        Nodes are yielded as soon as they are discovered, only the current and next levels are held besides the visited set
+        """
+        visited = {srcNode}
+        frontier = [srcNode]
+        depth = 0
+        yield srcNode, depth
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current_node in frontier:
+                for neighbour in self.graph[current_node]:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_frontier.append(neighbour)
+                        yield neighbour, depth
+            frontier = next_frontier
+
+    def multi_source_bfs(self, sources) -> tuple:
+        """
+        Returns (names, distances) where distances[k][i] is the number of edges on a shortest path from sources[k] to names[i], -1 if unreachable
+        Bit-parallel bfs, all sources share one traversal instead of running bfs once per source, see _multi_source_bfs
+        Suited to landmark distances or closeness centrality, best with up to a few hundred sources per call
+        """
+        names, distances = self._interned(build=True).multi_source_bfs(sources)
+        return list(names), distances # a copy, the interned names are shared
+
+    def bfs_tree(self, srcNode, alpha=14, beta=24): # direction-optimizing breadth first search from srcNode
+        """
+        Returns a tuple (distances, parents) of dictionaries covering every node reachable from srcNode, parents[srcNode] is None
+        The search is level-synchronous, every step expands the whole frontier either
+        top-down, where frontier nodes scan their edges for unvisited nodes, or
+        bottom-up, where unvisited nodes scan their incoming edges for a parent in the frontier and stop at the first one found
+        Switches to bottom-up once the frontier's edges outnumber 1/alpha of the edges of unvisited nodes,
+        and back to top-down once the frontier holds fewer than 1/beta of all nodes
+        Runs in O(V+E) time per top-down pass, bottom-up steps pay off on large frontiers of low-diameter graphs
+        """
+        return self._interned(build=True).bfs_tree(srcNode, alpha, beta)
+
+    # ==============================================================================
+
+    # TOPOLOGICAL SORT
+
+    def _in_degrees(self) -> tuple: # interns node names, returns (names, adjacency lists of ids, in-degree of every id)
+        names = list(self.graph)
+        index = {node: i for i, node in enumerate(names)}
+        adjacency = [[] for i in range(len(names))]
+        indegree = [0] * len(names)
+        for node in self.graph:
+            edges = adjacency[index[node]]
+            for neighbour in self.graph[node]:
+                v = index.get(neighbour)
+                if v is None: # neighbour without an entry of its own
+                    v = index[neighbour] = len(names)
+                    names.append(neighbour)
+                    adjacency.append([])
+                    indegree.append(0)
+                edges.append(v)
+                indegree[v] += 1
+        return names, adjacency, indegree
+
+    def _kahn(self) -> tuple: # kahn's algorithm, returns (names, adjacency, indegree, order)
+        names, adjacency, indegree = self._in_degrees()
+        order = [u for u in range(len(names)) if not indegree[u]]
+        for u in order: # order grows while it is being iterated, acting as the queue
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    order.append(v)
+        return names, adjacency, indegree, order
+
+    def _cycle(self, names: list, adjacency: list, indegree: list) -> list:
+        """
+        Nodes left with a positive in-degree after kahn's algorithm all have a predecessor that was also left
+        Following those predecessors must eventually repeat a node, which closes a cycle
+        """
+        predecessor = {}
+        for u in range(len(names)):
+            if indegree[u]:
+                for v in adjacency[u]:
+                    if indegree[v]:
+                        predecessor[v] = u
+        u = next(iter(predecessor))
+        seen = set()
+        while u not in seen:
+            seen.add(u)
+            u = predecessor[u]
+        cycle = [u]
+        v = predecessor[u]
+        while v != u:
+            cycle.append(v)
+            v = predecessor[v]
+        return [names[v] for v in reversed(cycle)]
+
+    def topological_sort(self):
+        """
+        Kahn's algorithm, nodes are output once all of their predecessors have been output
+        Iterative, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree, order = self._kahn()
+        if len(order) < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return [names[u] for u in order]
+
+    def iter_topological_sort(self):
+        """
+        Generator version of topological_sort, yields the nodes in the same order
+        In-degrees are counted up front in O(V+E) time, every node is then yielded as soon as its last predecessor has been
+        Raises ValueError as topological_sort does, once every node outside the cycles has been yielded
+        """
+        names, adjacency, indegree = self._in_degrees()
+        queue = deque(u for u in range(len(names)) if not indegree[u])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            yield names[u]
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    queue.append(v)
+        if count < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+
+    def lexicographical_topological_sort(self):
+        """
+        Returns the lexicographically smallest topological order, node names must be comparable
+        Kahn's algorithm with a heap in place of the queue, runs in O(V log V + E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree = self._in_degrees()
+        heap = [(names[u], u) for u in range(len(names)) if not indegree[u]]
+        heapify(heap)
+        order = []
+        while heap:
+            name, u = heappop(heap)
+            order.append(name)
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    heappush(heap, (names[v], v))
+        if len(order) < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return order
+
+    def topological_layers(self):
+        """
+        Returns a list of layers, each layer is a list of nodes whose predecessors all lie in earlier layers
+        Nodes in the same layer do not depend on each other and can be processed in parallel
+        The number of layers is the number of nodes on the longest path, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree = self._in_degrees()
+        layer = [u for u in range(len(names)) if not indegree[u]]
+        layers = []
+        count = 0
+        while layer:
+            layers.append([names[u] for u in layer])
+            count += len(layer)
+            next_layer = []
+            for u in layer:
+                for v in adjacency[u]:
+                    indegree[v] -= 1
+                    if not indegree[v]:
+                        next_layer.append(v)
+            layer = next_layer
+        if count < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return layers
+
+    def find_cycle(self) -> list:
+        """
+        Returns the nodes of a directed cycle in edge order (the last node has an edge back to the first), or None if the graph is acyclic
+        Runs in O(V+E) time
+        """
+        names, adjacency, indegree, order = self._kahn()
+        if len(order) == len(names):
+            return None
+        return self._cycle(names, adjacency, indegree)
+    
+    # ==============================================================================
+
+    # STRONGLY CONNECTED COMPONENTS
+
+    def _tarjan(self) -> tuple: # iterative tarjan's algorithm, returns (components, component id of every node)
+        index = {} # node: discovery order
+        low = {} # node: lowest discovery order reachable through the dfs subtree and one back edge
+        stack = [] # visited nodes whose component is not yet complete
+        components = []
+        componentof = {} # node: component id
+        counter = 0
+        for root in self.graph:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [(root, iter(self.graph[root]))] # explicit dfs stack of (node, remaining neighbours)
+            while work:
+                current_node, neighbours = work[-1]
+                for neighbour in neighbours:
+                    if neighbour not in index: # descend into an unvisited neighbour, the iterator resumes later
+                        index[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        work.append((neighbour, iter(self.graph[neighbour])))
+                        break
+                    if neighbour not in componentof and index[neighbour] < low[current_node]: # neighbour is still on the stack
+                        low[current_node] = index[neighbour]
+                else: # every neighbour is done
+                    work.pop()
+                    if work and low[current_node] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[current_node]
+                    if low[current_node] == index[current_node]: # current_node is the root of a component
+                        component = []
+                        while True:
+                            node = stack.pop()
+                            componentof[node] = len(components)
+                            component.append(node)
+                            if node == current_node:
+                                break
+                        component.reverse()
+                        components.append(component)
+        return components, componentof
+
+    def strongly_connected_components(self) -> list:
+        """
+        Returns the strongly connected components as lists of nodes, using an iterative version of tarjan's algorithm
+        Components are in reverse topological order, i.e. no edge leads from a component to a later one
+        The index of a component in the list is its id, see condensation
+        Runs in O(V+E) time without recursion, so deep graphs do not hit the recursion limit
+        """
+        return self._tarjan()[0]
+
+    def condensation(self) -> 'DUGraph':
+        """
+        Returns the condensation DAG, where node i is component i of strongly_connected_components
+        Components are linked if any edge crosses between them
+        Since component ids are in reverse topological order, every edge goes from a higher id to a lower one
+        """
+        components, componentof = self._tarjan()
+        AdjacencyTable = {i: set() for i in range(len(components))}
+        for node in self.graph:
+            c = componentof[node]
+            for neighbour in self.graph[node]:
+                if componentof[neighbour] != c:
+                    AdjacencyTable[c].add(componentof[neighbour])
+        return DUGraph(AdjacencyTable)
+
+    # ==============================================================================
+
+    # REACHABILITY
+
+    def _reachability(self) -> tuple:
+        """
+        Returns (component id of every node, reachability bitset of every component), built on first use and dropped by the mutators
+        The bitsets are computed over the condensation, bit d of reach[c] is set if component c reaches component d
+        Components are numbered in reverse topological order, so every successor of a component is complete before it is visited
+        Each bitset is built as a big int (OR of the successors' bitsets) and stored as bytes for O(1) lookups
+        Runs in O(V+E) time plus O(V/64) word operations per edge of the condensation, and takes V*V/8 bytes
+        """
+        if self._reach is None:
+            components, componentof = self._tarjan()
+            size = (len(components) + 7) >> 3
+            bits = [0]*len(components)
+            reach = [None]*len(components)
+            for c, component in enumerate(components):
+                successors = {componentof[neighbour] for node in component for neighbour in self.graph[node]}
+                successors.discard(c)
+                current = 1 << c
+                for d in successors:
+                    current |= bits[d]
+                bits[c] = current
+                reach[c] = current.to_bytes(size, "little")
+            self._reach = (componentof, reach)
+        return self._reach
+
+    def can_reach(self, srcNode, dstNode) -> bool:
+        """
+        Checks if there is a path from srcNode to dstNode (every node reaches itself)
+        Runs in O(1) time once the index is built, see _reachability
+        """
+        componentof, reach = self._reachability()
+        c = componentof[srcNode]
+        d = componentof[dstNode]
+        return reach[c][d >> 3] >> (d & 7) & 1 == 1
+
+    def can_reach_many(self, pairs) -> list:
+        """
+        Answers can_reach for every (srcNode, dstNode) in pairs, returns a list of booleans in the same order
+        """
+        componentof, reach = self._reachability()
+        answers = []
+        for srcNode, dstNode in pairs:
+            d = componentof[dstNode]
+            answers.append(reach[componentof[srcNode]][d >> 3] >> (d & 7) & 1 == 1)
+        return answers
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Detects cycles of odd length using dfs
+        Each node is assigned a depth upon exploration
+        When a visited node is encountered, compare its depth with that of the source node
+        If the difference is even, then the graph is not bipartite
+
+        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
+        Runs in O(V+E) time 
+        """
+        srcNode = tuple(self.graph.keys())[0] # any starting node would work
+        visited = dict() # node: depth
+        stack = [(srcNode, 0)]
+        while stack:
+            current_node, depth = stack.pop()
+            visited[current_node] = depth
+            for neighbour in self.graph[current_node]:
+                if neighbour in visited:
+                    diff = depth - visited[neighbour]
+                    if not diff % 2:
+                        return False
+                else:
+                    stack.append((neighbour, depth+1))
+        return True
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, see CSRDUGraph.save
+        """
+        self.to_csr().save(path)
+
+    def load(path) -> 'DUGraph':
+        """
+        Reads a snapshot written by save (of either DUGraph or CSRDUGraph) back into an adjacency table
+        For the fastest startup, load the CSRDUGraph directly with CSRDUGraph.load, which memory-maps the file
+        Only load files from trusted sources, see CSRDUGraph.load
+        """
+        return DUGraph(CSRDUGraph.load(path, use_mmap=False).to_adjacency_table())
+
+
+class CSRDUGraph: # directed unweighted graph, frozen compressed sparse row storage
+
+    """
+    Compressed sparse row (CSR) representation of a directed unweighted graph
+    1. names, a list where names[i] is the original name of node i
+    2. index, a dictionary mapping each node name to its integer id
+    3. offsets, an array of length V+1 where the out-edges of node i occupy positions offsets[i] to offsets[i+1]-1
+    4. targets, an array of length E where targets[j] is the integer id of the destination of edge j
+
+    Node names are interned to contiguous integers once during construction.
+    Traversals run on integer ids with list/bytearray state, names are only translated back when returning results.
+    Costs 8 bytes per node and 4 bytes per edge (plus the name table), compared to 60+ bytes per edge for the adjacency table.
+
+    The graph is frozen, edges cannot be added or removed after construction.
+    Unlike DUGraph, parallel edges are kept as separate entries.
+    """
+
+    def __init__(self, names: list, offsets: array, targets: array) -> None:
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.nodecount = len(names)
+        self.edgecount = len(targets)
+        self.reversegraph = None # graph with every edge reversed, built on first use by reverse_csr
+        self._reach = None # reachability index, see _reachability
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_EdgeList(EdgeList) -> 'CSRDUGraph':
+        """
+        Format:
+        [[node1, node2], [node2, node3] ...]
+        where inner lists contain edges between two nodes
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once and never copied into tuples or sets.
+        Edges are bucketed into CSR order with a counting sort in O(V+E) time.
+        """
+        index = {}
+        names = []
+        srcs = array('i')
+        dsts = array('i')
+        for srcNode, dstNode in EdgeList:
+            u = index.get(srcNode)
+            if u is None:
+                u = index[srcNode] = len(names)
+                names.append(srcNode)
+            v = index.get(dstNode)
+            if v is None:
+                v = index[dstNode] = len(names)
+                names.append(dstNode)
+            srcs.append(u)
+            dsts.append(v)
+        return CSRDUGraph._construct_via_Arrays(names, srcs, dsts)
+
+    def _construct_via_Arrays(names: list, srcs: array, dsts: array) -> 'CSRDUGraph':
+        # counting sort of the edge arrays by source node
+        n = len(names)
+        m = len(srcs)
+        offsets = array('q', [0]) * (n+1)
+        for u in srcs:
+            offsets[u+1] += 1
+        for i in range(n):
+            offsets[i+1] += offsets[i]
+        position = offsets[:-1] # next free slot of every node
+        targets = array('i', [0]) * m
+        for j in range(m):
+            u = srcs[j]
+            p = position[u]
+            targets[p] = dsts[j]
+            position[u] = p + 1
+        return CSRDUGraph(names, offsets, targets)
+
+    def _construct_via_Arcs(AdjacencyTable) -> 'CSRDUGraph':
+        # every entry of the adjacency table becomes exactly one arc, nodes are numbered in table order
+        names = list(AdjacencyTable)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        for node in AdjacencyTable:
+            for neighbour in AdjacencyTable[node]:
+                v = index.get(neighbour)
+                if v is None: # neighbour without an entry of its own
+                    v = index[neighbour] = len(names)
+                    names.append(neighbour)
+                targets.append(v)
+            offsets.append(len(targets))
+        for i in range(len(offsets)-1, len(names)): # nodes that only appear as neighbours
+            offsets.append(len(targets))
+        return CSRDUGraph(names, offsets, targets)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def convert_to_bidirectional(self) -> 'CSRDUGraph': # returns a new graph
+        """
+        Necessary for bipartite property check.
+        Every edge becomes bi-directional after conversion.
+        Runs in O(V+E) time.
+        """
+        srcs, targets = self._sources(), array('i', self.targets)
+        return CSRDUGraph._construct_via_Arrays(self.names, srcs + targets, targets + srcs)
+
+    def reverse_csr(self) -> 'CSRDUGraph':
+        """
+        Returns the graph with every edge reversed, sharing the name table of this graph
+        Built once in O(V+E) time on first call and cached in self.reversegraph
+        """
+        if self.reversegraph is None:
+            self.reversegraph = CSRDUGraph._construct_via_Arrays(self.names, self.targets, self._sources())
+            self.reversegraph.index = self.index
+        return self.reversegraph
+
+    def _sources(self) -> array: # source node of every edge, in CSR order
+        offsets = self.offsets
+        srcs = array('i')
+        for u in range(self.nodecount):
+            srcs.extend(array('i', [u]) * (offsets[u+1] - offsets[u]))
+        return srcs
+
+    def to_adjacency_table(self) -> dict:
+        """
+        Returns the equivalent adjacency table, for use with DUGraph
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        return {names[u]: {names[targets[j]] for j in range(offsets[u], offsets[u+1])} for u in range(self.nodecount)}
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dfs(self, srcNode): # depth first search from srcNode
+        names, offsets, targets = self.names, self.offsets, self.targets
+        order = []
+        stack = [self.index[srcNode]]
+        visited = bytearray(self.nodecount)
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            order.append(names[u])
+            stack.extend(targets[offsets[u]:offsets[u+1]])
+        return order
+
+    def bfs(self, srcNode): # breadth first search from srcNode
+        names, offsets, targets = self.names, self.offsets, self.targets
+        src = self.index[srcNode]
+        queue = [src] # nodes are marked on discovery, so the list doubles as the visiting order
+        visited = bytearray(self.nodecount)
+        visited[src] = 1
+        for u in queue:
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                if not visited[v]:
+                    visited[v] = 1
+                    queue.append(v)
+        return [names[u] for u in queue]
+
+    def iter_dfs(self, srcNode):
+        """
+        Generator version of dfs, yields the nodes in the same order as they are visited
+        Stopping early skips the rest of the search, the visiting order is never stored
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        stack = [self.index[srcNode]]
+        visited = bytearray(self.nodecount)
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            yield names[u]
+            stack.extend(targets[offsets[u]:offsets[u+1]])
+
+    def iter_bfs(self, srcNode):
+        """
+        Generator version of bfs, yields (node, depth) in the same order as bfs, depth being the number of edges from srcNode
+        Nodes are yielded as soon as they are discovered, only the current and next levels are held besides the visited array
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        src = self.index[srcNode]
+        visited = bytearray(self.nodecount)
+        visited[src] = 1
+        frontier = [src]
+        depth = 0
+        yield srcNode, depth
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                for j in range(offsets[u], offsets[u+1]):
+                    v = targets[j]
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+                        yield names[v], depth
+            frontier = next_frontier
+
+    def multi_source_bfs(self, sources) -> tuple:
+        """
+        Returns (names, distances) where distances[k][i] is the number of edges on a shortest path from sources[k] to names[i], -1 if unreachable
+        Bit-parallel bfs, all sources share one traversal instead of running bfs once per source, see _multi_source_bfs
+        Suited to landmark distances or closeness centrality, best with up to a few hundred sources per call
+        """
+        distances = _multi_source_bfs(self.nodecount, self.offsets, self.targets, [self.index[node] for node in sources])
+        return self.names, distances
+
+    def bfs_tree(self, srcNode, alpha=14, beta=24): # direction-optimizing breadth first search from srcNode
+        """
+        Returns a tuple (distances, parents) of dictionaries covering every node reachable from srcNode, parents[srcNode] is None
+        The search is level-synchronous, every step expands the whole frontier either
+        top-down, where frontier nodes scan their edges for unvisited nodes, or
+        bottom-up, where unvisited nodes scan their incoming edges for a parent in the frontier and stop at the first one found
+        Switches to bottom-up once the frontier's edges outnumber 1/alpha of the edges of unvisited nodes,
+        and back to top-down once the frontier holds fewer than 1/beta of all nodes
+        Visited and frontier membership are bytearrays, distances and parents are integer arrays until the final translation
+        """
+        n = self.nodecount
+        offsets, targets = self.offsets, self.targets
+        reversegraph = self.reverse_csr()
+        in_offsets, in_targets = reversegraph.offsets, reversegraph.targets
+        src = self.index[srcNode]
+        distance = array('i', [-1]) * n
+        parent = array('i', [-1]) * n
+        visited = bytearray(n)
+        distance[src] = 0
+        visited[src] = 1
+        frontier = [src]
+        unvisited_edges = len(targets) - (offsets[src+1] - offsets[src])
+        bottom_up = False
+        depth = 0
+        while frontier:
+            depth += 1
+            frontier_edges = sum(offsets[u+1] - offsets[u] for u in frontier)
+            if not bottom_up and frontier_edges > unvisited_edges / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False
+            next_frontier = []
+            if bottom_up:
+                in_frontier = bytearray(n)
+                for u in frontier:
+                    in_frontier[u] = 1
+                for v in range(n):
+                    if not visited[v]:
+                        for j in range(in_offsets[v], in_offsets[v+1]):
+                            u = in_targets[j]
+                            if in_frontier[u]:
+                                visited[v] = 1
+                                parent[v] = u
+                                distance[v] = depth
+                                next_frontier.append(v)
+                                break
+            else:
+                for u in frontier:
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not visited[v]:
+                            visited[v] = 1
+                            parent[v] = u
+                            distance[v] = depth
+                            next_frontier.append(v)
+            unvisited_edges -= sum(offsets[v+1] - offsets[v] for v in next_frontier)
+            frontier = next_frontier
+        names = self.names
+        distances = {names[v]: distance[v] for v in range(n) if visited[v]}
+        parents = {names[v]: (names[parent[v]] if parent[v] != -1 else None) for v in range(n) if visited[v]}
+        return distances, parents
+
+    # ==============================================================================
+
+    # TOPOLOGICAL SORT
+
+    def _cycle(self, indegree: array) -> list:
+        """
+        Nodes left with a positive in-degree after kahn's algorithm all have a predecessor that was also left
+        Following those predecessors must eventually repeat a node, which closes a cycle
+        """
+        offsets, targets = self.offsets, self.targets
+        predecessor = {}
+        for u in range(self.nodecount):
+            if indegree[u]:
+                for j in range(offsets[u], offsets[u+1]):
+                    if indegree[targets[j]]:
+                        predecessor[targets[j]] = u
+        u = next(iter(predecessor))
+        seen = set()
+        while u not in seen:
+            seen.add(u)
+            u = predecessor[u]
+        cycle = [u]
+        v = predecessor[u]
+        while v != u:
+            cycle.append(v)
+            v = predecessor[v]
+        return [self.names[v] for v in reversed(cycle)]
+
+    def topological_sort(self):
+        """
+        Kahn's algorithm over an in-degree array, nodes are output once all of their predecessors have been output
+        Iterative, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        n = self.nodecount
+        offsets, targets = self.offsets, self.targets
+        indegree = array('i', [0]) * n
+        for v in targets:
+            indegree[v] += 1
+        order = [u for u in range(n) if not indegree[u]]
+        for u in order: # order grows while it is being iterated, acting as the queue
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                indegree[v] -= 1
+                if not indegree[v]:
+                    order.append(v)
+        if len(order) < n:
+            raise ValueError("graph contains a cycle", self._cycle(indegree))
+        names = self.names
+        return [names[u] for u in order]
+
+    def iter_topological_sort(self):
+        """
+        Generator version of topological_sort, yields the nodes in the same order
+        In-degrees are counted up front in O(V+E) time, every node is then yielded as soon as its last predecessor has been
+        Raises ValueError as topological_sort does, once every node outside the cycles has been yielded
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        indegree = array('i', [0]) * self.nodecount
+        for v in targets:
+            indegree[v] += 1
+        queue = deque(u for u in range(self.nodecount) if not indegree[u])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            yield names[u]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                indegree[v] -= 1
+                if not indegree[v]:
+                    queue.append(v)
+        if count < self.nodecount:
+            raise ValueError("graph contains a cycle", self._cycle(indegree))
+
+    # ==============================================================================
+
+    # STRONGLY CONNECTED COMPONENTS
+
+    def _tarjan(self) -> tuple: # iterative tarjan's algorithm on node ids, returns (number of components, component id of every node)
+        offsets, targets = self.offsets, self.targets
+        index = [-1] * self.nodecount # discovery order
+        low = [0] * self.nodecount # lowest discovery order reachable through the dfs subtree and one back edge
+        componentof = array('i', [-1]) * self.nodecount
+        stack = [] # visited nodes whose component is not yet complete
+        count = 0
+        counter = 0
+        for root in range(self.nodecount):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [root] # explicit dfs stack
+            position = [offsets[root]] # next edge to scan for every node in work
+            while work:
+                u = work[-1]
+                j = position[-1]
+                end = offsets[u+1]
+                while j < end:
+                    v = targets[j]
+                    j += 1
+                    if index[v] == -1: # descend into an unvisited neighbour, u resumes from edge j later
+                        position[-1] = j
+                        index[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        work.append(v)
+                        position.append(offsets[v])
+                        break
+                    if componentof[v] == -1 and index[v] < low[u]: # v is still on the stack
+                        low[u] = index[v]
+                else: # every edge of u is done
+                    work.pop()
+                    position.pop()
+                    if work and low[u] < low[work[-1]]:
+                        low[work[-1]] = low[u]
+                    if low[u] == index[u]: # u is the root of a component
+                        while True:
+                            v = stack.pop()
+                            componentof[v] = count
+                            if v == u:
+                                break
+                        count += 1
+        return count, componentof
+
+    def strongly_connected_components(self) -> list:
+        """
+        Returns the strongly connected components as lists of nodes, using an iterative version of tarjan's algorithm
+        Components are in reverse topological order, i.e. no edge leads from a component to a later one
+        The index of a component in the list is its id, see condensation
+        Runs in O(V+E) time without recursion
+        """
+        count, componentof = self._tarjan()
+        components = [[] for i in range(count)]
+        for u in range(self.nodecount):
+            components[componentof[u]].append(self.names[u])
+        return components
+
+    def condensation(self) -> 'CSRDUGraph':
+        """
+        Returns the condensation DAG, where node i is component i of strongly_connected_components
+        Components are linked if any edge crosses between them
+        Since component ids are in reverse topological order, every edge goes from a higher id to a lower one
+        """
+        count, componentof = self._tarjan()
+        offsets, targets = self.offsets, self.targets
+        links = set() # c*count+d
+        for u in range(self.nodecount):
+            c = componentof[u]
+            for j in range(offsets[u], offsets[u+1]):
+                d = componentof[targets[j]]
+                if c != d:
+                    links.add(c*count + d)
+        srcs = array('i', [key // count for key in links])
+        dsts = array('i', [key % count for key in links])
+        return CSRDUGraph._construct_via_Arrays(list(range(count)), srcs, dsts)
+
+    # ==============================================================================
+
+    # REACHABILITY
+
+    def _reachability(self) -> tuple:
+        """
+        Returns (component id of every node id, reachability bitset of every component), built on first use
+        The bitsets are computed over the condensation, bit d of reach[c] is set if component c reaches component d
+        Components are numbered in reverse topological order, so every successor of a component is complete before it is visited
+        Each bitset is built as a big int (OR of the successors' bitsets) and stored as bytes for O(1) lookups
+        Runs in O(V+E) time plus O(V/64) word operations per edge of the condensation, and takes V*V/8 bytes
+        """
+        if self._reach is None:
+            count, componentof = self._tarjan()
+            offsets, targets = self.offsets, self.targets
+            successors = [set() for i in range(count)]
+            for u in range(self.nodecount):
+                c = componentof[u]
+                for j in range(offsets[u], offsets[u+1]):
+                    successors[c].add(componentof[targets[j]])
+            size = (count + 7) >> 3
+            bits = [0]*count
+            reach = [None]*count
+            for c in range(count):
+                successors[c].discard(c)
+                current = 1 << c
+                for d in successors[c]:
+                    current |= bits[d]
+                bits[c] = current
+                reach[c] = current.to_bytes(size, "little")
+            self._reach = (componentof, reach)
+        return self._reach
+
+    def can_reach(self, srcNode, dstNode) -> bool:
+        """
+        Checks if there is a path from srcNode to dstNode (every node reaches itself)
+        Runs in O(1) time once the index is built, see _reachability
+        """
+        componentof, reach = self._reachability()
+        c = componentof[self.index[srcNode]]
+        d = componentof[self.index[dstNode]]
+        return reach[c][d >> 3] >> (d & 7) & 1 == 1
+
+    def can_reach_many(self, pairs) -> list:
+        """
+        Answers can_reach for every (srcNode, dstNode) in pairs, returns a list of booleans in the same order
+        """
+        componentof, reach = self._reachability()
+        answers = []
+        for srcNode, dstNode in pairs:
+            d = componentof[self.index[dstNode]]
+            answers.append(reach[componentof[self.index[srcNode]]][d >> 3] >> (d & 7) & 1 == 1)
+        return answers
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Two-colours every component with bfs, fails when an edge joins two nodes of the same colour
+
+        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
+        Runs in O(V+E) time
+        """
+        offsets, targets = self.offsets, self.targets
+        colour = bytearray(self.nodecount) # 0 = unvisited, 1 or 2 otherwise
+        for root in range(self.nodecount):
+            if colour[root]:
+                continue
+            colour[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for u in frontier:
+                    other = 3 - colour[u]
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not colour[v]:
+                            colour[v] = other
+                            next_frontier.append(v)
+                        elif colour[v] != other:
+                            return False
+                frontier = next_frontier
+        return True
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, which load can map straight back into memory
+        Layout: a 32 byte header, then offsets, targets, and the node name table, each section padded to 8 bytes
+        Integer names are stored as an int64 array, string names as utf-8 with an offset array, any other names are pickled
+        """
+        names = self.names
+        if all(type(name) is int and -(1<<63) <= name < (1<<63) for name in names):
+            namekind = 0
+            nametable = array('q', names).tobytes()
+        elif all(type(name) is str for name in names):
+            namekind = 1
+            encoded = [name.encode() for name in names]
+            nameoffsets = array('q', [0])
+            for name in encoded:
+                nameoffsets.append(nameoffsets[-1] + len(name))
+            nametable = nameoffsets.tobytes() + b"".join(encoded)
+        else:
+            namekind = 2
+            nametable = pickle.dumps(names, protocol=pickle.HIGHEST_PROTOCOL)
+        weightcode = b"-" # no weights
+        with open(path, "wb") as file:
+            file.write(_SNAPSHOT_HEADER.pack(b"CSRG", 1, byteorder[0].encode(), namekind, weightcode, self.nodecount, len(self.targets), len(nametable)))
+            for section in (self.offsets, self.targets):
+                size = len(section) * section.itemsize
+                file.write(section)
+                file.write(bytes(-size % 8))
+            file.write(nametable)
+
+    def load(path, use_mmap=True) -> 'CSRDUGraph':
+        """
+        Reads a snapshot written by save
+        With use_mmap the file is memory-mapped and offsets and targets are read-only views of the mapped pages,
+        so loading costs O(V) (rebuilding the name index) instead of O(V+E), and processes loading the same file share its pages
+        Without use_mmap, the sections are copied into regular arrays
+        Only load files from trusted sources, names other than ints and strings are unpickled
+        """
+        with open(path, "rb") as file:
+            magic, version, fileorder, namekind, weightcode, n, m, namesize = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+            if magic != b"CSRG" or version != 1:
+                raise ValueError(f"{path} is not a graph snapshot")
+            if fileorder.decode() != byteorder[0]: # written on a machine of the other endianness, so the views cannot be used directly
+                use_mmap = False
+            if use_mmap:
+                buffer = memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                file.seek(0)
+                buffer = memoryview(file.read())
+        position = _SNAPSHOT_HEADER.size
+        sections = []
+        for typecode, count in (('q', n+1), ('i', m)):
+            size = count * array(typecode).itemsize
+            section = buffer[position:position+size]
+            if use_mmap:
+                section = section.cast(typecode)
+            else:
+                section = array(typecode, section.tobytes())
+                if fileorder.decode() != byteorder[0]:
+                    section.byteswap()
+            sections.append(section)
+            position += size + (-size % 8)
+        nametable = buffer[position:position+namesize]
+        if namekind == 0:
+            names = array('q', nametable.tobytes())
+            if fileorder.decode() != byteorder[0]:
+                names.byteswap()
+            names = names.tolist()
+        elif namekind == 1:
+            nameoffsets = array('q', nametable[:8*(n+1)].tobytes())
+            if fileorder.decode() != byteorder[0]:
+                nameoffsets.byteswap()
+            blob = nametable[8*(n+1):].tobytes()
+            names = [blob[nameoffsets[i]:nameoffsets[i+1]].decode() for i in range(n)]
+        else:
+            names = pickle.loads(nametable)
+        return CSRDUGraph(names, *sections)
+
+
+# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "B"), ("C", "D")])
+# print(mygraph.dfs("A"))
+# print(mygraph.bfs("A"))
+# print(mygraph.bfs_tree("A")) # ({'A': 0, 'B': 1, 'C': 1, 'D': 2}, {'A': None, 'B': 'A', 'C': 'A', 'D': 'C'})
+# mygraph.add_edge("D", "E")
+# mygraph.remove_node("C")
+# print(mygraph.graph, mygraph.reverse_table(), mygraph.edgecount) # 2 edges remain, A -> B and D -> E
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
+
+# mygraph = DUGraph.construct_via_AdjacencyList([(1, 2), (2,), (3, 4), {}, {}])
+# print(mygraph.dfs(0))
+# print(mygraph.bfs(0))
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
+
+# mygraph = DUGraph.construct_via_EdgeList([(4, 1), (4, 5), (1, 2), (5, 2), (2, 3), (5, 3), (3, 6)])
+# print(mygraph.topological_sort())
+# print(mygraph.lexicographical_topological_sort()) # [4, 1, 5, 2, 3, 6]
+# print(mygraph.topological_layers()) # [[4], [1, 5], [2], [3], [6]]
+
+# mygraph = DUGraph.construct_via_EdgeList([(1, 2), (2, 3), (3, 1), (3, 4)])
+# print(mygraph.find_cycle()) # [1, 2, 3] or a rotation of it
+# print(mygraph.topological_sort()) # ValueError
+
+# mygraph = CSRDUGraph.construct_via_EdgeList([(4, 1), (4, 5), (1, 2), (5, 2), (2, 3), (5, 3), (3, 6)])
+# print(mygraph.dfs(4))
+# print(mygraph.bfs(4))
+# print(mygraph.topological_sort())
+
+
+# mygraph = CSRDUGraph.construct_via_EdgeList([(4, 1), (4, 5), (1, 2), (5, 2), (2, 3), (5, 3), (3, 6)])
+# mygraph.save("graph.bin")
+# print(CSRDUGraph.load("graph.bin").topological_sort())
+# print(DUGraph.load("graph.bin").graph) # snapshots load back into the dict based class as well
+
+# mygraph = DUGraph.construct_via_EdgeList([(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4), (6, 5)])
+# print(mygraph.strongly_connected_components()) # [[4, 5], [1, 2, 3], [6]], sinks first
+# print(mygraph.condensation().graph) # {0: set(), 1: {0}, 2: {0}}
+# print(mygraph.condensation().topological_sort()) # cycles collapsed, always succeeds
+
+# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("B", "C"), ("C", "B"), ("C", "D"), ("E", "D")])
+# print(mygraph.can_reach("A", "D"), mygraph.can_reach("D", "A")) # True False
+# print(mygraph.can_reach_many([("B", "C"), ("E", "A"), ("E", "E")])) # [True, False, True]
+
+# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "D"), ("D", "E")])
+# print(next(node for node, depth in mygraph.iter_bfs("A") if depth == 2)) # D, E is never discovered
+# for node in mygraph.iter_topological_sort(): # yields A as soon as the in-degrees are counted
+#     print(node)
+
+# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")])
+# names, distances = mygraph.multi_source_bfs(["A", "D"])
+# print(names, list(distances[0]), list(distances[1])) # ['A', 'B', 'C', 'D'] [0, 1, 2, 3] [-1, -1, -1, 0]
+
+# mygraph = DUGraph.construct_via_EdgeList([("A", "B"), ("B", "C")])
+# print(mygraph.bfs("A"), mygraph.dfs("B")) # ['A', 'B', 'C'] ['B', 'C'], bfs visits every node so the graph is interned and dfs runs on the copy
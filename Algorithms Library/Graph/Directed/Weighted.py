@@ -1,290 +1,2150 @@
-from copy import deepcopy
-from collections import defaultdict
-from heapq import *
-from collections import deque
-
-class DWGraph: # directed weighted simple graph
-    
-    """
-    Graph Representations
-    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours (and weight of the edge to that neighbour)
-    2. Adjacency matrix, a 2D list where matrix[a][b] represents the weight of the edge from a to b, if there is one
-    3. Edge list, an unordered list of edges in the form [a, b, w] representing an edge from a to b with weight w
-    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
-
-    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
-    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
-
-    The graph is directed, therefore edges are one-directional.
-    """
-
-    def __init__(self, AdjacencyTable) -> None:
-        self.graph = AdjacencyTable
-        self.nodecount = len(AdjacencyTable)
-
-    # CONSTRUCTORS
-
-    # ==============================================================================
-
-    def construct_via_AdjacencyList(AdjacencyList) -> 'DWGraph':
-        """
-        Format:
-        [[(node1, weight1), (node2, weight2), (node3, weight3)], [(node2, weight4)], ...]
-        where inner lists contain neighbours and the weight of the edge to that neighbour
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
-        """
-        l = len(AdjacencyList)
-        AdjacencyList = [[tuple(neighbour) for neighbour in AdjacencyList[i]] for i in range(l)] # auto-convert to tuple
-        AdjacencyTable = {}
-        for i in range(l):
-            AdjacencyTable[i] = set(AdjacencyList[i])            
-        return DWGraph(AdjacencyTable)
-
-    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'DWGraph':
-        """
-        Format:
-        [
-            [2, None, 5], 
-            [3, 1, None], 
-            ...
-        ]
-        where matrix[a][b] contains a numeric value representing the weight of the edge from a to b, or None if edge does not exist
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
-        """
-        l = len(AdjacencyMatrix)
-        AdjacencyTable = {}
-        all_nodes = {i for i in range(l)}
-        included_nodes = set()
-        for i in range(l):
-            AdjacencyTable[i] = set((j, AdjacencyMatrix[i][j]) for j in range(l) if AdjacencyMatrix[i][j] != None)
-            included_nodes.add(i)
-        for node in all_nodes: # make empty entries for nodes with an out degree of 0
-            if node not in included_nodes:
-                AdjacencyTable[node] = set()
-        return DWGraph(AdjacencyTable)
-
-    def construct_via_EdgeList(EdgeList) -> 'DWGraph':
-        """
-        Format:
-        [[node1, node2, weight1], [node2, node3, weight2] ...]
-        where inner lists contain edges between two nodes and the weight of the edge
-
-        Note that node names are supported by this method.
-        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
-        """
-        AdjacencyTable = {}
-        all_nodes = set()
-        included_nodes = set()
-        for node1, node2, weight in EdgeList:
-            all_nodes.add(node1)
-            all_nodes.add(node2)
-        for edge in EdgeList:
-            srcNode, dstNode, weight = edge
-            if srcNode in AdjacencyTable:
-                AdjacencyTable[srcNode].add((dstNode, weight))
-            else:
-                AdjacencyTable[srcNode] = {(dstNode, weight)}
-            included_nodes.add(srcNode)
-        for node in all_nodes: # make empty entries for nodes with an out degree of 0
-            if node not in included_nodes:
-                AdjacencyTable[node] = set()
-        return DWGraph(AdjacencyTable)
-
-    def construct_via_AdjacencyTable(AdjacencyTable) -> 'DWGraph':
-        """
-        Format:
-        {node0: {(node1, weight1), (node2, weight2), (node3, weight3)}, node1: {(node2, weight4)}, ...}
-        where inner lists contain neighbours and the weight of the edge to that neighbour
-
-        Note that node names are supported by this method.
-        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
-        """
-        return DWGraph(AdjacencyTable)
-
-    # ==============================================================================
-
-    # CONVERTERS
-
-    def convert_to_bidirectional(self, defaultweight=None) -> 'DWGraph': # returns a new graph
-        """
-        Necessary for bipartite property check.
-        Every edge becomes bi-directional after conversion, with duplicated weights.
-        Runs in O(VE) time.
-        Note that if two (or more) edges already exist between two nodes, duplicate edges will still be created.
-        """
-        newgraph = deepcopy(self.graph)
-        for node in newgraph:
-            for neighbour, weight in newgraph[node]:
-                if defaultweight:
-                    newgraph[neighbour].add((node, defaultweight))
-                else:
-                    newgraph[neighbour].add((node, weight))
-        return DWGraph.construct_via_AdjacencyTable(newgraph)
-    
-    # ==============================================================================
-
-    # TRAVERSALS
-
-    def dijkstras(self, srcNode): # dijkstra's algorithm
-        """
-        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
-        """
-        ordered_costs = {}
-        heap = [(0, srcNode)]
-        while heap:
-            cost, current_node = heappop(heap)
-            if current_node in ordered_costs:
-                continue
-            ordered_costs[current_node] = cost
-            for neighbour, newcost in self.graph[current_node]:
-                heappush(heap, (cost + newcost, neighbour))
-        return ordered_costs
-
-    def bellman_fords(self, srcNode): # belmann ford's algorithm, use this when edges have negative weights
-        """
-        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
-        """
-        ordered_costs = {node: float("inf") for node in self.graph}
-        ordered_costs[srcNode] = 0
-        for i in range(self.nodecount-1):
-            for node in self.graph:
-                if ordered_costs[node] != float("inf"):
-                    for neighbour, newcost in self.graph[node]:
-                        ordered_costs[neighbour] = min(ordered_costs[neighbour], ordered_costs[node] + newcost)
-        return ordered_costs
-
-    def find_path(self, srcNode, dstNode, artificial_weights: dict[dict] = None): # bfs
-        """
-        Path includes srcNode and dstNode
-        O(n) space complexity using dicationary backtracking to reconstruct path
-        Artificial weights are used by max flow function to avoid reconstructing graph
-        """
-        prev_node = {srcNode: None} # maps each node to the previous node for path construction
-        queue = deque([srcNode])
-        visited = set()
-        while queue:
-            node = queue.pop()
-            visited.add(node)
-            for neighbour, weight in self.graph[node]:
-                # only paths with positive capcities are considered
-                if artificial_weights and artificial_weights[node][neighbour] <= 0:
-                    continue
-                elif weight <= 0: 
-                    continue
-                # dstNode has been reached, a path has been found
-                if neighbour == dstNode: 
-                    path = [dstNode, node]
-                    pathnode = node
-                    while prev_node[pathnode]:
-                        pathnode = prev_node[pathnode]
-                        path.append(pathnode)
-                    return path[::-1]
-                # add neighbour to queue
-                if neighbour not in visited: 
-                    prev_node[neighbour] = node
-                    queue.appendleft(neighbour)
-        return None # no path has been found
-    
-    # ==============================================================================
-
-    # MAX FLOW & MIN CUT
-
-    def max_flow(self, source, sink) -> int: # ford-fulkerson algorithm
-        """
-        Returns the max flow / min cut of the current graph
-        Parameters source and sink are the source and sink of the graph
-        BFS is used to find a path from the sink to the node each time
-        NOTE: Does not work if there are two (or more) edges between two nodes in the graph
-        """
-        specialgraph = self.convert_to_bidirectional(defaultweight=0)
-        artificial_weights = {node: {edge[0]: edge[1] for edge in specialgraph.graph[node]} for node in specialgraph.graph}
-        total_flow = 0
-        while True:
-            # construct path from source to sink
-            path = specialgraph.find_path(source, sink, artificial_weights=artificial_weights)
-            if not path:
-                return total_flow
-            # find minimum capacity along the path
-            min_capacity = float("inf")
-            for i in range(len(path)-1):
-                min_capacity = min(min_capacity, artificial_weights[path[i]][path[i+1]])
-            # update capcities
-            for i in range(len(path)-1):
-                artificial_weights[path[i]][path[i+1]] -= min_capacity
-                artificial_weights[path[i+1]][path[i]] += min_capacity
-            # update total flow
-            total_flow += min_capacity
-    
-    # ==============================================================================
-
-    # TOPOLOGICAL SORT
-
-    def _topological_sort(self, node, visited: dict, stack: list):
-        visited[node] = True
-        for neighbour, weight in self.graph[node]:
-            if visited[neighbour] == False:
-                self._topological_sort(neighbour, visited, stack)
-        stack.append(node)
-
-    def topological_sort(self):
-        visited = defaultdict(lambda: False)
-        stack = []
-        for node in self.graph:
-            if visited[node] == False:
-                self._topological_sort(node, visited, stack)
-        return stack[::-1]
-    
-    # ==============================================================================
-
-    # PROPERTY CHECKS
-
-    def is_bipartite(self) -> bool:
-        """
-        Detects cycles of odd length using dfs
-        Each node is assigned a depth upon exploration
-        When a visited node is encountered, compare its depth with that of the source node
-        If the difference is even, then the graph is not bipartite
-
-        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
-        Runs in O(V+E) time 
-        """
-        srcNode = tuple(self.graph.keys())[0] # any starting node would work
-        visited = dict() # node: depth
-        stack = [(srcNode, 0)]
-        while stack:
-            current_node, depth = stack.pop()
-            visited[current_node] = depth
-            for neighbour, weight in self.graph[current_node]:
-                if neighbour in visited:
-                    diff = depth - visited[neighbour]
-                    if not diff % 2:
-                        return False
-                else:
-                    stack.append((neighbour, depth+1))
-        return True
-
-
-
-# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 3), ("A", "C", 1), ("C", "B", 4), ("C", "D", 1)])
-# print(mygraph.dijkstras("A"))
-# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
-
-# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 3), ("B", "C", 1), ("C", "A", 4), ("C", "D", 1)])
-# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
-
-# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "D", 1), ("A", "C", 10), ("C", "D", -10)])
-# print(mygraph.dijkstras("A"))
-# print(mygraph.bellman_fords("A"))
-# print(mygraph.convert_to_bidirectional().is_bipartite()) # True
-
-# mygraph = DWGraph.construct_via_EdgeList([(4, 1, 1), (4, 5, 2), (1, 2, 3), (5, 2, 5), (2, 3, 3), (5, 3, 4), (3, 6, 1)])
-# print(mygraph.topological_sort())
-
-# mygraph = DWGraph.construct_via_EdgeList([(1, 2, 5), (1, 4, 4), (4, 2, 3), (2, 3, 6), (4, 5, 1), (3, 5, 8), (3, 6, 5), (5, 6, 2)])
-# print(mygraph.max_flow(1, 6))
\ No newline at end of file
+from heapq import *
+from collections import deque, OrderedDict
+from array import array
+from struct import Struct
+from mmap import mmap, ACCESS_READ
+from sys import byteorder, getsizeof
+from os import cpu_count
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, get_all_start_methods
+import pickle
+
+try:
+    import numpy as np
+except ImportError: # floyd_warshall falls back to lists of lists
+    np = None
+
+_SNAPSHOT_HEADER = Struct("<4sBcBcqqq") # magic, version, byte order, name encoding, weight typecode, nodes, arcs, name table size
+
+def _check_float(weight) -> None: # raises ValueError if an int weight would be rounded in a float weight array
+    if type(weight) is int and not -2**53 <= weight <= 2**53:
+        try:
+            exact = float(weight) == weight
+        except OverflowError:
+            exact = False
+        if not exact:
+            raise ValueError("int weight cannot be stored exactly in a float weight array", weight)
+
+def _float_weights(*parts) -> array:
+    """
+    Concatenates weights into a float array, used once a weight does not fit the 64-bit integer array
+    Raises ValueError if an int weight would be rounded, floats only hold every int up to 2**53
+    """
+    weights = array('d')
+    for part in parts:
+        for weight in part:
+            if type(weight) is int:
+                _check_float(weight)
+        weights.extend(array('d', part))
+    return weights
+
+_shared_graph = None # graph of the current worker process, see many_source_dijkstras
+
+def _share_graph(graph) -> None: # worker initializer, with fork the graph is inherited rather than pickled
+    global _shared_graph
+    _shared_graph = graph
+
+def _dijkstras_chunk(sources: list) -> list:
+    return [(srcNode, _shared_graph.dijkstras(srcNode)) for srcNode in sources]
+
+class DWGraph: # directed weighted simple graph
+    
+    """
+    Graph Representations
+    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours (and weight of the edge to that neighbour)
+    2. Adjacency matrix, a 2D list where matrix[a][b] represents the weight of the edge from a to b, if there is one
+    3. Edge list, an unordered list of edges in the form [a, b, w] representing an edge from a to b with weight w
+    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
+
+    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
+    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
+
+    The graph is directed, therefore edges are one-directional.
+    """
+
+    def __init__(self, AdjacencyTable) -> None:
+        self.graph = AdjacencyTable
+        self.nodecount = len(AdjacencyTable)
+        self.edgecount = sum(len(AdjacencyTable[node]) for node in AdjacencyTable)
+        self.reversegraph = None # reverse adjacency table, built on first use by reverse_table and kept current by the mutators
+        self.version = 0 # bumped on every edge change, see enable_cache
+        self._cache = None
+        self._weightrange = None # see _weight_range
+        self._frozen = None # (interned copy of the graph, version, node count and edge count when it was built), see _interned
+        self._work = 0 # nodes settled on self.graph since the last change, see _charge
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_AdjacencyList(AdjacencyList) -> 'DWGraph':
+        """
+        Format:
+        [[(node1, weight1), (node2, weight2), (node3, weight3)], [(node2, weight4)], ...]
+        where inner lists contain neighbours and the weight of the edge to that neighbour
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
+        """
+        l = len(AdjacencyList)
+        AdjacencyList = [[tuple(neighbour) for neighbour in AdjacencyList[i]] for i in range(l)] # auto-convert to tuple
+        AdjacencyTable = {}
+        for i in range(l):
+            AdjacencyTable[i] = set(AdjacencyList[i])            
+        return DWGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'DWGraph':
+        """
+        Format:
+        [
+            [2, None, 5], 
+            [3, 1, None], 
+            ...
+        ]
+        where matrix[a][b] contains a numeric value representing the weight of the edge from a to b, or None if edge does not exist
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
+        """
+        l = len(AdjacencyMatrix)
+        AdjacencyTable = {}
+        all_nodes = {i for i in range(l)}
+        included_nodes = set()
+        for i in range(l):
+            AdjacencyTable[i] = set((j, AdjacencyMatrix[i][j]) for j in range(l) if AdjacencyMatrix[i][j] != None)
+            included_nodes.add(i)
+        for node in all_nodes: # make empty entries for nodes with an out degree of 0
+            if node not in included_nodes:
+                AdjacencyTable[node] = set()
+        return DWGraph(AdjacencyTable)
+
+    def construct_via_EdgeList(EdgeList) -> 'DWGraph':
+        """
+        Format:
+        [[node1, node2, weight1], [node2, node3, weight2] ...]
+        where inner lists contain edges between two nodes and the weight of the edge
+
+        Note that node names are supported by this method.
+        Nodes with an out degree of 0 are not represented in the adjacency list, therefore additional entries are required.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once.
+        """
+        AdjacencyTable = {}
+        for edge in EdgeList:
+            srcNode, dstNode, weight = edge
+            if srcNode in AdjacencyTable:
+                AdjacencyTable[srcNode].add((dstNode, weight))
+            else:
+                AdjacencyTable[srcNode] = {(dstNode, weight)}
+            if dstNode not in AdjacencyTable: # make empty entries for nodes with an out degree of 0
+                AdjacencyTable[dstNode] = set()
+        return DWGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyTable(AdjacencyTable) -> 'DWGraph':
+        """
+        Format:
+        {node0: {(node1, weight1), (node2, weight2), (node3, weight3)}, node1: {(node2, weight4)}, ...}
+        where inner lists contain neighbours and the weight of the edge to that neighbour
+
+        Note that node names are supported by this method.
+        Nodes with an out degree of 0 are represented in the adjacency list, therefore additional entries are not required.
+        """
+        return DWGraph(AdjacencyTable)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def convert_to_bidirectional(self, defaultweight=None) -> 'DWGraph': # returns a new graph
+        """
+        Necessary for bipartite property check.
+        Every edge becomes bi-directional after conversion, with duplicated weights.
+        Runs in O(V+E) time.
+        Note that if two (or more) edges already exist between two nodes, duplicate edges will still be created.
+        """
+        newgraph = {node: set(self.graph[node]) for node in self.graph} # edges are immutable tuples, so copying the sets is enough
+        for node in self.graph:
+            for neighbour, weight in self.graph[node]:
+                if defaultweight:
+                    newgraph[neighbour].add((node, defaultweight))
+                else:
+                    newgraph[neighbour].add((node, weight))
+        return DWGraph.construct_via_AdjacencyTable(newgraph)
+
+    def to_csr(self) -> 'CSRDWGraph': # returns a new frozen graph
+        """
+        Converts the adjacency table into compressed sparse row storage, see CSRDWGraph.
+        Runs in O(V+E) time.
+        """
+        return CSRDWGraph._construct_via_Arcs(self.graph)
+
+    def to_flow_network(self, capacity=None) -> 'FlowNetwork': # returns a new residual network
+        """
+        Every edge becomes an edge of the flow network with its weight as capacity.
+        If capacity is given, its weight becomes the cost per unit of flow instead and the capacity is taken from capacity,
+        either a number shared by every edge or a dictionary {(srcNode, dstNode): capacity} with an entry for every edge
+        Runs in O(V+E) time.
+        """
+        network = FlowNetwork()
+        percapacity = isinstance(capacity, dict)
+        for node in self.graph:
+            network._node_id(node)
+            for neighbour, weight in self.graph[node]:
+                if capacity is None:
+                    network.add_edge(node, neighbour, weight)
+                elif percapacity:
+                    network.add_edge(node, neighbour, capacity[(node, neighbour)], weight)
+                else:
+                    network.add_edge(node, neighbour, capacity, weight)
+        return network
+
+    def reverse_table(self) -> dict:
+        """
+        Returns the adjacency table with every edge reversed, i.e. {node: {(predecessor, weight), ...}}
+        Built once in O(V+E) time on first call and cached in self.reversegraph, the mutators keep it up to date afterwards
+        NOTE: Call clear_cache after modifying self.graph directly instead of through the mutators
+        """
+        if self.reversegraph is None:
+            reversegraph = {node: set() for node in self.graph}
+            for node in self.graph:
+                for neighbour, weight in self.graph[node]:
+                    if neighbour in reversegraph:
+                        reversegraph[neighbour].add((node, weight))
+                    else:
+                        reversegraph[neighbour] = {(node, weight)}
+            self.reversegraph = reversegraph
+        return self.reversegraph
+    
+    # ==============================================================================
+
+    # MUTATORS
+
+    def add_node(self, node) -> None:
+        """
+        Adds a node without any edges, does nothing if the node already exists
+        """
+        if node not in self.graph:
+            self.graph[node] = set()
+            self.nodecount += 1
+            self._frozen = None
+            self._work = 0
+            if self.reversegraph is not None:
+                self.reversegraph[node] = set()
+
+    def add_edge(self, srcNode, dstNode, weight) -> None:
+        """
+        Adds an edge from srcNode to dstNode with the given weight, missing nodes are created
+        Does nothing if the exact same edge already exists
+        Runs in O(1) time
+        """
+        self.add_node(srcNode)
+        self.add_node(dstNode)
+        if (dstNode, weight) not in self.graph[srcNode]:
+            self.graph[srcNode].add((dstNode, weight))
+            self.edgecount += 1
+            self._frozen = None
+            self._work = 0
+            self.version += 1
+            if self.reversegraph is not None:
+                self.reversegraph[dstNode].add((srcNode, weight))
+
+    def remove_edge(self, srcNode, dstNode, weight=None) -> None:
+        """
+        Removes the edge from srcNode to dstNode with the given weight, or every edge from srcNode to dstNode if weight is None
+        Raises KeyError if there is no such edge
+        Runs in O(1) time if weight is given, O(out degree of srcNode) otherwise
+        """
+        if weight is None:
+            edges = [edge for edge in self.graph[srcNode] if edge[0] == dstNode]
+        else:
+            edges = [(dstNode, weight)] if (dstNode, weight) in self.graph[srcNode] else []
+        if not edges:
+            raise KeyError((srcNode, dstNode))
+        for edge in edges:
+            self.graph[srcNode].remove(edge)
+            if self.reversegraph is not None:
+                self.reversegraph[dstNode].remove((srcNode, edge[1]))
+        self.edgecount -= len(edges)
+        self._frozen = None
+        self._work = 0
+        self.version += 1
+
+    def remove_node(self, node) -> None:
+        """
+        Removes a node together with all edges into and out of it
+        Raises KeyError if there is no such node
+        Runs in O(in degree + out degree) time, building the reverse table first if necessary
+        """
+        reversegraph = self.reverse_table()
+        for neighbour, weight in self.graph[node]:
+            reversegraph[neighbour].discard((node, weight)) # also clears self-loops from reversegraph[node]
+        for predecessor, weight in reversegraph[node]:
+            self.graph[predecessor].discard((node, weight))
+        self.edgecount -= len(self.graph[node]) + len(reversegraph[node])
+        del self.graph[node]
+        del reversegraph[node]
+        self.nodecount -= 1
+        self._frozen = None
+        self._work = 0
+        self.version += 1
+    
+    # ==============================================================================
+
+    # INTERNING
+
+    def _interned(self, build=False) -> 'CSRDWGraph':
+        """
+        Frozen copy of the graph with node names interned to dense ints, see CSRDWGraph
+        Whole graph algorithms run on it with list/array state instead of hashing node names at every edge, names are translated back only in their results
+        dijkstras only uses it while the weight array holds every weight exactly, see _weight_range
+        Returns None if there is no valid copy, unless build is True, in which case it is built in O(V+E) time
+        The copy is dropped by the mutators and by clear_cache, and is only used while the version, node count and edge count match those it was built with, an O(1) check,
+        so direct edits to self.graph that add or remove nodes are caught, call clear_cache after any other direct edit (e.g. a changed weight)
+        Point to point and early exit searches never use it, they read self.graph directly
+        """
+        if self._frozen is not None:
+            frozen, built = self._frozen
+            if built == (self.version, len(self.graph), self.edgecount):
+                return frozen
+            self._frozen = None # self.graph was edited directly
+        if not build:
+            return None
+        self._frozen = (self.to_csr(), (self.version, len(self.graph), self.edgecount))
+        self._work = 0
+        return self._frozen[0]
+
+    def _charge(self, work: int) -> None:
+        """
+        Records work nodes settled on self.graph by a search that could have run on the interned copy
+        The copy is built once the work since the last change reaches the number of nodes, so a single search after a change
+        never pays for interning, while repeated searches of an unchanged graph move to the copy after at most twice their cost
+        """
+        self._work += work
+        if self._work >= len(self.graph):
+            self._interned(build=True)
+
+    # ==============================================================================
+
+    # SHORTEST PATH CACHE
+
+    def enable_cache(self, maxsize=32, maxmemory=None) -> None:
+        """
+        Turns on a least recently used cache of dijkstras results, keyed by source node
+        Keeps at most maxsize sources, and if maxmemory is given, at most about maxmemory bytes of results
+        The mutators bump self.version on every edge change, which empties the cache on the next lookup
+        Edits made directly to self.graph bypass the counter, call clear_cache after them (even with the cache disabled, to refresh the weight range used by dijkstras)
+        """
+        self._cache = OrderedDict() # srcNode: (result of dijkstras, estimated bytes), least recently used first
+        self._cachelimits = (maxsize, maxmemory)
+        self._cachememory = 0 # estimated bytes held by the cache
+        self._cacheversion = self.version
+
+    def disable_cache(self) -> None:
+        self._cache = None
+
+    def clear_cache(self) -> None:
+        self._weightrange = None # also recomputed, in case self.graph was edited directly
+        self._frozen = None
+        self._work = 0
+        self.reversegraph = None
+        if self._cache is not None:
+            self._cache.clear()
+            self._cachememory = 0
+            self._cacheversion = self.version
+
+    def _cache_lookup(self, srcNode): # cached result for srcNode, or None
+        if self._cacheversion != self.version: # edges changed since the results were computed
+            self.clear_cache()
+            return None
+        if srcNode in self._cache:
+            self._cache.move_to_end(srcNode)
+            return self._cache[srcNode][0]
+        return None
+
+    def _cache_store(self, srcNode, ordered_costs: dict) -> None:
+        maxsize, maxmemory = self._cachelimits
+        size = getsizeof(ordered_costs) + 32*len(ordered_costs) # the table plus one cost object per entry, node names are shared with the graph
+        if maxmemory is not None and size > maxmemory: # would evict everything else and still not fit
+            return
+        self._cache[srcNode] = (ordered_costs, size)
+        self._cachememory += size
+        while len(self._cache) > maxsize or (maxmemory is not None and self._cachememory > maxmemory):
+            self._cachememory -= self._cache.popitem(last=False)[1][1]
+    
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dijkstras(self, srcNode): # dijkstra's algorithm
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        With the cache enabled (see enable_cache) repeated sources are answered from it, the dictionary is then shared and must not be modified
+        If every weight is a non-negative integer up to 1000, zero_one_bfs or dials is used instead of the heap
+        """
+        if self._cache is not None:
+            ordered_costs = self._cache_lookup(srcNode)
+            if ordered_costs is not None:
+                return ordered_costs
+        integral, minweight, maxweight, exact = self._weight_range()
+        if integral and minweight >= 0 and maxweight <= 1:
+            ordered_costs = self.zero_one_bfs(srcNode)
+        elif integral and minweight >= 0 and maxweight <= 1000:
+            ordered_costs = self.dials(srcNode, maxweight)
+        else:
+            frozen = self._interned() if exact else None
+            if frozen is not None:
+                ordered_costs = frozen.dijkstras(srcNode)
+            else:
+                ordered_costs = {}
+                heap = [(0, srcNode)]
+                while heap:
+                    cost, current_node = heappop(heap)
+                    if current_node in ordered_costs:
+                        continue
+                    ordered_costs[current_node] = cost
+                    for neighbour, newcost in self.graph[current_node]:
+                        heappush(heap, (cost + newcost, neighbour))
+                if exact:
+                    self._charge(len(ordered_costs))
+        if self._cache is not None:
+            self._cache_store(srcNode, ordered_costs)
+        return ordered_costs
+
+    def _weight_range(self) -> tuple:
+        """
+        Returns (all weights are ints, minimum weight, maximum weight, exact), cached until the next edge change
+        exact tells whether the weight array of the interned graph holds every weight unchanged: all ints within 64 bits, or all floats
+        Mixed int and float weights are not exact, the array would give back the ints as floats
+        """
+        if self._weightrange is None or self._weightrange[0] != self.version:
+            integral = True # every weight is an int
+            floating = True # every weight is a float
+            minweight = maxweight = 0
+            for node in self.graph:
+                for neighbour, weight in self.graph[node]:
+                    if type(weight) is not int:
+                        integral = False
+                    if type(weight) is not float:
+                        floating = False
+                    if weight < minweight:
+                        minweight = weight
+                    elif weight > maxweight:
+                        maxweight = weight
+            if integral:
+                exact = -2**63 <= minweight and maxweight < 2**63
+            else:
+                exact = floating
+            self._weightrange = (self.version, integral, minweight, maxweight, exact)
+        return self._weightrange[1:]
+
+    def zero_one_bfs(self, srcNode): # 0-1 breadth first search
+        """
+        Returns the same dictionary as dijkstras for a graph whose weights are all 0 or 1
+        Nodes reached through a 0 edge go to the front of a deque and through a 1 edge to the back, so it is always sorted by cost
+        Runs in O(V+E) time without a heap, raises ValueError if an edge with another weight is relaxed
+        """
+        best = {srcNode: 0}
+        ordered_costs = {}
+        queue = deque([srcNode])
+        while queue:
+            current_node = queue.popleft()
+            if current_node in ordered_costs: # superseded by a cheaper entry
+                continue
+            cost = best[current_node]
+            ordered_costs[current_node] = cost
+            for neighbour, weight in self.graph[current_node]:
+                newcost = cost + weight
+                if newcost < best.get(neighbour, newcost + 1):
+                    best[neighbour] = newcost
+                    if weight == 1:
+                        queue.append(neighbour)
+                    elif weight == 0:
+                        queue.appendleft(neighbour)
+                    else:
+                        raise ValueError("zero_one_bfs requires weights of 0 or 1", weight)
+        return ordered_costs
+
+    def dials(self, srcNode, maxweight=None): # dial's algorithm
+        """
+        Returns the same dictionary as dijkstras for a graph whose weights are non-negative integers up to maxweight
+        maxweight defaults to the largest weight in the graph
+        Uses a circular array of maxweight+1 buckets indexed by cost instead of a heap, every pending node costs at most maxweight more than the current one
+        Empty buckets are skipped, a small heap holds the cost of every non-empty bucket so the next one is found directly
+        Runs in O(V+E+K log K) time where K is the number of distinct costs, raises ValueError if an edge outside 0 to maxweight is relaxed
+        """
+        if maxweight is None:
+            maxweight = max(self._weight_range()[2], 0)
+        size = maxweight + 1
+        buckets = [[] for i in range(size)]
+        buckets[0].append(srcNode)
+        costs = [0] # pending costs, pushed when their bucket becomes non-empty
+        best = {srcNode: 0}
+        ordered_costs = {}
+        while costs:
+            cost = heappop(costs)
+            bucket = buckets[cost % size]
+            while bucket: # 0 edges add to the bucket being emptied
+                current_node = bucket.pop()
+                if current_node in ordered_costs: # superseded by a cheaper entry
+                    continue
+                ordered_costs[current_node] = cost
+                for neighbour, weight in self.graph[current_node]:
+                    newcost = cost + weight
+                    if newcost < best.get(neighbour, newcost + 1):
+                        if not 0 <= weight <= maxweight:
+                            raise ValueError("dials requires integer weights from 0 to maxweight", weight)
+                        best[neighbour] = newcost
+                        nextbucket = buckets[newcost % size]
+                        if not nextbucket:
+                            heappush(costs, newcost)
+                        nextbucket.append(neighbour)
+        return ordered_costs
+
+    def many_source_dijkstras(self, sources=None, workers=None, chunksize=None): # dijkstra's algorithm from many sources in parallel
+        """
+        Generator of (srcNode, dijkstras(srcNode)) for every node in sources, or every node if sources is None
+        The sources are split into chunks solved by a pool of worker processes, os.cpu_count() of them if workers is None
+        Where fork is available the workers inherit the graph from the parent, otherwise it is pickled once per worker, never per task
+        Rows are yielded as soon as their chunk completes, so not necessarily in the order of sources
+        With workers=1 everything runs in the calling process
+        Without fork (Windows, macOS) the calling script must be guarded by if __name__ == "__main__"
+        """
+        sources = list(self.graph) if sources is None else list(sources)
+        if workers is None:
+            workers = cpu_count() or 1
+        if workers == 1 or len(sources) <= 1:
+            for srcNode in sources:
+                yield srcNode, self.dijkstras(srcNode)
+            return
+        if chunksize is None:
+            chunksize = max(1, len(sources) // (4*workers)) # a few chunks per worker to even out uneven sources
+        context = get_context("fork" if "fork" in get_all_start_methods() else None)
+        executor = ProcessPoolExecutor(workers, mp_context=context, initializer=_share_graph, initargs=(self,))
+        try:
+            futures = [executor.submit(_dijkstras_chunk, sources[i:i+chunksize]) for i in range(0, len(sources), chunksize)]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(cancel_futures=True) # the caller may stop iterating early
+
+    def shortest_path(self, srcNode, dstNode, heuristic=None): # dijkstra's algorithm with early exit, a* search if a heuristic is given
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        The search stops as soon as dstNode is settled instead of settling the whole graph
+        heuristic(node) estimates the remaining cost from node to dstNode and must never overestimate it (admissible)
+        Nodes are re-opened whenever a cheaper route to them is found, so inconsistent heuristics still give exact answers
+        """
+        best = {srcNode: 0} # best known cost from srcNode
+        prev_node = {srcNode: None} # maps each node to the previous node for path construction
+        heap = [(heuristic(srcNode) if heuristic else 0, 0, srcNode)]
+        while heap:
+            estimate, cost, current_node = heappop(heap)
+            if cost > best[current_node]: # outdated entry
+                continue
+            if current_node == dstNode:
+                path = [dstNode]
+                while path[-1] != srcNode:
+                    path.append(prev_node[path[-1]])
+                return cost, path[::-1]
+            for neighbour, weight in self.graph[current_node]:
+                newcost = cost + weight
+                if neighbour not in best or newcost < best[neighbour]:
+                    best[neighbour] = newcost
+                    prev_node[neighbour] = current_node
+                    heappush(heap, (newcost + heuristic(neighbour) if heuristic else newcost, newcost, neighbour))
+        return None # no path has been found
+
+    def bidirectional_dijkstras(self, srcNode, dstNode): # dijkstra's algorithm from both ends
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        A forward search from srcNode and a backward search from dstNode take turns, the side with the smaller frontier key goes first
+        Every edge relaxation that reaches a node labelled by the other side gives a candidate cost
+        The search stops once the two smallest frontier keys add up to at least the best candidate, which is then optimal
+        Only works with non-negative edge weights
+        """
+        if srcNode == dstNode:
+            return 0, [srcNode]
+        graphs = (self.graph, self.reverse_table())
+        costs = ({srcNode: 0}, {dstNode: 0}) # best known cost from srcNode / to dstNode
+        prev_node = ({srcNode: None}, {dstNode: None}) # previous node towards srcNode / towards dstNode
+        settled = (set(), set())
+        heaps = ([(0, srcNode)], [(0, dstNode)])
+        best = float("inf")
+        meeting_node = None
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            cost, current_node = heappop(heaps[side])
+            if current_node in settled[side]:
+                continue
+            settled[side].add(current_node)
+            side_costs = costs[side]
+            other_costs = costs[1-side]
+            for neighbour, weight in graphs[side][current_node]:
+                newcost = cost + weight
+                if neighbour not in side_costs or newcost < side_costs[neighbour]:
+                    side_costs[neighbour] = newcost
+                    prev_node[side][neighbour] = current_node
+                    heappush(heaps[side], (newcost, neighbour))
+                    if neighbour in other_costs and newcost + other_costs[neighbour] < best:
+                        best = newcost + other_costs[neighbour]
+                        meeting_node = neighbour
+        if meeting_node is None:
+            return None # no path has been found
+        path = [meeting_node]
+        while path[-1] != srcNode:
+            path.append(prev_node[0][path[-1]])
+        path.reverse()
+        while path[-1] != dstNode:
+            path.append(prev_node[1][path[-1]])
+        return best, path
+
+    def bellman_fords(self, srcNode): # belmann ford's algorithm, use this when edges have negative weights
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        Stops as soon as a pass over every edge makes no relaxation, at most V passes are made
+        Raises ValueError if a negative cycle is reachable from srcNode, use negative_cycle to find it
+        """
+        ordered_costs = {node: float("inf") for node in self.graph}
+        ordered_costs[srcNode] = 0
+        for i in range(self.nodecount):
+            relaxed = False
+            for node in self.graph:
+                cost = ordered_costs[node]
+                if cost != float("inf"):
+                    for neighbour, newcost in self.graph[node]:
+                        if cost + newcost < ordered_costs[neighbour]:
+                            ordered_costs[neighbour] = cost + newcost
+                            relaxed = True
+            if not relaxed:
+                return ordered_costs
+        raise ValueError("negative cycle reachable from srcNode")
+
+    def spfa(self, srcNode, heuristics=True): # shortest path faster algorithm, queue-based bellman ford's
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs, same as bellman_fords
+        Only nodes whose cost has changed are queued for re-examination, near-linear on graphs with few negative edges, O(VE) worst case
+        heuristics enables small label first (a node cheaper than the front of the queue is queued at the front)
+        and large label last (nodes more expensive than the queue average are rotated from the front to the back)
+        Raises ValueError if a negative cycle is reachable from srcNode, use negative_cycle to find it
+        """
+        ordered_costs = {node: float("inf") for node in self.graph}
+        ordered_costs[srcNode] = 0
+        path_edges = {srcNode: 0} # edges on the current best path, reaching V means the path repeats a node on a negative cycle
+        queue = deque([srcNode])
+        in_queue = {srcNode}
+        queue_sum = 0 # sum of the costs of queued nodes, for large label last
+        while queue:
+            if heuristics:
+                average = queue_sum / len(queue)
+                for i in range(len(queue)-1):
+                    if ordered_costs[queue[0]] <= average:
+                        break
+                    queue.rotate(-1)
+            node = queue.popleft()
+            in_queue.discard(node)
+            cost = ordered_costs[node]
+            queue_sum -= cost
+            for neighbour, newcost in self.graph[node]:
+                if cost + newcost < ordered_costs[neighbour]:
+                    if neighbour in in_queue:
+                        queue_sum += cost + newcost - ordered_costs[neighbour]
+                    ordered_costs[neighbour] = cost + newcost
+                    path_edges[neighbour] = path_edges[node] + 1
+                    if path_edges[neighbour] >= self.nodecount:
+                        raise ValueError("negative cycle reachable from srcNode")
+                    if neighbour not in in_queue:
+                        in_queue.add(neighbour)
+                        queue_sum += cost + newcost
+                        if heuristics and queue and cost + newcost < ordered_costs[queue[0]]:
+                            queue.appendleft(neighbour)
+                        else:
+                            queue.append(neighbour)
+        return ordered_costs
+
+    def negative_cycle(self, srcNode=None) -> list: # bellman ford's algorithm with predecessor tracking
+        """
+        Returns the nodes of a negative cycle in edge order (the last node has an edge back to the first), or None if there is none
+        Only cycles reachable from srcNode are considered, or cycles anywhere in the graph if srcNode is None
+        A relaxation in the V-th pass proves a negative cycle, following predecessors V times from there lands on it
+        Runs in O(VE) time
+        """
+        if srcNode is None:
+            ordered_costs = {node: 0 for node in self.graph} # equivalent to a virtual source with an edge to every node
+        else:
+            ordered_costs = {node: float("inf") for node in self.graph}
+            ordered_costs[srcNode] = 0
+        prev_node = {}
+        for i in range(self.nodecount):
+            relaxed_node = None
+            for node in self.graph:
+                cost = ordered_costs[node]
+                if cost != float("inf"):
+                    for neighbour, newcost in self.graph[node]:
+                        if cost + newcost < ordered_costs[neighbour]:
+                            ordered_costs[neighbour] = cost + newcost
+                            prev_node[neighbour] = node
+                            relaxed_node = neighbour
+            if relaxed_node is None:
+                return None
+        node = relaxed_node
+        for i in range(self.nodecount):
+            node = prev_node[node]
+        cycle = [node]
+        pathnode = prev_node[node]
+        while pathnode != node:
+            cycle.append(pathnode)
+            pathnode = prev_node[pathnode]
+        return cycle[::-1]
+
+    def find_path(self, srcNode, dstNode, artificial_weights: dict[dict] = None): # bfs
+        """
+        Path includes srcNode and dstNode
+        O(n) space complexity using dicationary backtracking to reconstruct path
+        Artificial weights, if given, are used as capacities in place of edge weights
+        """
+        prev_node = {srcNode: None} # maps each node to the previous node for path construction
+        queue = deque([srcNode])
+        visited = set()
+        while queue:
+            node = queue.pop()
+            visited.add(node)
+            for neighbour, weight in self.graph[node]:
+                # only paths with positive capcities are considered
+                if artificial_weights and artificial_weights[node][neighbour] <= 0:
+                    continue
+                elif weight <= 0: 
+                    continue
+                # dstNode has been reached, a path has been found
+                if neighbour == dstNode: 
+                    path = [dstNode, node]
+                    pathnode = node
+                    while prev_node[pathnode]:
+                        pathnode = prev_node[pathnode]
+                        path.append(pathnode)
+                    return path[::-1]
+                # add neighbour to queue
+                if neighbour not in visited: 
+                    prev_node[neighbour] = node
+                    queue.appendleft(neighbour)
+        return None # no path has been found
+    
+    # ==============================================================================
+
+    # ALL PAIRS SHORTEST PATHS
+
+    def floyd_warshall(self, nexthops=False) -> tuple: # floyd warshall's algorithm
+        """
+        Returns (names, distances), or (names, distances, nexthop) if nexthops is True
+        distances[i][j] is the minimum cost from names[i] to names[j], float("inf") if unreachable
+        nexthop[i][j] is the index of the node after names[i] on a shortest path to names[j], or -1 if unreachable
+        i.e. the path is recovered by repeatedly setting i = nexthop[i][j] until i == j
+        Raises ValueError with the nodes whose distance to themselves is negative if there is a negative cycle
+
+        With NumPy installed the matrices are NumPy arrays (costs become floats) and every step over k is one vectorized minimum of V*V entries
+        Otherwise they are lists of lists updated row by row, which is much slower
+        Runs in O(V^3) time and O(V^2) memory, suited for dense graphs, for sparse graphs run dijkstras from every node instead
+        """
+        names = list(self.graph)
+        index = {node: i for i, node in enumerate(names)}
+        n = len(names)
+        if np is not None:
+            distances = np.full((n, n), np.inf)
+            np.fill_diagonal(distances, 0)
+            for node in self.graph:
+                i = index[node]
+                for neighbour, weight in self.graph[node]:
+                    j = index[neighbour]
+                    if weight < distances[i, j]:
+                        distances[i, j] = weight
+            if nexthops:
+                nexthop = np.where(np.isfinite(distances), np.arange(n), -1)
+            candidate = np.empty((n, n)) # reused buffer for the costs through k
+            for k in range(n):
+                np.add(distances[:, k, None], distances[k], out=candidate)
+                if nexthops:
+                    better = candidate < distances
+                    distances[better] = candidate[better]
+                    nexthop[better] = np.broadcast_to(nexthop[:, k, None], (n, n))[better]
+                else:
+                    np.minimum(distances, candidate, out=distances)
+            negative = np.flatnonzero(np.diagonal(distances) < 0)
+        else:
+            inf = float("inf")
+            distances = [[inf]*n for i in range(n)]
+            for i in range(n):
+                distances[i][i] = 0
+            for node in self.graph:
+                i = index[node]
+                for neighbour, weight in self.graph[node]:
+                    j = index[neighbour]
+                    if weight < distances[i][j]:
+                        distances[i][j] = weight
+            if nexthops:
+                nexthop = [[j if distances[i][j] < inf else -1 for j in range(n)] for i in range(n)]
+            for k in range(n):
+                rowk = distances[k]
+                for i in range(n):
+                    dik = distances[i][k]
+                    if dik == inf:
+                        continue
+                    if nexthops:
+                        rowi = distances[i]
+                        nexti = nexthop[i]
+                        hop = nexti[k]
+                        for j in range(n):
+                            if dik + rowk[j] < rowi[j]:
+                                rowi[j] = dik + rowk[j]
+                                nexti[j] = hop
+                    else:
+                        distances[i] = list(map(min, distances[i], [dik + cost for cost in rowk]))
+            negative = [i for i in range(n) if distances[i][i] < 0]
+        if len(negative):
+            raise ValueError("graph contains a negative cycle", [names[i] for i in negative])
+        if nexthops:
+            return names, distances, nexthop
+        return names, distances
+
+    # ==============================================================================
+
+    # MAX FLOW & MIN CUT
+
+    def max_flow(self, source, sink, method="dinic"): # dinic's algorithm or push-relabel, see FlowNetwork
+        """
+        Returns the max flow / min cut of the current graph
+        Parameters source and sink are the source and sink of the graph, edge weights are used as capacities
+        The graph itself is not copied or modified, flow is computed on an array-based residual network
+        For the flow on every edge and the min cut partition, use to_flow_network() and FlowNetwork directly
+        """
+        return self.to_flow_network().max_flow(source, sink, method)
+    
+    def min_cost_flow(self, source, sink, capacity=1, maxflow=float("inf")) -> tuple: # successive shortest paths, see FlowNetwork
+        """
+        Returns a tuple (total_flow, total_cost, edge_flows) where edge_flows is a list of [srcNode, dstNode, flow]
+        Edge weights are used as costs per unit of flow
+        capacity is either shared by every edge or a dictionary {(srcNode, dstNode): capacity} with an entry for every edge, see to_flow_network
+        e.g. capacity=1 with edges source -> workers -> jobs -> sink solves the assignment problem,
+        per edge capacities with edges source -> depots -> customers -> sink solve the transportation problem
+        Negative costs are supported as long as there is no negative cycle
+        """
+        network = self.to_flow_network(capacity=capacity)
+        total_flow, total_cost = network.min_cost_flow(source, sink, maxflow)
+        return total_flow, total_cost, network.edge_flows()
+    
+    # ==============================================================================
+
+    # TOPOLOGICAL SORT
+
+    def _in_degrees(self) -> tuple: # interns node names, returns (names, adjacency lists of ids, in-degree of every id)
+        names = list(self.graph)
+        index = {node: i for i, node in enumerate(names)}
+        adjacency = [[] for i in range(len(names))]
+        indegree = [0] * len(names)
+        for node in self.graph:
+            edges = adjacency[index[node]]
+            for neighbour, weight in self.graph[node]:
+                v = index.get(neighbour)
+                if v is None: # neighbour without an entry of its own
+                    v = index[neighbour] = len(names)
+                    names.append(neighbour)
+                    adjacency.append([])
+                    indegree.append(0)
+                edges.append(v)
+                indegree[v] += 1
+        return names, adjacency, indegree
+
+    def _kahn(self) -> tuple: # kahn's algorithm, returns (names, adjacency, indegree, order)
+        names, adjacency, indegree = self._in_degrees()
+        order = [u for u in range(len(names)) if not indegree[u]]
+        for u in order: # order grows while it is being iterated, acting as the queue
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    order.append(v)
+        return names, adjacency, indegree, order
+
+    def _cycle(self, names: list, adjacency: list, indegree: list) -> list:
+        """
+        Nodes left with a positive in-degree after kahn's algorithm all have a predecessor that was also left
+        Following those predecessors must eventually repeat a node, which closes a cycle
+        """
+        predecessor = {}
+        for u in range(len(names)):
+            if indegree[u]:
+                for v in adjacency[u]:
+                    if indegree[v]:
+                        predecessor[v] = u
+        u = next(iter(predecessor))
+        seen = set()
+        while u not in seen:
+            seen.add(u)
+            u = predecessor[u]
+        cycle = [u]
+        v = predecessor[u]
+        while v != u:
+            cycle.append(v)
+            v = predecessor[v]
+        return [names[v] for v in reversed(cycle)]
+
+    def topological_sort(self):
+        """
+        Kahn's algorithm, nodes are output once all of their predecessors have been output
+        Iterative, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree, order = self._kahn()
+        if len(order) < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return [names[u] for u in order]
+
+    def iter_topological_sort(self):
+        """
+        Generator version of topological_sort, yields the nodes in the same order
+        In-degrees are counted up front in O(V+E) time, every node is then yielded as soon as its last predecessor has been
+        Raises ValueError as topological_sort does, once every node outside the cycles has been yielded
+        """
+        names, adjacency, indegree = self._in_degrees()
+        queue = deque(u for u in range(len(names)) if not indegree[u])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            yield names[u]
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    queue.append(v)
+        if count < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+
+    def lexicographical_topological_sort(self):
+        """
+        Returns the lexicographically smallest topological order, node names must be comparable
+        Kahn's algorithm with a heap in place of the queue, runs in O(V log V + E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree = self._in_degrees()
+        heap = [(names[u], u) for u in range(len(names)) if not indegree[u]]
+        heapify(heap)
+        order = []
+        while heap:
+            name, u = heappop(heap)
+            order.append(name)
+            for v in adjacency[u]:
+                indegree[v] -= 1
+                if not indegree[v]:
+                    heappush(heap, (names[v], v))
+        if len(order) < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return order
+
+    def topological_layers(self):
+        """
+        Returns a list of layers, each layer is a list of nodes whose predecessors all lie in earlier layers
+        Nodes in the same layer do not depend on each other and can be processed in parallel
+        The number of layers is the number of nodes on the longest path, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        names, adjacency, indegree = self._in_degrees()
+        layer = [u for u in range(len(names)) if not indegree[u]]
+        layers = []
+        count = 0
+        while layer:
+            layers.append([names[u] for u in layer])
+            count += len(layer)
+            next_layer = []
+            for u in layer:
+                for v in adjacency[u]:
+                    indegree[v] -= 1
+                    if not indegree[v]:
+                        next_layer.append(v)
+            layer = next_layer
+        if count < len(names):
+            raise ValueError("graph contains a cycle", self._cycle(names, adjacency, indegree))
+        return layers
+
+    def find_cycle(self) -> list:
+        """
+        Returns the nodes of a directed cycle in edge order (the last node has an edge back to the first), or None if the graph is acyclic
+        Runs in O(V+E) time
+        """
+        names, adjacency, indegree, order = self._kahn()
+        if len(order) == len(names):
+            return None
+        return self._cycle(names, adjacency, indegree)
+    
+    # ==============================================================================
+
+    # STRONGLY CONNECTED COMPONENTS
+
+    def _tarjan(self) -> tuple: # iterative tarjan's algorithm, returns (components, component id of every node)
+        index = {} # node: discovery order
+        low = {} # node: lowest discovery order reachable through the dfs subtree and one back edge
+        stack = [] # visited nodes whose component is not yet complete
+        components = []
+        componentof = {} # node: component id
+        counter = 0
+        for root in self.graph:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [(root, iter(self.graph[root]))] # explicit dfs stack of (node, remaining neighbours)
+            while work:
+                current_node, neighbours = work[-1]
+                for neighbour, weight in neighbours:
+                    if neighbour not in index: # descend into an unvisited neighbour, the iterator resumes later
+                        index[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        work.append((neighbour, iter(self.graph[neighbour])))
+                        break
+                    if neighbour not in componentof and index[neighbour] < low[current_node]: # neighbour is still on the stack
+                        low[current_node] = index[neighbour]
+                else: # every neighbour is done
+                    work.pop()
+                    if work and low[current_node] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[current_node]
+                    if low[current_node] == index[current_node]: # current_node is the root of a component
+                        component = []
+                        while True:
+                            node = stack.pop()
+                            componentof[node] = len(components)
+                            component.append(node)
+                            if node == current_node:
+                                break
+                        component.reverse()
+                        components.append(component)
+        return components, componentof
+
+    def strongly_connected_components(self) -> list:
+        """
+        Returns the strongly connected components as lists of nodes, using an iterative version of tarjan's algorithm
+        Components are in reverse topological order, i.e. no edge leads from a component to a later one
+        The index of a component in the list is its id, see condensation
+        Runs in O(V+E) time without recursion, so deep graphs do not hit the recursion limit
+        """
+        return self._tarjan()[0]
+
+    def condensation(self) -> 'DWGraph':
+        """
+        Returns the condensation DAG, where node i is component i of strongly_connected_components
+        Components are linked if any edge crosses between them, weighted with the lightest crossing edge
+        Since component ids are in reverse topological order, every edge goes from a higher id to a lower one
+        """
+        components, componentof = self._tarjan()
+        lightest = {} # (component, component): weight
+        for node in self.graph:
+            c = componentof[node]
+            for neighbour, weight in self.graph[node]:
+                d = componentof[neighbour]
+                if c != d and ((c, d) not in lightest or weight < lightest[(c, d)]):
+                    lightest[(c, d)] = weight
+        AdjacencyTable = {i: set() for i in range(len(components))}
+        for (c, d), weight in lightest.items():
+            AdjacencyTable[c].add((d, weight))
+        return DWGraph(AdjacencyTable)
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Detects cycles of odd length using dfs
+        Each node is assigned a depth upon exploration
+        When a visited node is encountered, compare its depth with that of the source node
+        If the difference is even, then the graph is not bipartite
+
+        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
+        Runs in O(V+E) time 
+        """
+        srcNode = tuple(self.graph.keys())[0] # any starting node would work
+        visited = dict() # node: depth
+        stack = [(srcNode, 0)]
+        while stack:
+            current_node, depth = stack.pop()
+            visited[current_node] = depth
+            for neighbour, weight in self.graph[current_node]:
+                if neighbour in visited:
+                    diff = depth - visited[neighbour]
+                    if not diff % 2:
+                        return False
+                else:
+                    stack.append((neighbour, depth+1))
+        return True
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, see CSRDWGraph.save
+        Raises ValueError unless load would give back every weight unchanged, which needs all ints within 64 bits or all floats, see _weight_range
+        """
+        if not self._weight_range()[3]:
+            raise ValueError("weights cannot be saved exactly, convert them all to ints within 64 bits or all to floats")
+        self.to_csr().save(path)
+
+    def load(path) -> 'DWGraph':
+        """
+        Reads a snapshot written by save (of either DWGraph or CSRDWGraph) back into an adjacency table
+        For the fastest startup, load the CSRDWGraph directly with CSRDWGraph.load, which memory-maps the file
+        Only load files from trusted sources, see CSRDWGraph.load
+        """
+        return DWGraph(CSRDWGraph.load(path, use_mmap=False).to_adjacency_table())
+
+
+class CSRDWGraph: # directed weighted graph, frozen compressed sparse row storage
+
+    """
+    Compressed sparse row (CSR) representation of a directed weighted graph
+    1. names, a list where names[i] is the original name of node i
+    2. index, a dictionary mapping each node name to its integer id
+    3. offsets, an array of length V+1 where the out-edges of node i occupy positions offsets[i] to offsets[i+1]-1
+    4. targets, an array of length E where targets[j] is the integer id of the destination of edge j
+    5. weights, an array of length E where weights[j] is the weight of edge j
+
+    Node names are interned to contiguous integers once during construction.
+    Traversals run on integer ids with list/bytearray state, names are only translated back when returning results.
+    Costs 8 bytes per node and 12 bytes per edge (plus the name table), compared to 100+ bytes per edge for the adjacency table.
+
+    The graph is frozen, edges cannot be added or removed after construction.
+    Unlike DWGraph, parallel edges are kept as separate entries.
+    """
+
+    def __init__(self, names: list, offsets: array, targets: array, weights: array) -> None:
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.nodecount = len(names)
+        self.edgecount = len(targets)
+        self.reversegraph = None # graph with every edge reversed, built on first use by reverse_csr
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_EdgeList(EdgeList) -> 'CSRDWGraph':
+        """
+        Format:
+        [[node1, node2, weight1], [node2, node3, weight2] ...]
+        where inner lists contain edges between two nodes and the weight of the edge
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once and never copied into tuples or sets.
+        Edges are bucketed into CSR order with a counting sort in O(V+E) time.
+        Weights are stored as int64, or as floats once a weight does not fit, raises ValueError if an int weight would then be rounded.
+        """
+        index = {}
+        names = []
+        srcs = array('i')
+        dsts = array('i')
+        weights = array('q') # switches to floats on the first non-integer weight
+        floating = False # ints are checked once the weights are floats, see _check_float
+        for srcNode, dstNode, weight in EdgeList:
+            u = index.get(srcNode)
+            if u is None:
+                u = index[srcNode] = len(names)
+                names.append(srcNode)
+            v = index.get(dstNode)
+            if v is None:
+                v = index[dstNode] = len(names)
+                names.append(dstNode)
+            srcs.append(u)
+            dsts.append(v)
+            if floating and type(weight) is int:
+                _check_float(weight)
+            try:
+                weights.append(weight)
+            except (TypeError, OverflowError): # floats, or ints beyond 64 bits
+                weights = _float_weights(weights, (weight,))
+                floating = True
+        return CSRDWGraph._construct_via_Arrays(names, srcs, dsts, weights)
+
+    def _construct_via_Arrays(names: list, srcs: array, dsts: array, weights: array) -> 'CSRDWGraph':
+        # counting sort of the edge arrays by source node
+        n = len(names)
+        m = len(srcs)
+        offsets = array('q', [0]) * (n+1)
+        for u in srcs:
+            offsets[u+1] += 1
+        for i in range(n):
+            offsets[i+1] += offsets[i]
+        position = offsets[:-1] # next free slot of every node
+        targets = array('i', [0]) * m
+        typecode = weights.typecode if isinstance(weights, array) else weights.format # weights of a loaded snapshot are memoryviews
+        sorted_weights = array(typecode, [0]) * m
+        for j in range(m):
+            u = srcs[j]
+            p = position[u]
+            targets[p] = dsts[j]
+            sorted_weights[p] = weights[j]
+            position[u] = p + 1
+        return CSRDWGraph(names, offsets, targets, sorted_weights)
+
+    def _construct_via_Arcs(AdjacencyTable) -> 'CSRDWGraph':
+        # every entry of the adjacency table becomes exactly one arc, nodes are numbered in table order
+        names = list(AdjacencyTable)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('q')
+        floating = False # ints are checked once the weights are floats, see _check_float
+        for node in AdjacencyTable:
+            for neighbour, weight in AdjacencyTable[node]:
+                v = index.get(neighbour)
+                if v is None: # neighbour without an entry of its own
+                    v = index[neighbour] = len(names)
+                    names.append(neighbour)
+                targets.append(v)
+                if floating and type(weight) is int:
+                    _check_float(weight)
+                try:
+                    weights.append(weight)
+                except (TypeError, OverflowError): # floats, or ints beyond 64 bits
+                    weights = _float_weights(weights, (weight,))
+                    floating = True
+            offsets.append(len(targets))
+        for i in range(len(offsets)-1, len(names)): # nodes that only appear as neighbours
+            offsets.append(len(targets))
+        return CSRDWGraph(names, offsets, targets, weights)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def convert_to_bidirectional(self, defaultweight=None) -> 'CSRDWGraph': # returns a new graph
+        """
+        Necessary for bipartite property check.
+        Every edge becomes bi-directional after conversion, with duplicated weights.
+        Runs in O(V+E) time.
+        """
+        srcs, targets, weights = self._sources(), array('i', self.targets), self.weights
+        reverse_weights = weights if defaultweight is None else [defaultweight] * self.edgecount
+        try:
+            all_weights = array(weights.typecode if isinstance(weights, array) else weights.format, weights)
+            if all_weights.typecode == 'd':
+                _check_float(defaultweight)
+            all_weights.extend(reverse_weights)
+        except (TypeError, OverflowError):
+            all_weights = _float_weights(weights, reverse_weights)
+        return CSRDWGraph._construct_via_Arrays(self.names, srcs + targets, targets + srcs, all_weights)
+
+    def reverse_csr(self) -> 'CSRDWGraph':
+        """
+        Returns the graph with every edge reversed, sharing the name table of this graph
+        Built once in O(V+E) time on first call and cached in self.reversegraph
+        """
+        if self.reversegraph is None:
+            self.reversegraph = CSRDWGraph._construct_via_Arrays(self.names, self.targets, self._sources(), self.weights)
+            self.reversegraph.index = self.index
+        return self.reversegraph
+
+    def _sources(self) -> array: # source node of every edge, in CSR order
+        offsets = self.offsets
+        srcs = array('i')
+        for u in range(self.nodecount):
+            srcs.extend(array('i', [u]) * (offsets[u+1] - offsets[u]))
+        return srcs
+
+    def to_adjacency_table(self) -> dict:
+        """
+        Returns the equivalent adjacency table, for use with DWGraph
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        return {names[u]: {(names[targets[j]], weights[j]) for j in range(offsets[u], offsets[u+1])} for u in range(self.nodecount)}
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dijkstras(self, srcNode): # dijkstra's algorithm
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        best = [float("inf")] * self.nodecount # best known cost, only improvements are pushed
+        settled = bytearray(self.nodecount)
+        ordered_costs = {}
+        src = self.index[srcNode]
+        best[src] = 0
+        heap = [(0, src)]
+        while heap:
+            cost, u = heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = 1
+            ordered_costs[names[u]] = cost
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < best[v]:
+                    best[v] = newcost
+                    heappush(heap, (newcost, v))
+        return ordered_costs
+
+    def shortest_path(self, srcNode, dstNode, heuristic=None): # dijkstra's algorithm with early exit, a* search if a heuristic is given
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        The search stops as soon as dstNode is settled instead of settling the whole graph
+        heuristic(node) receives node names, estimates the remaining cost from node to dstNode and must never overestimate it (admissible)
+        Nodes are re-opened whenever a cheaper route to them is found, so inconsistent heuristics still give exact answers
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        src = self.index[srcNode]
+        dst = self.index[dstNode]
+        best = [float("inf")] * self.nodecount # best known cost from srcNode
+        prev_node = array('i', [-1]) * self.nodecount # previous node for path construction
+        best[src] = 0
+        heap = [(heuristic(srcNode) if heuristic else 0, 0, src)]
+        while heap:
+            estimate, cost, u = heappop(heap)
+            if cost > best[u]: # outdated entry
+                continue
+            if u == dst:
+                path = [dst]
+                while path[-1] != src:
+                    path.append(prev_node[path[-1]])
+                return cost, [names[v] for v in reversed(path)]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < best[v]:
+                    best[v] = newcost
+                    prev_node[v] = u
+                    heappush(heap, (newcost + heuristic(names[v]) if heuristic else newcost, newcost, v))
+        return None # no path has been found
+
+    def bidirectional_dijkstras(self, srcNode, dstNode): # dijkstra's algorithm from both ends
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        A forward search from srcNode and a backward search from dstNode take turns, the side with the smaller frontier key goes first
+        Every edge relaxation that reaches a node labelled by the other side gives a candidate cost
+        The search stops once the two smallest frontier keys add up to at least the best candidate, which is then optimal
+        Only works with non-negative edge weights
+        """
+        if srcNode == dstNode:
+            return 0, [srcNode]
+        n = self.nodecount
+        src = self.index[srcNode]
+        dst = self.index[dstNode]
+        graphs = (self, self.reverse_csr())
+        costs = ([float("inf")] * n, [float("inf")] * n) # best known cost from srcNode / to dstNode
+        prev_node = (array('i', [-1]) * n, array('i', [-1]) * n) # previous node towards srcNode / towards dstNode
+        settled = (bytearray(n), bytearray(n))
+        heaps = ([(0, src)], [(0, dst)])
+        costs[0][src] = 0
+        costs[1][dst] = 0
+        best = float("inf")
+        meeting_node = -1
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            cost, u = heappop(heaps[side])
+            if settled[side][u]:
+                continue
+            settled[side][u] = 1
+            offsets, targets, weights = graphs[side].offsets, graphs[side].targets, graphs[side].weights
+            side_costs = costs[side]
+            other_costs = costs[1-side]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < side_costs[v]:
+                    side_costs[v] = newcost
+                    prev_node[side][v] = u
+                    heappush(heaps[side], (newcost, v))
+                    if newcost + other_costs[v] < best:
+                        best = newcost + other_costs[v]
+                        meeting_node = v
+        if meeting_node == -1:
+            return None # no path has been found
+        path = [meeting_node]
+        while path[-1] != src:
+            path.append(prev_node[0][path[-1]])
+        path.reverse()
+        while path[-1] != dst:
+            path.append(prev_node[1][path[-1]])
+        names = self.names
+        return best, [names[v] for v in path]
+
+    def bellman_fords(self, srcNode): # belmann ford's algorithm, use this when edges have negative weights
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        Stops as soon as a pass over every edge makes no relaxation, at most V passes are made
+        Raises ValueError if a negative cycle is reachable from srcNode
+        """
+        n = self.nodecount
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        costs = [float("inf")] * n
+        costs[self.index[srcNode]] = 0
+        for i in range(n):
+            relaxed = False
+            for u in range(n):
+                cost = costs[u]
+                if cost != float("inf"):
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if cost + weights[j] < costs[v]:
+                            costs[v] = cost + weights[j]
+                            relaxed = True
+            if not relaxed:
+                return dict(zip(self.names, costs))
+        raise ValueError("negative cycle reachable from srcNode")
+
+    # ==============================================================================
+
+    # TOPOLOGICAL SORT
+
+    def _cycle(self, indegree: array) -> list:
+        """
+        Nodes left with a positive in-degree after kahn's algorithm all have a predecessor that was also left
+        Following those predecessors must eventually repeat a node, which closes a cycle
+        """
+        offsets, targets = self.offsets, self.targets
+        predecessor = {}
+        for u in range(self.nodecount):
+            if indegree[u]:
+                for j in range(offsets[u], offsets[u+1]):
+                    if indegree[targets[j]]:
+                        predecessor[targets[j]] = u
+        u = next(iter(predecessor))
+        seen = set()
+        while u not in seen:
+            seen.add(u)
+            u = predecessor[u]
+        cycle = [u]
+        v = predecessor[u]
+        while v != u:
+            cycle.append(v)
+            v = predecessor[v]
+        return [self.names[v] for v in reversed(cycle)]
+
+    def topological_sort(self):
+        """
+        Kahn's algorithm over an in-degree array, nodes are output once all of their predecessors have been output
+        Iterative, runs in O(V+E) time
+        Raises ValueError if the graph has a cycle, the nodes of one cycle (in edge order) are the second argument of the error
+        """
+        n = self.nodecount
+        offsets, targets = self.offsets, self.targets
+        indegree = array('i', [0]) * n
+        for v in targets:
+            indegree[v] += 1
+        order = [u for u in range(n) if not indegree[u]]
+        for u in order: # order grows while it is being iterated, acting as the queue
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                indegree[v] -= 1
+                if not indegree[v]:
+                    order.append(v)
+        if len(order) < n:
+            raise ValueError("graph contains a cycle", self._cycle(indegree))
+        names = self.names
+        return [names[u] for u in order]
+
+    def iter_topological_sort(self):
+        """
+        Generator version of topological_sort, yields the nodes in the same order
+        In-degrees are counted up front in O(V+E) time, every node is then yielded as soon as its last predecessor has been
+        Raises ValueError as topological_sort does, once every node outside the cycles has been yielded
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        indegree = array('i', [0]) * self.nodecount
+        for v in targets:
+            indegree[v] += 1
+        queue = deque(u for u in range(self.nodecount) if not indegree[u])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            yield names[u]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                indegree[v] -= 1
+                if not indegree[v]:
+                    queue.append(v)
+        if count < self.nodecount:
+            raise ValueError("graph contains a cycle", self._cycle(indegree))
+
+    # ==============================================================================
+
+    # STRONGLY CONNECTED COMPONENTS
+
+    def _tarjan(self) -> tuple: # iterative tarjan's algorithm on node ids, returns (number of components, component id of every node)
+        offsets, targets = self.offsets, self.targets
+        index = [-1] * self.nodecount # discovery order
+        low = [0] * self.nodecount # lowest discovery order reachable through the dfs subtree and one back edge
+        componentof = array('i', [-1]) * self.nodecount
+        stack = [] # visited nodes whose component is not yet complete
+        count = 0
+        counter = 0
+        for root in range(self.nodecount):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [root] # explicit dfs stack
+            position = [offsets[root]] # next edge to scan for every node in work
+            while work:
+                u = work[-1]
+                j = position[-1]
+                end = offsets[u+1]
+                while j < end:
+                    v = targets[j]
+                    j += 1
+                    if index[v] == -1: # descend into an unvisited neighbour, u resumes from edge j later
+                        position[-1] = j
+                        index[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        work.append(v)
+                        position.append(offsets[v])
+                        break
+                    if componentof[v] == -1 and index[v] < low[u]: # v is still on the stack
+                        low[u] = index[v]
+                else: # every edge of u is done
+                    work.pop()
+                    position.pop()
+                    if work and low[u] < low[work[-1]]:
+                        low[work[-1]] = low[u]
+                    if low[u] == index[u]: # u is the root of a component
+                        while True:
+                            v = stack.pop()
+                            componentof[v] = count
+                            if v == u:
+                                break
+                        count += 1
+        return count, componentof
+
+    def strongly_connected_components(self) -> list:
+        """
+        Returns the strongly connected components as lists of nodes, using an iterative version of tarjan's algorithm
+        Components are in reverse topological order, i.e. no edge leads from a component to a later one
+        The index of a component in the list is its id, see condensation
+        Runs in O(V+E) time without recursion
+        """
+        count, componentof = self._tarjan()
+        components = [[] for i in range(count)]
+        for u in range(self.nodecount):
+            components[componentof[u]].append(self.names[u])
+        return components
+
+    def condensation(self) -> 'CSRDWGraph':
+        """
+        Returns the condensation DAG, where node i is component i of strongly_connected_components
+        Components are linked if any edge crosses between them, weighted with the lightest crossing edge
+        Since component ids are in reverse topological order, every edge goes from a higher id to a lower one
+        """
+        count, componentof = self._tarjan()
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        lightest = {} # c*count+d: weight
+        for u in range(self.nodecount):
+            c = componentof[u]
+            for j in range(offsets[u], offsets[u+1]):
+                d = componentof[targets[j]]
+                if c != d:
+                    key = c*count + d
+                    if key not in lightest or weights[j] < lightest[key]:
+                        lightest[key] = weights[j]
+        srcs = array('i', [key // count for key in lightest])
+        dsts = array('i', [key % count for key in lightest])
+        typecode = weights.typecode if isinstance(weights, array) else weights.format
+        return CSRDWGraph._construct_via_Arrays(list(range(count)), srcs, dsts, array(typecode, lightest.values()))
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Two-colours every component with bfs, fails when an edge joins two nodes of the same colour
+
+        NOTE: Remember to firstly convert (a copy of) the graph to bidirectional first
+        Runs in O(V+E) time
+        """
+        offsets, targets = self.offsets, self.targets
+        colour = bytearray(self.nodecount) # 0 = unvisited, 1 or 2 otherwise
+        for root in range(self.nodecount):
+            if colour[root]:
+                continue
+            colour[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for u in frontier:
+                    other = 3 - colour[u]
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not colour[v]:
+                            colour[v] = other
+                            next_frontier.append(v)
+                        elif colour[v] != other:
+                            return False
+                frontier = next_frontier
+        return True
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, which load can map straight back into memory
+        Layout: a 32 byte header, then offsets, targets, weights and the node name table, each section padded to 8 bytes
+        Integer names are stored as an int64 array, string names as utf-8 with an offset array, any other names are pickled
+        """
+        names = self.names
+        if all(type(name) is int and -(1<<63) <= name < (1<<63) for name in names):
+            namekind = 0
+            nametable = array('q', names).tobytes()
+        elif all(type(name) is str for name in names):
+            namekind = 1
+            encoded = [name.encode() for name in names]
+            nameoffsets = array('q', [0])
+            for name in encoded:
+                nameoffsets.append(nameoffsets[-1] + len(name))
+            nametable = nameoffsets.tobytes() + b"".join(encoded)
+        else:
+            namekind = 2
+            nametable = pickle.dumps(names, protocol=pickle.HIGHEST_PROTOCOL)
+        weightcode = (self.weights.typecode if isinstance(self.weights, array) else self.weights.format).encode()
+        with open(path, "wb") as file:
+            file.write(_SNAPSHOT_HEADER.pack(b"CSRG", 1, byteorder[0].encode(), namekind, weightcode, self.nodecount, len(self.targets), len(nametable)))
+            for section in (self.offsets, self.targets, self.weights):
+                size = len(section) * section.itemsize
+                file.write(section)
+                file.write(bytes(-size % 8))
+            file.write(nametable)
+
+    def load(path, use_mmap=True) -> 'CSRDWGraph':
+        """
+        Reads a snapshot written by save
+        With use_mmap the file is memory-mapped and offsets, targets and weights are read-only views of the mapped pages,
+        so loading costs O(V) (rebuilding the name index) instead of O(V+E), and processes loading the same file share its pages
+        Without use_mmap, the sections are copied into regular arrays
+        Only load files from trusted sources, names other than ints and strings are unpickled
+        """
+        with open(path, "rb") as file:
+            magic, version, fileorder, namekind, weightcode, n, m, namesize = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+            if magic != b"CSRG" or version != 1:
+                raise ValueError(f"{path} is not a graph snapshot")
+            if fileorder.decode() != byteorder[0]: # written on a machine of the other endianness, so the views cannot be used directly
+                use_mmap = False
+            if use_mmap:
+                buffer = memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                file.seek(0)
+                buffer = memoryview(file.read())
+        position = _SNAPSHOT_HEADER.size
+        sections = []
+        for typecode, count in (('q', n+1), ('i', m), (weightcode.decode(), m)):
+            size = count * array(typecode).itemsize
+            section = buffer[position:position+size]
+            if use_mmap:
+                section = section.cast(typecode)
+            else:
+                section = array(typecode, section.tobytes())
+                if fileorder.decode() != byteorder[0]:
+                    section.byteswap()
+            sections.append(section)
+            position += size + (-size % 8)
+        nametable = buffer[position:position+namesize]
+        if namekind == 0:
+            names = array('q', nametable.tobytes())
+            if fileorder.decode() != byteorder[0]:
+                names.byteswap()
+            names = names.tolist()
+        elif namekind == 1:
+            nameoffsets = array('q', nametable[:8*(n+1)].tobytes())
+            if fileorder.decode() != byteorder[0]:
+                nameoffsets.byteswap()
+            blob = nametable[8*(n+1):].tobytes()
+            names = [blob[nameoffsets[i]:nameoffsets[i+1]].decode() for i in range(n)]
+        else:
+            names = pickle.loads(nametable)
+        return CSRDWGraph(names, *sections)
+
+
+class FlowNetwork: # residual network for max flow / min cut / min cost flow
+
+    """
+    Array-based residual network stored as a forward star (linked edge lists)
+    1. names, a list where names[i] is the original name of node i, and index, the reverse mapping
+    2. head, a list where head[u] is the first edge leaving node u, or -1
+    3. nxt, a list where nxt[e] is the next edge leaving the same node as edge e, or -1
+    4. to, a list where to[e] is the destination of edge e
+    5. cap, a list where cap[e] is the residual capacity of edge e
+    6. cost, a list where cost[e] is the cost per unit of flow on edge e, residual edges have the negated cost
+
+    The i-th input edge is stored as edge 2i and its residual (reverse) edge as edge 2i+1, so e^1 is always the partner of e.
+    Parallel edges and antiparallel edges are kept as separate input edges.
+    """
+
+    def __init__(self) -> None:
+        self.names = []
+        self.index = {}
+        self.nodecount = 0
+        self.head = []
+        self.nxt = []
+        self.to = []
+        self.cap = []
+        self.cost = []
+        self.capacity = [] # original capacity of every input edge
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_EdgeList(EdgeList) -> 'FlowNetwork':
+        """
+        Format:
+        [[node1, node2, capacity1], [node2, node3, capacity2] ...] or
+        [[node1, node2, capacity1, cost1], [node2, node3, capacity2, cost2] ...]
+        where inner lists contain edges between two nodes, the capacity of the edge and optionally the cost per unit of flow
+
+        Note that node names are supported by this method.
+        """
+        network = FlowNetwork()
+        for edge in EdgeList:
+            network.add_edge(*edge)
+        return network
+
+    def _node_id(self, node) -> int: # interns node names
+        u = self.index.get(node)
+        if u is None:
+            u = self.index[node] = self.nodecount
+            self.names.append(node)
+            self.head.append(-1)
+            self.nodecount += 1
+        return u
+
+    def add_edge(self, srcNode, dstNode, capacity, cost=0) -> int:
+        """
+        Adds an edge from srcNode to dstNode, returns the id of the edge (its position in the input order)
+        """
+        u = self._node_id(srcNode)
+        v = self._node_id(dstNode)
+        e = len(self.to)
+        self.to.append(v)
+        self.cap.append(capacity)
+        self.cost.append(cost)
+        self.nxt.append(self.head[u])
+        self.head[u] = e
+        self.to.append(u)
+        self.cap.append(0)
+        self.cost.append(-cost)
+        self.nxt.append(self.head[v])
+        self.head[v] = e + 1
+        self.capacity.append(capacity)
+        return e >> 1
+
+    # ==============================================================================
+
+    # MAX FLOW & MIN CUT
+
+    def max_flow(self, source, sink, method="dinic"):
+        """
+        Pushes the maximum flow from source to sink through the residual network and returns its value
+        method="dinic" runs dinic's algorithm in O(V^2 E), O(E sqrt(V)) on unit capacity networks
+        method="push_relabel" runs highest-label push-relabel with the gap heuristic in O(V^2 sqrt(E))
+        Calls are cumulative, use reset() to start again from the zero flow
+        """
+        s = self.index[source]
+        t = self.index[sink]
+        if s == t:
+            raise ValueError("source and sink must be different nodes")
+        if method == "dinic":
+            return self._dinic(s, t)
+        if method == "push_relabel":
+            return self._push_relabel(s, t)
+        raise ValueError(f"unknown max flow method {method}")
+
+    def _levels(self, s: int, t: int) -> list: # bfs distances from s over edges with residual capacity
+        head, nxt, to, cap = self.head, self.nxt, self.to, self.cap
+        level = [-1] * self.nodecount
+        level[s] = 0
+        queue = [s]
+        for u in queue:
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and level[v] == -1:
+                    level[v] = level[u] + 1
+                    if v == t:
+                        return level
+                    queue.append(v)
+                e = nxt[e]
+        return level
+
+    def _dinic(self, s: int, t: int):
+        nxt, to, cap = self.nxt, self.to, self.cap
+        total_flow = 0
+        while True:
+            level = self._levels(s, t)
+            if level[t] == -1:
+                return total_flow
+            current_arc = self.head[:] # first edge of every node not yet known to be useless
+            path = [] # edges from s to u, an explicit stack replaces the recursive dfs
+            u = s
+            while True:
+                if u == t:
+                    # augment along the path, then retreat to the tail of the first saturated edge
+                    bottleneck = min(cap[e] for e in path)
+                    first_saturated = -1
+                    for i in range(len(path)):
+                        e = path[i]
+                        cap[e] -= bottleneck
+                        cap[e^1] += bottleneck
+                        if first_saturated == -1 and cap[e] == 0:
+                            first_saturated = i
+                    total_flow += bottleneck
+                    u = to[path[first_saturated]^1]
+                    del path[first_saturated:]
+                    continue
+                e = current_arc[u]
+                while e != -1 and (cap[e] <= 0 or level[to[e]] != level[u] + 1):
+                    e = nxt[e]
+                current_arc[u] = e
+                if e != -1: # advance
+                    path.append(e)
+                    u = to[e]
+                elif path: # dead end, remove u from the level graph and retreat
+                    level[u] = -1
+                    u = to[path.pop()^1]
+                else: # blocking flow found
+                    break
+
+    def _global_relabel(self, s: int, t: int) -> list: # exact residual distances to t, n for nodes that cannot reach t
+        n = self.nodecount
+        head, nxt, to, cap = self.head, self.nxt, self.to, self.cap
+        height = [n] * n
+        height[t] = 0
+        queue = [t]
+        for v in queue:
+            e = head[v]
+            while e != -1:
+                u = to[e]
+                if cap[e^1] > 0 and height[u] == n and u != s:
+                    height[u] = height[v] + 1
+                    queue.append(u)
+                e = nxt[e]
+        height[s] = n
+        return height
+
+    def _push_relabel(self, s: int, t: int):
+        n = self.nodecount
+        head, nxt, to, cap = self.head, self.nxt, self.to, self.cap
+        height = self._global_relabel(s, t)
+        excess = [0] * n
+        count = [0] * (2*n + 1) # number of nodes at every height, for the gap heuristic
+        for u in range(n):
+            count[height[u]] += 1
+        active = [[] for i in range(2*n + 1)] # buckets of nodes with excess, indexed by height
+        highest = 0
+        # saturate every edge leaving the source
+        e = head[s]
+        while e != -1:
+            v = to[e]
+            if cap[e] > 0:
+                if v != t and not excess[v]:
+                    active[height[v]].append(v)
+                    highest = max(highest, height[v])
+                excess[v] += cap[e]
+                excess[s] -= cap[e]
+                cap[e^1] += cap[e]
+                cap[e] = 0
+            e = nxt[e]
+        current_arc = head[:]
+        while highest >= 0:
+            if not active[highest]:
+                highest -= 1
+                continue
+            u = active[highest].pop()
+            if height[u] != highest or excess[u] <= 0: # moved by the gap heuristic, or already discharged
+                continue
+            # discharge u
+            while excess[u] > 0:
+                e = current_arc[u]
+                if e == -1:
+                    # relabel
+                    old_height = height[u]
+                    new_height = 2*n
+                    e = head[u]
+                    while e != -1:
+                        if cap[e] > 0 and height[to[e]] + 1 < new_height:
+                            new_height = height[to[e]] + 1
+                        e = nxt[e]
+                    count[old_height] -= 1
+                    if count[old_height] == 0 and old_height < n:
+                        # gap heuristic, nodes above the gap can no longer reach the sink
+                        for v in range(n):
+                            if old_height < height[v] < n and v != s:
+                                count[height[v]] -= 1
+                                height[v] = n + 1
+                                count[n+1] += 1
+                                if excess[v] > 0:
+                                    active[n+1].append(v)
+                        new_height = max(new_height, n + 1)
+                    height[u] = new_height
+                    count[new_height] += 1
+                    current_arc[u] = head[u]
+                    continue
+                v = to[e]
+                if cap[e] > 0 and height[u] == height[v] + 1:
+                    # push
+                    pushed = min(excess[u], cap[e])
+                    if v != s and v != t and not excess[v]:
+                        active[height[v]].append(v)
+                    cap[e] -= pushed
+                    cap[e^1] += pushed
+                    excess[u] -= pushed
+                    excess[v] += pushed
+                else:
+                    current_arc[u] = nxt[e]
+            highest = max(highest, height[u])
+        return excess[t]
+
+    # ==============================================================================
+
+    # MIN COST FLOW
+
+    def min_cost_flow(self, source, sink, maxflow=float("inf")) -> tuple: # successive shortest paths
+        """
+        Sends as much flow as possible (up to maxflow) from source to sink at minimum total cost
+        Returns a tuple (total_flow, total_cost), use edge_flows() for the flow on every edge
+        Each augmenting path is a cheapest path found by dijkstra's algorithm on reduced costs cost[e] + potential[u] - potential[v]
+        Potentials start at 0, or at bellman-ford (spfa) distances when some edge has a negative cost
+        Runs in O(F E log V) time where F is the number of augmentations
+        Raises ValueError if the residual network contains a negative cost cycle
+        """
+        s = self.index[source]
+        t = self.index[sink]
+        n = self.nodecount
+        head, nxt, to, cap, cost = self.head, self.nxt, self.to, self.cap, self.cost
+        if any(cap[e] > 0 and cost[e] < 0 for e in range(len(to))):
+            potential = self._spfa_potentials(s)
+        else:
+            potential = [0] * n
+        total_flow = 0
+        total_cost = 0
+        while total_flow < maxflow:
+            # dijkstra's algorithm on reduced costs, which are non-negative on residual edges
+            dist = [float("inf")] * n
+            prev_edge = [-1] * n
+            dist[s] = 0
+            heap = [(0, s)]
+            while heap:
+                d, u = heappop(heap)
+                if d > dist[u]:
+                    continue
+                e = head[u]
+                while e != -1:
+                    if cap[e] > 0:
+                        v = to[e]
+                        newdist = d + cost[e] + potential[u] - potential[v]
+                        if newdist < dist[v]:
+                            dist[v] = newdist
+                            prev_edge[v] = e
+                            heappush(heap, (newdist, v))
+                    e = nxt[e]
+            if dist[t] == float("inf"):
+                break
+            for u in range(n):
+                if dist[u] != float("inf"):
+                    potential[u] += dist[u]
+            # augment along the cheapest path
+            pushed = maxflow - total_flow
+            v = t
+            while v != s:
+                e = prev_edge[v]
+                pushed = min(pushed, cap[e])
+                v = to[e^1]
+            v = t
+            while v != s:
+                e = prev_edge[v]
+                cap[e] -= pushed
+                cap[e^1] += pushed
+                v = to[e^1]
+            total_flow += pushed
+            total_cost += pushed * (potential[t] - potential[s])
+        return total_flow, total_cost
+
+    def _spfa_potentials(self, s: int) -> list: # shortest path costs from s over residual edges, queue-based bellman-ford
+        n = self.nodecount
+        head, nxt, to, cap, cost = self.head, self.nxt, self.to, self.cap, self.cost
+        dist = [0] * n # unreachable nodes stay unreachable during min cost flow, so any potential works for them
+        reached = bytearray(n)
+        in_queue = bytearray(n)
+        relaxations = [0] * n
+        reached[s] = 1
+        in_queue[s] = 1
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = 0
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and (not reached[v] or dist[u] + cost[e] < dist[v]):
+                    dist[v] = dist[u] + cost[e]
+                    reached[v] = 1
+                    if not in_queue[v]:
+                        relaxations[v] += 1
+                        if relaxations[v] > n:
+                            raise ValueError("negative cost cycle in flow network")
+                        in_queue[v] = 1
+                        queue.append(v)
+                e = nxt[e]
+        return dist
+
+    def edge_flows(self) -> list:
+        """
+        Returns a list of [srcNode, dstNode, flow] in the same order as the input edges
+        """
+        names, to, cap = self.names, self.to, self.cap
+        return [[names[to[2*i+1]], names[to[2*i]], self.capacity[i] - cap[2*i]] for i in range(len(self.capacity))]
+
+    def min_cut(self, source) -> tuple:
+        """
+        Returns (source_side, sink_side), two sets of nodes partitioning the network
+        Must be called after max_flow, the source side is everything still reachable from source in the residual network
+        Input edges from the source side to the sink side form a minimum cut
+        """
+        head, nxt, to, cap = self.head, self.nxt, self.to, self.cap
+        reachable = bytearray(self.nodecount)
+        s = self.index[source]
+        reachable[s] = 1
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            e = head[u]
+            while e != -1:
+                if cap[e] > 0 and not reachable[to[e]]:
+                    reachable[to[e]] = 1
+                    stack.append(to[e])
+                e = nxt[e]
+        source_side = {self.names[u] for u in range(self.nodecount) if reachable[u]}
+        sink_side = {self.names[u] for u in range(self.nodecount) if not reachable[u]}
+        return source_side, sink_side
+
+    def reset(self) -> None:
+        """
+        Restores every residual capacity to the zero flow
+        """
+        for i in range(len(self.capacity)):
+            self.cap[2*i] = self.capacity[i]
+            self.cap[2*i+1] = 0
+
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 3), ("A", "C", 1), ("C", "B", 4), ("C", "D", 1)])
+# print(mygraph.dijkstras("A"))
+# print(mygraph.shortest_path("A", "D")) # (2, ['A', 'C', 'D'])
+# print(mygraph.bidirectional_dijkstras("A", "D")) # (2, ['A', 'C', 'D'])
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
+# mygraph.add_edge("D", "E", 2)
+# mygraph.remove_edge("A", "C")
+# print(mygraph.dijkstras("A"), mygraph.nodecount, mygraph.edgecount)
+# mygraph.remove_node("B")
+# print(mygraph.reverse_table())
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 3), ("B", "C", 1), ("C", "A", 4), ("C", "D", 1)])
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # False
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "D", 1), ("A", "C", 10), ("C", "D", -10)])
+# print(mygraph.dijkstras("A"))
+# print(mygraph.bellman_fords("A"))
+# print(mygraph.spfa("A"))
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # True
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 2), ("C", "A", -4), ("C", "D", 1)])
+# print(mygraph.negative_cycle()) # ['A', 'B', 'C'] or a rotation of it
+# print(mygraph.bellman_fords("A")) # ValueError
+
+# mygraph = DWGraph.construct_via_EdgeList([(4, 1, 1), (4, 5, 2), (1, 2, 3), (5, 2, 5), (2, 3, 3), (5, 3, 4), (3, 6, 1)])
+# print(mygraph.topological_sort())
+# print(mygraph.topological_layers()) # [[4], [1, 5], [2], [3], [6]]
+
+# mygraph = DWGraph.construct_via_EdgeList([(1, 2, 5), (1, 4, 4), (4, 2, 3), (2, 3, 6), (4, 5, 1), (3, 5, 8), (3, 6, 5), (5, 6, 2)])
+# print(mygraph.max_flow(1, 6)) # 7
+# print(mygraph.max_flow(1, 6, method="push_relabel")) # 7
+
+# mygraph = CSRDWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "D", 1), ("A", "C", 10), ("C", "D", -10)])
+# print(mygraph.dijkstras("A"))
+# print(mygraph.bellman_fords("A"))
+# print(mygraph.topological_sort())
+# print(mygraph.convert_to_bidirectional().is_bipartite()) # True
+
+# network = FlowNetwork.construct_via_EdgeList([(1, 2, 5), (1, 4, 4), (4, 2, 3), (2, 3, 6), (4, 5, 1), (3, 5, 8), (3, 6, 5), (5, 6, 2), (4, 5, 1), (5, 6, 1)])
+# print(network.max_flow(1, 6)) # 8, parallel edges are supported
+# print(network.edge_flows())
+# print(network.min_cut(1))
+
+
+# mygraph = DWGraph.construct_via_EdgeList([("s", "w1", 0), ("s", "w2", 0), ("w1", "j1", 4), ("w1", "j2", 2), ("w2", "j1", 3), ("w2", "j2", 5), ("j1", "t", 0), ("j2", "t", 0)])
+# print(mygraph.min_cost_flow("s", "t")) # (2, 5, ...), w1 -> j2 and w2 -> j1
+
+# supplies = {("s", "d1"): 3, ("s", "d2"): 2, ("c1", "t"): 4, ("c2", "t"): 1}
+# mygraph = DWGraph.construct_via_EdgeList([("s", "d1", 0), ("s", "d2", 0), ("d1", "c1", 2), ("d1", "c2", 1), ("d2", "c1", 3), ("d2", "c2", 4), ("c1", "t", 0), ("c2", "t", 0)])
+# print(mygraph.min_cost_flow("s", "t", capacity={**supplies, ("d1", "c1"): 5, ("d1", "c2"): 5, ("d2", "c1"): 5, ("d2", "c2"): 5})) # (5, 11, ...)
+
+# network = FlowNetwork.construct_via_EdgeList([(1, 2, 4, 1), (1, 3, 2, 5), (2, 3, 2, -2), (2, 4, 2, 6), (3, 4, 4, 1)])
+# print(network.min_cost_flow(1, 4)) # (6, 26)
+# print(network.edge_flows())
+
+# mygraph = CSRDWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "D", 1), ("A", "C", 10), ("C", "D", -10)])
+# mygraph.save("graph.bin")
+# mygraph = CSRDWGraph.load("graph.bin") # arrays are memory-mapped, nothing is parsed or copied
+# print(mygraph.bellman_fords("A")) # {'A': 0, 'B': 1, 'D': 0, 'C': 10}
+
+# mygraph = DWGraph.construct_via_EdgeList([(1, 2, 8), (2, 3, 2**70 + 1)])
+# mygraph.save("graph.bin") # ValueError, the int64 weight array cannot hold 2**70 + 1
+# mygraph.remove_edge(2, 3)
+# mygraph.add_edge(2, 3, 5)
+# mygraph.save("graph.bin")
+# print(DWGraph.load("graph.bin").graph == mygraph.graph) # True, 8 comes back as 8 and not 8.0
+
+# mygraph = DWGraph.construct_via_EdgeList([(1, 2, 1), (2, 3, 1), (3, 1, 1), (3, 4, 2), (2, 4, 7), (4, 5, 1), (5, 4, 1), (6, 5, 3)])
+# print(mygraph.strongly_connected_components()) # [[4, 5], [1, 2, 3], [6]]
+# print(mygraph.condensation().graph) # {0: set(), 1: {(0, 2)}, 2: {(0, 3)}}, lightest crossing edges
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 2), ("A", "C", 5)])
+# mygraph.enable_cache(maxsize=8)
+# print(mygraph.dijkstras("A")) # {'A': 0, 'B': 1, 'C': 3}, computed
+# print(mygraph.dijkstras("A")) # same dictionary, served from the cache
+# mygraph.add_edge("A", "C", 2) # bumps mygraph.version, the cache is emptied on the next lookup
+# print(mygraph.dijkstras("A")) # {'A': 0, 'B': 1, 'C': 2}
+
+# if __name__ == "__main__": # required where worker processes are spawned instead of forked
+#     mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 2), ("A", "C", 5), ("C", "A", 1)])
+#     for srcNode, costs in mygraph.many_source_dijkstras(workers=2):
+#         print(srcNode, costs) # one row of the distance table per source, in completion order
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 4), ("A", "C", 1), ("C", "B", -2), ("B", "D", 3)])
+# names, distances, nexthop = mygraph.floyd_warshall(nexthops=True)
+# print(names, distances[0]) # ['A', 'B', 'C', 'D'] [ 0. -1.  1.  2.]
+# i, j = names.index("A"), names.index("D")
+# path = [names[i]]
+# while i != j:
+#     i = nexthop[i][j]
+#     path.append(names[i])
+# print(path) # ['A', 'C', 'B', 'D']
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 0), ("A", "C", 1), ("C", "D", 1)])
+# print(mygraph.zero_one_bfs("A")) # {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+# print(mygraph.dials("A")) # same costs, bucket queue
+# print(mygraph.dijkstras("A")) # picks zero_one_bfs automatically as every weight is 0 or 1
+
+# mygraph = DWGraph.construct_via_EdgeList([("A", "B", 1.5), ("B", "C", 2.5), ("A", "C", 5.0)])
+# print(mygraph.dijkstras("A")) # {'A': 0, 'B': 1.5, 'C': 4.0}, settles every node so the graph is interned for later searches
+# print(mygraph.dijkstras("B")) # {'B': 0, 'C': 2.5}, runs on the interned copy
+# mygraph.add_edge("C", "D", 0.5) # drops the interned copy, the next search reads the adjacency table again
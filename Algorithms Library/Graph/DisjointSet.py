@@ -0,0 +1,110 @@
+# Python implementation of a disjoint set union a.k.a. union find
+# Maintains a partition of the elements 0, 1, ..., n-1 into disjoint sets under merging
+# Path compression together with union by size answers every query in amortized inverse ackermann time, practically constant
+# Rollback mode drops path compression so that unions can be undone in O(1), queries are then O(log n)
+# e.g. offline dynamic connectivity, or trying a union and reverting it during a search
+
+class DisjointSet:
+    def __init__(self, size: int = 0, rollback: bool = False) -> None:
+        """
+        Creates size singleton sets, more elements can be added at any time with add.
+        With rollback set to True, every union is recorded and can be undone with rollback.
+        """
+        self.parent = list(range(size)) # parent[x] == x for the representative of every set
+        self.size = [1]*size # only meaningful for representatives
+        self.count = size # number of disjoint sets
+        self.history = [] if rollback else None # merged representatives, in order of union
+
+    def add(self) -> int: # adds a new singleton set and returns its element
+        element = len(self.parent)
+        self.parent.append(element)
+        self.size.append(1)
+        self.count += 1
+        return element
+
+    def find(self, element: int) -> int: # representative of the set containing element
+        parent = self.parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        if self.history is None: # path compression, skipped in rollback mode as it cannot be undone cheaply
+            while parent[element] != root:
+                parent[element], element = root, parent[element]
+        return root
+
+    def union(self, element1: int, element2: int) -> bool:
+        """
+        Merges the sets containing element1 and element2, the smaller set is attached below the larger one
+        Returns False if they were already in the same set
+        """
+        root1 = self.find(element1)
+        root2 = self.find(element2)
+        if root1 == root2:
+            return False
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        self.count -= 1
+        if self.history is not None:
+            self.history.append(root2)
+        return True
+
+    def connected(self, element1: int, element2: int) -> bool: # checks if both elements are in the same set
+        return self.find(element1) == self.find(element2)
+
+    def set_size(self, element: int) -> int: # size of the set containing element
+        return self.size[self.find(element)]
+
+    def sets(self) -> list: # all sets as lists of elements
+        groups = {}
+        for element in range(len(self.parent)):
+            root = self.find(element)
+            if root in groups:
+                groups[root].append(element)
+            else:
+                groups[root] = [element]
+        return list(groups.values())
+
+    # ==============================================================================
+
+    # ROLLBACK
+
+    def checkpoint(self) -> int: # marks the current state, to be passed to rollback later
+        if self.history is None:
+            raise ValueError("rollback mode is disabled")
+        return len(self.history)
+
+    def rollback(self, checkpoint: int = 0) -> None:
+        """
+        Undoes every union made since checkpoint, in reverse order, O(1) per union
+        Elements added since checkpoint are kept as singletons
+        """
+        if self.history is None:
+            raise ValueError("rollback mode is disabled")
+        parent = self.parent
+        size = self.size
+        history = self.history
+        while len(history) > checkpoint:
+            root2 = history.pop()
+            root1 = parent[root2]
+            size[root1] -= size[root2]
+            parent[root2] = root2
+            self.count += 1
+
+
+# dsu = DisjointSet(6)
+# dsu.union(0, 1)
+# dsu.union(2, 3)
+# dsu.union(1, 3)
+# print(dsu.connected(0, 2), dsu.set_size(0), dsu.count) # True 4 3
+# print(dsu.sets()) # [[0, 1, 2, 3], [4], [5]]
+
+# dsu = DisjointSet(4, rollback=True)
+# dsu.union(0, 1)
+# checkpoint = dsu.checkpoint()
+# dsu.union(1, 2)
+# dsu.union(2, 3)
+# print(dsu.count) # 1
+# dsu.rollback(checkpoint)
+# print(dsu.connected(0, 1), dsu.connected(0, 2), dsu.count) # True False 3
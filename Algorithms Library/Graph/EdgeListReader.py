@@ -0,0 +1,92 @@
+# Streaming reader for edge lists stored in text/CSV files
+# Yields one edge at a time so that graphs can be built without materializing the whole edge list
+# Pair with the CSR graph classes, whose construct_via_EdgeList consumes any iterable exactly once
+# e.g. CSRDWGraph.construct_via_EdgeList(read_edge_list("roads.csv", delimiter=",", skiplines=1))
+
+from mmap import mmap, ACCESS_READ
+from os.path import getsize
+
+def _read_chunks(source, use_mmap: bool, chunksize: int): # yields decoded text chunks of a file
+    if use_mmap:
+        if not getsize(source): # empty files cannot be mapped
+            return
+        with open(source, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+            start = 0
+            size = len(mapped)
+            while start < size:
+                # cut every chunk right after a newline so that multi-byte characters are never split
+                if start + chunksize >= size:
+                    end = size
+                else:
+                    end = mapped.rfind(b"\n", start, start + chunksize) + 1
+                    if end <= start: # line longer than chunksize, extend the chunk to its end
+                        end = mapped.find(b"\n", start + chunksize) + 1 or size
+                yield mapped[start:end].decode()
+                start = end
+    else:
+        with open(source, "r", encoding="utf-8") as file: # same decoding as the mmap path
+            chunk = file.read(chunksize)
+            while chunk:
+                yield chunk
+                chunk = file.read(chunksize)
+
+def _read_lines(source, use_mmap: bool, chunksize: int): # yields complete lines, reassembling lines split across chunks
+    if not isinstance(source, str): # any iterable of lines, e.g. an open file or sys.stdin
+        yield from source
+        return
+    remainder = ""
+    for chunk in _read_chunks(source, use_mmap, chunksize):
+        lines = (remainder + chunk).splitlines()
+        if chunk[-1] in "\r\n":
+            remainder = ""
+        else:
+            remainder = lines.pop() # last line is incomplete
+        yield from lines
+    if remainder:
+        yield remainder
+
+def read_edge_list(source, delimiter=None, weighted=True, node_type=str, weight_type=float, skiplines=0, comment="#", use_mmap=False, chunksize=1<<20):
+    """
+    Generator of edges (node1, node2, weight), or (node1, node2) if weighted is False, one per line of source
+
+    source is either a file path, which is read in chunks of chunksize characters, or any iterable of lines
+    use_mmap memory-maps the file instead of reading it, chunks are then decoded straight from the page cache
+    delimiter separates the fields of a line, None splits on any whitespace (use "," for CSV)
+    node_type and weight_type convert the fields, e.g. node_type=int stores integer ids instead of strings
+    The first skiplines lines (e.g. a CSV header) are skipped, as are blank lines and lines starting with comment
+    Columns after the first two (three if weighted) are ignored, raises ValueError for a line without a weight if weighted is True
+
+    Only the fields of the current line and one copy of every distinct node name are held, the file is never loaded into memory as a whole
+    Node names are interned, every occurrence of a name is the same object, so graphs built from the edges store each name once
+    Files are decoded as UTF-8
+    """
+    lines = _read_lines(source, use_mmap, chunksize)
+    for i in range(skiplines):
+        next(lines, None)
+    convert = node_type is not str
+    interned = {} # first object seen for every node name
+    intern = interned.setdefault
+    for number, line in enumerate(lines, skiplines + 1):
+        fields = line.split(delimiter)
+        if len(fields) < 2 or (comment and line.startswith(comment)):
+            continue
+        node1 = fields[0].strip()
+        node2 = fields[1].strip()
+        if convert:
+            node1 = node_type(node1)
+            node2 = node_type(node2)
+        node1 = intern(node1, node1)
+        node2 = intern(node2, node2)
+        if weighted:
+            if len(fields) < 3:
+                raise ValueError(f"line {number} has no weight: {line!r}")
+            yield node1, node2, weight_type(fields[2])
+        else:
+            yield node1, node2
+
+
+# with open("edges.txt", "w") as file:
+#     file.write("# road network\nA B 3\nA C 1\nC B 4\n\nC D 1\n")
+# print(list(read_edge_list("edges.txt"))) # [('A', 'B', 3.0), ('A', 'C', 1.0), ('C', 'B', 4.0), ('C', 'D', 1.0)]
+# print(list(read_edge_list("edges.txt", weighted=False, use_mmap=True))) # [('A', 'B'), ('A', 'C'), ('C', 'B'), ('C', 'D')]
+# print(list(read_edge_list(["1,2,5", "2,3,7"], delimiter=",", node_type=int, weight_type=int))) # [(1, 2, 5), (2, 3, 7)]
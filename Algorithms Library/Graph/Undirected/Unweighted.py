@@ -1,181 +1,1155 @@
-from copy import deepcopy
-
-class UUGraph: # undirected unweighted simple graph
-    
-    """
-    Graph Representations
-    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours
-    2. Adjacency matrix, a 2D list where matrix[a][b] represents if there is an edge from a to b
-    3. Edge list, an unordered list of edges in the form [a, b] representing an edge from a to b
-    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
-
-    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
-    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
-
-    Note that due to the graph being undirected, each edge may appear more than once in the internal representation.
-    """
-
-    def __init__(self, AdjacencyTable) -> None:
-        self.graph = AdjacencyTable
-
-    # CONSTRUCTORS
-
-    # ==============================================================================
-
-    def construct_via_AdjacencyList(AdjacencyList) -> 'UUGraph':
-        """
-        Format:
-        [[node1, node2, node3], [node2, node4], ...]
-        where inner lists contain neighbours
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        """
-        AdjacencyTable = {}
-        for i in range(len(AdjacencyList)):
-            AdjacencyTable[i] = set(AdjacencyList[i])
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add(node)
-                else:
-                    newAdjacencyTable[neighbour] = {node}
-        return UUGraph(newAdjacencyTable)
-
-    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'UUGraph':
-        """
-        Format:
-        [
-            [1, 0, 1], 
-            [1, 1, 0], 
-            ...
-        ]
-        where matrix[a][b] contains 1 if there is an edge from a to b and 0 if there is no edge between them
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        """
-        AdjacencyTable = {}
-        l = len(AdjacencyMatrix)
-        for i in range(l):
-            AdjacencyTable[i] = set(j for j in range(l) if AdjacencyMatrix[i][j] != 0)
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add(node)
-                else:
-                    newAdjacencyTable[neighbour] = {node}
-        return UUGraph(newAdjacencyTable)
-
-    def construct_via_EdgeList(EdgeList) -> 'UUGraph':
-        """
-        Format:
-        [[node1, node2], [node2, node3] ...]
-        where inner lists contain edges between two nodes
-
-        Note that node names are supported by this method.
-        """
-        AdjacencyTable = {}
-        for edge in EdgeList:
-            srcNode, dstNode = edge
-            if srcNode in AdjacencyTable:
-                AdjacencyTable[srcNode].add(dstNode)
-            else:
-                AdjacencyTable[srcNode] = {dstNode}
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add(node)
-                else:
-                    newAdjacencyTable[neighbour] = {node}
-        return UUGraph(newAdjacencyTable)
-
-    def construct_via_AdjacencyTable(AdjacencyTable) -> 'UUGraph':
-        """
-        Format:
-        {[node1, node2, node3], [node2, node4], ...}
-        where inner lists contain neighbours
-
-        Note that node names are supported by this method.
-        """
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add(node)
-                else:
-                    newAdjacencyTable[neighbour] = {node}
-        return UUGraph(newAdjacencyTable)
-    
-    # ==============================================================================
-
-    # TRAVERSALS
-
-    def dfs(self, srcNode): # depth first search from srcNode
-        order = []
-        stack = [srcNode]
-        visited = set()
-        while stack:
-            current_node = stack.pop()
-            if current_node in visited:
-                continue
-            visited.add(current_node)
-            order.append(current_node)
-            for neighbour in self.graph[current_node]:
-                stack.append(neighbour)
-        return order
-    
-    def bfs(self, srcNode): # breadth first search from srcNode
-        order = []
-        queue = [srcNode]
-        visited = set()
-        while queue:
-            current_node = queue.pop()            
-            if current_node in visited:
-                continue
-            visited.add(current_node)
-            order.append(current_node)
-            for neighbour in self.graph[current_node]:
-                queue.insert(0, neighbour)
-        return order
-    
-    # ==============================================================================
-
-    # PROPERTY CHECKS
-
-    def is_bipartite(self) -> bool:
-        """
-        Detects cycles of odd length using dfs
-        Each node is assigned a depth upon exploration
-        When a visited node is encountered, compare its depth with that of the source node
-        If the difference is even, then the grahh is not bipartite
-        """
-        srcNode = tuple(self.graph.keys())[0] # any starting node would work
-        visited = dict() # node: depth
-        stack = [(srcNode, 0)]
-        while stack:
-            current_node, depth = stack.pop()
-            visited[current_node] = depth
-            for neighbour in self.graph[current_node]:
-                if neighbour in visited:
-                    diff = depth - visited[neighbour]
-                    if not diff % 2:
-                        return False
-                else:
-                    stack.append((neighbour, depth+1))
-        return True
-    
-
-# if __name__ == "__main__":
-
-#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "B"), ("C", "D")])
-#     print(mygraph.dfs("A"))
-#     print(mygraph.bfs("A"))
-#     print(mygraph.is_bipartite())
-#     mygraph = UUGraph.construct_via_AdjacencyList([(1, 2), (2,), (3, 4), {}, {}])
-#     print(mygraph.dfs(0))
-#     print(mygraph.bfs(0))
-#     print(mygraph.is_bipartite())
\ No newline at end of file
+from array import array
+from struct import Struct
+from mmap import mmap, ACCESS_READ
+from sys import byteorder
+import pickle
+
+_SNAPSHOT_HEADER = Struct("<4sBcBcqqqq") # magic, version, byte order, name encoding, weight typecode, nodes, arcs, edges, name table size
+
+def _multi_source_bfs(nodecount: int, offsets, targets, sources: list) -> list:
+    """
+    Bit-parallel bfs (MS-BFS) from every node id in sources at once, the edges of node i are targets[offsets[i]:offsets[i+1]]
+    Every node carries a bitmask of the searches that reached it, bit k standing for sources[k], so a single scan of an edge
+    advances all searches whose frontiers share that node, Python ints make the masks as wide as needed
+    Returns one array per source holding the number of edges from it to every node, -1 if unreachable
+    """
+    distances = [array('i', [-1]) * nodecount for k in range(len(sources))]
+    seen = [0] * nodecount
+    frontier = {} # node id: searches that reached it in the last level
+    for k, s in enumerate(sources):
+        seen[s] |= 1 << k
+        frontier[s] = frontier.get(s, 0) | 1 << k
+        distances[k][s] = 0
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = {}
+        for u, mask in frontier.items():
+            for v in targets[offsets[u]:offsets[u+1]]:
+                new = mask & ~seen[v]
+                if new:
+                    seen[v] |= new
+                    next_frontier[v] = next_frontier.get(v, 0) | new
+                    while new: # record the depth for every search that reached v just now
+                        bit = new & -new
+                        distances[bit.bit_length() - 1][v] = depth
+                        new ^= bit
+        frontier = next_frontier
+    return distances
+
+def _biconnectivity(nodecount: int, offsets, targets) -> tuple:
+    """
+    Iterative Hopcroft-Tarjan low-link over node ids 0 to nodecount-1, the edges of node i are targets[offsets[i]:offsets[i+1]]
+    Every edge must be stored in both directions, self loops are ignored and parallel edges are never bridges
+    Returns (articulation point ids, bridges, members, bounds) in O(V+E) time, results are kept flat to avoid millions of small objects
+    bridge k is bridges[2k] - bridges[2k+1], the ids of biconnected component k are members[bounds[k]:bounds[k+1]]
+    """
+    order = [0]*nodecount # discovery time, 0 while undiscovered
+    low = [0]*nodecount # smallest discovery time reachable with one back edge from the subtree
+    parent = [-1]*nodecount
+    position = list(offsets) # next edge to scan of every node
+    skipped = bytearray(nodecount) # whether the edge back to the parent was skipped, a parallel edge to it is a back edge
+    articulation = bytearray(nodecount)
+    bridges = []
+    members = []
+    bounds = [0]
+    nodes = [] # discovered nodes not yet assigned to a component
+    where = [0]*nodecount # position of every node in nodes
+    time = 0
+    for root in range(nodecount):
+        if order[root]:
+            continue
+        time += 1
+        order[root] = low[root] = time
+        stack = [root] # explicit dfs stack, recursion would overflow on long paths
+        where[root] = len(nodes)
+        nodes.append(root)
+        children = 0
+        while stack:
+            u = stack[-1]
+            j = position[u]
+            end = offsets[u+1]
+            lowu = low[u]
+            while j < end: # scan edges until an undiscovered neighbour is found
+                v = targets[j]
+                j += 1
+                if not order[v]:
+                    break
+                if v == parent[u] and not skipped[u]:
+                    skipped[u] = 1
+                elif order[v] < lowu:
+                    lowu = order[v]
+            else:
+                v = -1
+            position[u] = j
+            low[u] = lowu
+            if v != -1:
+                parent[v] = u
+                time += 1
+                order[v] = low[v] = time
+                stack.append(v)
+                where[v] = len(nodes)
+                nodes.append(v)
+                continue
+            stack.pop()
+            if not stack:
+                break
+            p = stack[-1]
+            if low[u] < low[p]:
+                low[p] = low[u]
+            if low[u] >= order[p]: # p separates the subtree of u from the rest, which forms a biconnected component with p
+                if p == root:
+                    children += 1
+                else:
+                    articulation[p] = 1
+                if low[u] > order[p]:
+                    bridges.append(p)
+                    bridges.append(u)
+                members.append(p) # the rest of the component is everything discovered from u onwards
+                members.extend(nodes[where[u]:])
+                del nodes[where[u]:]
+                bounds.append(len(members))
+        if children > 1:
+            articulation[root] = 1
+        nodes.clear()
+    return [i for i in range(nodecount) if articulation[i]], bridges, members, bounds
+
+class UUGraph: # undirected unweighted simple graph
+    
+    """
+    Graph Representations
+    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours
+    2. Adjacency matrix, a 2D list where matrix[a][b] represents if there is an edge from a to b
+    3. Edge list, an unordered list of edges in the form [a, b] representing an edge from a to b
+    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
+
+    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
+    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
+
+    Note that due to the graph being undirected, each edge may appear more than once in the internal representation.
+    """
+
+    def __init__(self, AdjacencyTable) -> None:
+        self.graph = AdjacencyTable
+        self.nodecount = len(AdjacencyTable)
+        selfloops = sum(1 for node in AdjacencyTable if node in AdjacencyTable[node])
+        self.edgecount = (sum(len(AdjacencyTable[node]) for node in AdjacencyTable) + selfloops) // 2 # every other edge is stored twice
+        self._parent = None # union find for connectivity queries, built on first use
+        self._frozen = None # (interned copy of the graph, node and edge counts when it was built), see _interned
+        self._work = 0 # nodes visited on self.graph since the last change, see _charge
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_AdjacencyList(AdjacencyList) -> 'UUGraph':
+        """
+        Format:
+        [[node1, node2, node3], [node2, node4], ...]
+        where inner lists contain neighbours
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        """
+        AdjacencyTable = {i: set() for i in range(len(AdjacencyList))}
+        for i in range(len(AdjacencyList)):
+            for neighbour in AdjacencyList[i]:
+                AdjacencyTable[i].add(neighbour)
+                if neighbour in AdjacencyTable: # make edge bi-directional
+                    AdjacencyTable[neighbour].add(i)
+                else:
+                    AdjacencyTable[neighbour] = {i}
+        return UUGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'UUGraph':
+        """
+        Format:
+        [
+            [1, 0, 1], 
+            [1, 1, 0], 
+            ...
+        ]
+        where matrix[a][b] contains 1 if there is an edge from a to b and 0 if there is no edge between them
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        """
+        l = len(AdjacencyMatrix)
+        AdjacencyTable = {i: set() for i in range(l)}
+        for i in range(l):
+            for j in range(l):
+                if AdjacencyMatrix[i][j] != 0:
+                    AdjacencyTable[i].add(j)
+                    AdjacencyTable[j].add(i) # make edge bi-directional
+        return UUGraph(AdjacencyTable)
+
+    def construct_via_EdgeList(EdgeList) -> 'UUGraph':
+        """
+        Format:
+        [[node1, node2], [node2, node3] ...]
+        where inner lists contain edges between two nodes
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once.
+        """
+        AdjacencyTable = {}
+        for edge in EdgeList:
+            srcNode, dstNode = edge
+            if srcNode in AdjacencyTable:
+                AdjacencyTable[srcNode].add(dstNode)
+            else:
+                AdjacencyTable[srcNode] = {dstNode}
+            if dstNode in AdjacencyTable: # make edge bi-directional
+                AdjacencyTable[dstNode].add(srcNode)
+            else:
+                AdjacencyTable[dstNode] = {srcNode}
+        return UUGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyTable(AdjacencyTable) -> 'UUGraph':
+        """
+        Format:
+        {[node1, node2, node3], [node2, node4], ...}
+        where inner lists contain neighbours
+
+        Note that node names are supported by this method.
+        """
+        newAdjacencyTable = {node: set(AdjacencyTable[node]) for node in AdjacencyTable} # node names are immutable, so copying the sets is enough
+        for node in AdjacencyTable: # make edge bi-directional
+            for neighbour in AdjacencyTable[node]:
+                if neighbour in newAdjacencyTable:
+                    newAdjacencyTable[neighbour].add(node)
+                else:
+                    newAdjacencyTable[neighbour] = {node}
+        return UUGraph(newAdjacencyTable)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def to_csr(self) -> 'CSRUUGraph': # returns a new frozen graph
+        """
+        Converts the adjacency table into compressed sparse row storage, see CSRUUGraph.
+        Runs in O(V+E) time.
+        """
+        return CSRUUGraph._construct_via_Arcs(self.graph)
+    
+    # ==============================================================================
+
+    # MUTATORS
+
+    def add_node(self, node) -> None:
+        """
+        Adds a node without any edges, does nothing if the node already exists
+        """
+        if node not in self.graph:
+            self.graph[node] = set()
+            self.nodecount += 1
+            self._frozen = None
+            self._work = 0
+            if self._parent is not None:
+                self._componentid[node] = len(self._parent)
+                self._parent.append(len(self._parent))
+                self._size.append(1)
+
+    def add_edge(self, node1, node2) -> None:
+        """
+        Adds an edge between node1 and node2 in both directions, missing nodes are created
+        Does nothing if the edge already exists
+        Runs in O(1) time
+        """
+        self.add_node(node1)
+        self.add_node(node2)
+        if node2 not in self.graph[node1]:
+            self.graph[node1].add(node2)
+            self.graph[node2].add(node1)
+            self.edgecount += 1
+            self._frozen = None
+            self._work = 0
+            if self._parent is not None:
+                self._union(self._componentid[node1], self._componentid[node2])
+
+    def remove_edge(self, node1, node2) -> None:
+        """
+        Removes the edge between node1 and node2
+        Raises KeyError if there is no such edge
+        Runs in O(1) time
+        """
+        self.graph[node1].remove(node2)
+        self.graph[node2].discard(node1)
+        self.edgecount -= 1
+        self._frozen = None
+        self._work = 0
+        self._parent = None # removing an edge may split a component
+
+    def remove_node(self, node) -> None:
+        """
+        Removes a node together with all of its edges
+        Raises KeyError if there is no such node
+        Runs in O(degree) time
+        """
+        for neighbour in self.graph[node]:
+            if neighbour != node:
+                self.graph[neighbour].discard(node)
+        self.edgecount -= len(self.graph[node])
+        del self.graph[node]
+        self.nodecount -= 1
+        self._frozen = None
+        self._work = 0
+        self._parent = None
+    
+    # ==============================================================================
+
+    # INTERNING
+
+    def _interned(self, build=False) -> 'CSRUUGraph':
+        """
+        Frozen copy of the graph with node names interned to dense ints, see CSRUUGraph
+        Whole graph algorithms run on it with list/array state instead of hashing node names at every edge, names are translated back only in their results
+        Returns None if there is no valid copy, unless build is True, in which case it is built in O(V+E) time
+        The copy is dropped by the mutators and by clear_cache, and is only used while the node and edge counts match those it was built with, an O(1) check,
+        so direct edits to self.graph that add or remove nodes are caught, call clear_cache after any other direct edit
+        Generators and searches that may stop early never use it, they read self.graph directly
+        """
+        if self._frozen is not None:
+            frozen, built = self._frozen
+            if built == (len(self.graph), self.edgecount):
+                return frozen
+            self._frozen = None # self.graph was edited directly
+        if not build:
+            return None
+        self._frozen = (self.to_csr(), (len(self.graph), self.edgecount))
+        self._work = 0
+        return self._frozen[0]
+
+    def _charge(self, work: int) -> None:
+        """
+        Records work nodes visited on self.graph by a search that could have run on the interned copy
+        The copy is built once the work since the last change reaches the number of nodes, so a single search after a change
+        never pays for interning, while repeated searches of an unchanged graph move to the copy after at most twice their cost
+        """
+        self._work += work
+        if self._work >= len(self.graph):
+            self._interned(build=True)
+
+    def clear_cache(self) -> None:
+        """
+        Drops everything derived from the graph: the interned copy and the union find of connected_components and is_connected
+        Call it after editing self.graph directly instead of through the mutators
+        """
+        self._frozen = self._parent = None
+        self._work = 0
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    # whole graph searches run on the interned copy once it exists, see _interned
+
+    def dfs(self, srcNode): # depth first search from srcNode
+        frozen = self._interned()
+        if frozen is not None:
+            return frozen.dfs(srcNode)
+        order = []
+        stack = [srcNode]
+        visited = set()
+        while stack:
+            current_node = stack.pop()
+            if current_node in visited:
+                continue
+            visited.add(current_node)
+            order.append(current_node)
+            for neighbour in self.graph[current_node]:
+                stack.append(neighbour)
+        self._charge(len(order))
+        return order
+
+    def bfs(self, srcNode): # breadth first search from srcNode
+        frozen = self._interned()
+        if frozen is not None:
+            return frozen.bfs(srcNode)
+        order = [srcNode] # nodes are marked on discovery, so the list doubles as the queue
+        visited = {srcNode}
+        for current_node in order:
+            for neighbour in self.graph[current_node]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    order.append(neighbour)
+        self._charge(len(order))
+        return order
+
+    def iter_dfs(self, srcNode):
+        """
+        Generator version of dfs, yields the nodes in the same order as they are visited
+        Stopping early skips the rest of the search, the visiting order is never stored
+        """
+        stack = [srcNode]
+        visited = set()
+        while stack:
+            current_node = stack.pop()
+            if current_node in visited:
+                continue
+            visited.add(current_node)
+            yield current_node
+            stack.extend(self.graph[current_node])
+
+    def iter_bfs(self, srcNode):
+        """
+        Generator version of bfs, yields (node, depth) in the same order as bfs, depth being the number of edges from srcNode
+        Nodes are yielded as soon as they are discovered, only the current and next levels are held besides the visited set
+        """
+        visited = {srcNode}
+        frontier = [srcNode]
+        depth = 0
+        yield srcNode, depth
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current_node in frontier:
+                for neighbour in self.graph[current_node]:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_frontier.append(neighbour)
+                        yield neighbour, depth
+            frontier = next_frontier
+
+    def multi_source_bfs(self, sources) -> tuple:
+        """
+        Returns (names, distances) where distances[k][i] is the number of edges on a shortest path from sources[k] to names[i], -1 if unreachable
+        Bit-parallel bfs, all sources share one traversal instead of running bfs once per source, see _multi_source_bfs
+        Suited to landmark distances or closeness centrality, best with up to a few hundred sources per call
+        """
+        names, distances = self._interned(build=True).multi_source_bfs(sources)
+        return list(names), distances # a copy, the interned names are shared
+
+    def bfs_tree(self, srcNode, alpha=14, beta=24): # direction-optimizing breadth first search from srcNode
+        """
+        Returns a tuple (distances, parents) of dictionaries covering every node reachable from srcNode, parents[srcNode] is None
+        The search is level-synchronous, every step expands the whole frontier either
+        top-down, where frontier nodes scan their edges for unvisited nodes, or
+        bottom-up, where unvisited nodes scan their edges for a parent in the frontier and stop at the first one found
+        Switches to bottom-up once the frontier's edges outnumber 1/alpha of the edges of unvisited nodes,
+        and back to top-down once the frontier holds fewer than 1/beta of all nodes
+        Runs in O(V+E) time per top-down pass, bottom-up steps pay off on large frontiers of low-diameter graphs
+        """
+        return self._interned(build=True).bfs_tree(srcNode, alpha, beta)
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Detects cycles of odd length using dfs
+        Each node is assigned a depth upon exploration
+        When a visited node is encountered, compare its depth with that of the source node
+        If the difference is even, then the grahh is not bipartite
+        """
+        srcNode = tuple(self.graph.keys())[0] # any starting node would work
+        visited = dict() # node: depth
+        stack = [(srcNode, 0)]
+        while stack:
+            current_node, depth = stack.pop()
+            visited[current_node] = depth
+            for neighbour in self.graph[current_node]:
+                if neighbour in visited:
+                    diff = depth - visited[neighbour]
+                    if not diff % 2:
+                        return False
+                else:
+                    stack.append((neighbour, depth+1))
+        return True
+
+    # ==============================================================================
+
+    # MATCHING
+
+    def _bipartition(self, left=None) -> tuple:
+        """
+        Splits the nodes into (left, right) lists, with every edge between the two sides
+        If left is None, each connected component is 2-coloured with bfs, otherwise left lists the nodes of one side
+        Raises ValueError if the graph is not bipartite or an edge joins two nodes on the same side
+        """
+        if left is None:
+            side = {} # node: 0 for left, 1 for right
+            for root in self.graph:
+                if root in side:
+                    continue
+                side[root] = 0
+                queue = [root]
+                for current_node in queue:
+                    for neighbour in self.graph[current_node]:
+                        if neighbour not in side:
+                            side[neighbour] = side[current_node] ^ 1
+                            queue.append(neighbour)
+                        elif side[neighbour] == side[current_node]:
+                            raise ValueError("graph is not bipartite")
+        else:
+            side = dict.fromkeys(self.graph, 1)
+            for node in left:
+                side[node] = 0
+            for current_node in self.graph:
+                for neighbour in self.graph[current_node]:
+                    if side[neighbour] == side[current_node]:
+                        raise ValueError("edge within one side", (current_node, neighbour))
+        return [node for node in side if side[node] == 0], [node for node in side if side[node] == 1]
+
+    def maximum_matching(self, left=None) -> list:
+        """
+        Returns a maximum matching of a bipartite graph as a list of (left node, right node) edges, using hopcroft karp's algorithm
+        left optionally fixes the nodes of one side, otherwise the sides are found by 2-colouring (see _bipartition)
+
+        Each phase layers the free left nodes with a bfs, then finds a maximal set of vertex-disjoint shortest augmenting paths
+        with an iterative dfs that keeps an edge pointer per node, so no path is explored twice within a phase
+        Runs in O(E sqrt(V)) time, with node ids and lists instead of dictionaries
+        """
+        leftnodes, rightnodes = self._bipartition(left)
+        rightid = {node: j for j, node in enumerate(rightnodes)}
+        adjacency = [[rightid[neighbour] for neighbour in self.graph[node]] for node in leftnodes]
+        matchleft = [-1] * len(leftnodes) # right id matched to every left id
+        matchright = [-1] * len(rightnodes) # left id matched to every right id
+        while True:
+            # bfs layering from the free left nodes, stopping at the first layer that reaches a free right node
+            layer = [-1] * len(leftnodes)
+            queue = [i for i in range(len(leftnodes)) if matchleft[i] == -1]
+            for i in queue:
+                layer[i] = 0
+            limit = -1 # layer of the shortest augmenting paths
+            for i in queue:
+                if limit != -1 and layer[i] >= limit:
+                    break
+                for j in adjacency[i]:
+                    k = matchright[j]
+                    if k == -1:
+                        limit = layer[i] + 1
+                    elif layer[k] == -1:
+                        layer[k] = layer[i] + 1
+                        queue.append(k)
+            if limit == -1: # no augmenting path left
+                break
+            # iterative dfs along the layers from every free left node
+            position = [0] * len(leftnodes) # next edge to try for every left id
+            for root in range(len(leftnodes)):
+                if matchleft[root] != -1:
+                    continue
+                stack = [root]
+                while stack:
+                    i = stack[-1]
+                    if position[i] == len(adjacency[i]): # dead end, never visit again this phase
+                        layer[i] = -1
+                        stack.pop()
+                        continue
+                    j = adjacency[i][position[i]]
+                    position[i] += 1
+                    k = matchright[j]
+                    if k == -1:
+                        if layer[i] + 1 != limit:
+                            continue
+                        for i in stack: # flip the path, every node on the stack takes the edge it last tried
+                            matchleft[i] = adjacency[i][position[i]-1]
+                            matchright[matchleft[i]] = i
+                        break
+                    if layer[k] == layer[i] + 1:
+                        stack.append(k)
+        return [(leftnodes[i], rightnodes[matchleft[i]]) for i in range(len(leftnodes)) if matchleft[i] != -1]
+
+    # ==============================================================================
+
+    # CONNECTIVITY
+
+    def _build_components(self) -> None:
+        """
+        Builds a union find over the node ids, merging the two ends of every edge
+        add_node and add_edge keep it up to date, removals discard it as a union find cannot split sets
+        """
+        self._componentid = {node: i for i, node in enumerate(self.graph)} # node: id in the union find
+        self._parent = list(range(len(self._componentid)))
+        self._size = [1]*len(self._componentid)
+        componentid = self._componentid
+        for node in self.graph:
+            i = componentid[node]
+            for neighbour in self.graph[node]:
+                self._union(i, componentid[neighbour])
+
+    def _find(self, i: int) -> int: # representative of the component of node id i, with path compression
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def _union(self, i: int, j: int) -> None: # merges the components of node ids i and j, union by size
+        i = self._find(i)
+        j = self._find(j)
+        if i != j:
+            if self._size[i] < self._size[j]:
+                i, j = j, i
+            self._parent[j] = i
+            self._size[i] += self._size[j]
+
+    def connected_components(self) -> list:
+        """
+        Returns the connected components as lists of nodes
+        Runs in O(V+E) time the first time, the union find is then reused until an edge or node is removed
+        """
+        if self._parent is None:
+            self._build_components()
+        components = {} # representative: nodes
+        for node, i in self._componentid.items():
+            root = self._find(i)
+            if root in components:
+                components[root].append(node)
+            else:
+                components[root] = [node]
+        return list(components.values())
+
+    def is_connected(self, node1, node2) -> bool:
+        """
+        Checks if there is a path between node1 and node2
+        Runs in amortized O(1) time once the union find is built, even as edges are added in between queries
+        Raises KeyError if either node does not exist
+        """
+        if self._parent is None:
+            self._build_components()
+        return self._find(self._componentid[node1]) == self._find(self._componentid[node2])
+
+    # ==============================================================================
+
+    # BICONNECTIVITY
+
+    def _biconnectivity(self) -> tuple: # runs _biconnectivity on the interned graph, returns names followed by its results
+        frozen = self._interned(build=True)
+        return (frozen.names, *_biconnectivity(frozen.nodecount, frozen.offsets, frozen.targets))
+
+    def articulation_points(self) -> list:
+        """
+        Returns the nodes whose removal disconnects their connected component, a.k.a. cut vertices
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [names[i] for i in articulation]
+
+    def bridges(self) -> list:
+        """
+        Returns the edges (node1, node2) whose removal disconnects their connected component, a.k.a. cut edges
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [(names[bridges[k]], names[bridges[k+1]]) for k in range(0, len(bridges), 2)]
+
+    def biconnected_components(self) -> list:
+        """
+        Returns the biconnected components as lists of nodes, i.e. the maximal subgraphs that stay connected after removing any one node
+        Every edge belongs to exactly one component, articulation points appear in several, nodes without edges in none
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [[names[members[j]] for j in range(bounds[k], bounds[k+1])] for k in range(len(bounds)-1)]
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, see CSRUUGraph.save
+        """
+        self.to_csr().save(path)
+
+    def load(path) -> 'UUGraph':
+        """
+        Reads a snapshot written by save (of either UUGraph or CSRUUGraph) back into an adjacency table
+        For the fastest startup, load the CSRUUGraph directly with CSRUUGraph.load, which memory-maps the file
+        Only load files from trusted sources, see CSRUUGraph.load
+        """
+        return UUGraph(CSRUUGraph.load(path, use_mmap=False).to_adjacency_table())
+
+
+class CSRUUGraph: # undirected unweighted graph, frozen compressed sparse row storage
+
+    """
+    Compressed sparse row (CSR) representation of an undirected unweighted graph
+    1. names, a list where names[i] is the original name of node i
+    2. index, a dictionary mapping each node name to its integer id
+    3. offsets, an array of length V+1 where the edges of node i occupy positions offsets[i] to offsets[i+1]-1
+    4. targets, an array where targets[j] is the integer id of the neighbour at the other end of edge j
+
+    Node names are interned to contiguous integers once during construction.
+    Traversals run on integer ids with list/bytearray state, names are only translated back when returning results.
+    Costs 8 bytes per node and 8 bytes per undirected edge (plus the name table), compared to 120+ bytes per edge for the adjacency table.
+
+    The graph is frozen, edges cannot be added or removed after construction.
+    Each edge is stored once in each direction, unlike UUGraph parallel edges are kept as separate entries.
+    """
+
+    def __init__(self, names: list, offsets: array, targets: array, edgecount: int) -> None:
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.nodecount = len(names)
+        self.edgecount = edgecount # self loops are stored once, every other edge twice, so this is not len(targets) // 2
+        self._labels = None # connected component labels, computed on first use
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_EdgeList(EdgeList) -> 'CSRUUGraph':
+        """
+        Format:
+        [[node1, node2], [node2, node3] ...]
+        where inner lists contain edges between two nodes
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once and never copied into tuples or sets.
+        Edges are bucketed into CSR order with a counting sort in O(V+E) time.
+        """
+        index = {}
+        names = []
+        srcs = array('i')
+        dsts = array('i')
+        for srcNode, dstNode in EdgeList:
+            u = index.get(srcNode)
+            if u is None:
+                u = index[srcNode] = len(names)
+                names.append(srcNode)
+            v = index.get(dstNode)
+            if v is None:
+                v = index[dstNode] = len(names)
+                names.append(dstNode)
+            srcs.append(u)
+            dsts.append(v)
+        return CSRUUGraph._construct_via_Arrays(names, srcs, dsts)
+
+    def _construct_via_Arrays(names: list, srcs: array, dsts: array) -> 'CSRUUGraph':
+        # counting sort of the edge arrays by endpoint, every edge is placed in both directions (self-loops once)
+        n = len(names)
+        m = len(srcs)
+        offsets = array('q', [0]) * (n+1)
+        for j in range(m):
+            offsets[srcs[j]+1] += 1
+            if srcs[j] != dsts[j]:
+                offsets[dsts[j]+1] += 1
+        for i in range(n):
+            offsets[i+1] += offsets[i]
+        position = offsets[:-1] # next free slot of every node
+        targets = array('i', [0]) * offsets[n]
+        for j in range(m):
+            u = srcs[j]
+            v = dsts[j]
+            p = position[u]
+            targets[p] = v
+            position[u] = p + 1
+            if u != v:
+                p = position[v]
+                targets[p] = u
+                position[v] = p + 1
+        return CSRUUGraph(names, offsets, targets, m)
+
+    def _construct_via_Arcs(AdjacencyTable) -> 'CSRUUGraph':
+        # the adjacency table must already be symmetric, every entry becomes exactly one arc
+        names = list(AdjacencyTable)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        selfloops = 0
+        for node in AdjacencyTable:
+            targets.extend(index[neighbour] for neighbour in AdjacencyTable[node])
+            offsets.append(len(targets))
+            if node in AdjacencyTable[node]:
+                selfloops += 1
+        return CSRUUGraph(names, offsets, targets, (len(targets) + selfloops) // 2)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def to_adjacency_table(self) -> dict:
+        """
+        Returns the equivalent adjacency table, for use with UUGraph
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        return {names[u]: {names[targets[j]] for j in range(offsets[u], offsets[u+1])} for u in range(self.nodecount)}
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dfs(self, srcNode): # depth first search from srcNode
+        names, offsets, targets = self.names, self.offsets, self.targets
+        order = []
+        stack = [self.index[srcNode]]
+        visited = bytearray(self.nodecount)
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            order.append(names[u])
+            stack.extend(targets[offsets[u]:offsets[u+1]])
+        return order
+
+    def bfs(self, srcNode): # breadth first search from srcNode
+        names, offsets, targets = self.names, self.offsets, self.targets
+        src = self.index[srcNode]
+        queue = [src] # nodes are marked on discovery, so the list doubles as the visiting order
+        visited = bytearray(self.nodecount)
+        visited[src] = 1
+        for u in queue:
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                if not visited[v]:
+                    visited[v] = 1
+                    queue.append(v)
+        return [names[u] for u in queue]
+
+    def iter_dfs(self, srcNode):
+        """
+        Generator version of dfs, yields the nodes in the same order as they are visited
+        Stopping early skips the rest of the search, the visiting order is never stored
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        stack = [self.index[srcNode]]
+        visited = bytearray(self.nodecount)
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            yield names[u]
+            stack.extend(targets[offsets[u]:offsets[u+1]])
+
+    def iter_bfs(self, srcNode):
+        """
+        Generator version of bfs, yields (node, depth) in the same order as bfs, depth being the number of edges from srcNode
+        Nodes are yielded as soon as they are discovered, only the current and next levels are held besides the visited array
+        """
+        names, offsets, targets = self.names, self.offsets, self.targets
+        src = self.index[srcNode]
+        visited = bytearray(self.nodecount)
+        visited[src] = 1
+        frontier = [src]
+        depth = 0
+        yield srcNode, depth
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                for j in range(offsets[u], offsets[u+1]):
+                    v = targets[j]
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+                        yield names[v], depth
+            frontier = next_frontier
+
+    def multi_source_bfs(self, sources) -> tuple:
+        """
+        Returns (names, distances) where distances[k][i] is the number of edges on a shortest path from sources[k] to names[i], -1 if unreachable
+        Bit-parallel bfs, all sources share one traversal instead of running bfs once per source, see _multi_source_bfs
+        Suited to landmark distances or closeness centrality, best with up to a few hundred sources per call
+        """
+        distances = _multi_source_bfs(self.nodecount, self.offsets, self.targets, [self.index[node] for node in sources])
+        return self.names, distances
+
+    def bfs_tree(self, srcNode, alpha=14, beta=24): # direction-optimizing breadth first search from srcNode
+        """
+        Returns a tuple (distances, parents) of dictionaries covering every node reachable from srcNode, parents[srcNode] is None
+        The search is level-synchronous, every step expands the whole frontier either
+        top-down, where frontier nodes scan their edges for unvisited nodes, or
+        bottom-up, where unvisited nodes scan their edges for a parent in the frontier and stop at the first one found
+        Switches to bottom-up once the frontier's edges outnumber 1/alpha of the edges of unvisited nodes,
+        and back to top-down once the frontier holds fewer than 1/beta of all nodes
+        Visited and frontier membership are bytearrays, distances and parents are integer arrays until the final translation
+        """
+        n = self.nodecount
+        offsets, targets = self.offsets, self.targets
+        in_offsets, in_targets = offsets, targets # edges are bi-directional, so incoming edges are the same arrays
+        src = self.index[srcNode]
+        distance = array('i', [-1]) * n
+        parent = array('i', [-1]) * n
+        visited = bytearray(n)
+        distance[src] = 0
+        visited[src] = 1
+        frontier = [src]
+        unvisited_edges = len(targets) - (offsets[src+1] - offsets[src])
+        bottom_up = False
+        depth = 0
+        while frontier:
+            depth += 1
+            frontier_edges = sum(offsets[u+1] - offsets[u] for u in frontier)
+            if not bottom_up and frontier_edges > unvisited_edges / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False
+            next_frontier = []
+            if bottom_up:
+                in_frontier = bytearray(n)
+                for u in frontier:
+                    in_frontier[u] = 1
+                for v in range(n):
+                    if not visited[v]:
+                        for j in range(in_offsets[v], in_offsets[v+1]):
+                            u = in_targets[j]
+                            if in_frontier[u]:
+                                visited[v] = 1
+                                parent[v] = u
+                                distance[v] = depth
+                                next_frontier.append(v)
+                                break
+            else:
+                for u in frontier:
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not visited[v]:
+                            visited[v] = 1
+                            parent[v] = u
+                            distance[v] = depth
+                            next_frontier.append(v)
+            unvisited_edges -= sum(offsets[v+1] - offsets[v] for v in next_frontier)
+            frontier = next_frontier
+        names = self.names
+        distances = {names[v]: distance[v] for v in range(n) if visited[v]}
+        parents = {names[v]: (names[parent[v]] if parent[v] != -1 else None) for v in range(n) if visited[v]}
+        return distances, parents
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Two-colours every component with bfs, fails when an edge joins two nodes of the same colour
+        Runs in O(V+E) time
+        """
+        offsets, targets = self.offsets, self.targets
+        colour = bytearray(self.nodecount) # 0 = unvisited, 1 or 2 otherwise
+        for root in range(self.nodecount):
+            if colour[root]:
+                continue
+            colour[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for u in frontier:
+                    other = 3 - colour[u]
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not colour[v]:
+                            colour[v] = other
+                            next_frontier.append(v)
+                        elif colour[v] != other:
+                            return False
+                frontier = next_frontier
+        return True
+
+    # ==============================================================================
+
+    # CONNECTIVITY
+
+    def _component_labels(self) -> array: # representative node id of the component of every node, cached as the graph is frozen
+        if self._labels is None:
+            offsets = self.offsets
+            targets = self.targets
+            parent = list(range(self.nodecount))
+            size = [1]*self.nodecount
+
+            def find(i): # path halving
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            for node in range(self.nodecount):
+                for j in range(offsets[node], offsets[node+1]):
+                    if targets[j] < node: # every edge is stored in both directions, merge it once
+                        continue
+                    root1 = find(node)
+                    root2 = find(targets[j])
+                    if root1 != root2: # union by size
+                        if size[root1] < size[root2]:
+                            root1, root2 = root2, root1
+                        parent[root2] = root1
+                        size[root1] += size[root2]
+            self._labels = array('i', (find(i) for i in range(self.nodecount)))
+        return self._labels
+
+    def connected_components(self) -> list:
+        """
+        Returns the connected components as lists of nodes
+        Runs in O(V+E) time the first time, later calls reuse the component labels
+        """
+        components = {} # representative: nodes
+        for i, root in enumerate(self._component_labels()):
+            if root in components:
+                components[root].append(self.names[i])
+            else:
+                components[root] = [self.names[i]]
+        return list(components.values())
+
+    def is_connected(self, node1, node2) -> bool:
+        """
+        Checks if there is a path between node1 and node2 in O(1) time once the component labels are computed
+        Raises KeyError if either node does not exist
+        """
+        labels = self._component_labels()
+        return labels[self.index[node1]] == labels[self.index[node2]]
+
+    # ==============================================================================
+
+    # BICONNECTIVITY
+
+    def articulation_points(self) -> list:
+        """
+        Returns the nodes whose removal disconnects their connected component, a.k.a. cut vertices
+        Iterative low-link dfs in O(V+E) time directly on the arrays, no recursion limit applies
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        return [self.names[i] for i in articulation]
+
+    def bridges(self) -> list:
+        """
+        Returns the edges (node1, node2) whose removal disconnects their connected component, a.k.a. cut edges
+        Parallel edges are kept by the CSR graph, so they are never bridges
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        names = self.names
+        return [(names[bridges[k]], names[bridges[k+1]]) for k in range(0, len(bridges), 2)]
+
+    def biconnected_components(self) -> list:
+        """
+        Returns the biconnected components as lists of nodes, see UUGraph.biconnected_components
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        names = self.names
+        return [[names[members[j]] for j in range(bounds[k], bounds[k+1])] for k in range(len(bounds)-1)]
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, which load can map straight back into memory
+        Layout: a 40 byte header, then offsets, targets, and the node name table, each section padded to 8 bytes
+        Integer names are stored as an int64 array, string names as utf-8 with an offset array, any other names are pickled
+        """
+        names = self.names
+        if all(type(name) is int and -(1<<63) <= name < (1<<63) for name in names):
+            namekind = 0
+            nametable = array('q', names).tobytes()
+        elif all(type(name) is str for name in names):
+            namekind = 1
+            encoded = [name.encode() for name in names]
+            nameoffsets = array('q', [0])
+            for name in encoded:
+                nameoffsets.append(nameoffsets[-1] + len(name))
+            nametable = nameoffsets.tobytes() + b"".join(encoded)
+        else:
+            namekind = 2
+            nametable = pickle.dumps(names, protocol=pickle.HIGHEST_PROTOCOL)
+        weightcode = b"-" # no weights
+        with open(path, "wb") as file:
+            file.write(_SNAPSHOT_HEADER.pack(b"CSRG", 2, byteorder[0].encode(), namekind, weightcode, self.nodecount, len(self.targets), self.edgecount, len(nametable)))
+            for section in (self.offsets, self.targets):
+                size = len(section) * section.itemsize
+                file.write(section)
+                file.write(bytes(-size % 8))
+            file.write(nametable)
+
+    def load(path, use_mmap=True) -> 'CSRUUGraph':
+        """
+        Reads a snapshot written by save
+        With use_mmap the file is memory-mapped and offsets and targets are read-only views of the mapped pages,
+        so loading costs O(V) (rebuilding the name index) instead of O(V+E), and processes loading the same file share its pages
+        Without use_mmap, the sections are copied into regular arrays
+        Only load files from trusted sources, names other than ints and strings are unpickled
+        """
+        with open(path, "rb") as file:
+            magic, version, fileorder, namekind, weightcode, n, m, edgecount, namesize = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+            if magic != b"CSRG" or version != 2: # version 2 adds the edge count of undirected graphs
+                raise ValueError(f"{path} is not a graph snapshot")
+            if fileorder.decode() != byteorder[0]: # written on a machine of the other endianness, so the views cannot be used directly
+                use_mmap = False
+            if use_mmap:
+                buffer = memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                file.seek(0)
+                buffer = memoryview(file.read())
+        position = _SNAPSHOT_HEADER.size
+        sections = []
+        for typecode, count in (('q', n+1), ('i', m)):
+            size = count * array(typecode).itemsize
+            section = buffer[position:position+size]
+            if use_mmap:
+                section = section.cast(typecode)
+            else:
+                section = array(typecode, section.tobytes())
+                if fileorder.decode() != byteorder[0]:
+                    section.byteswap()
+            sections.append(section)
+            position += size + (-size % 8)
+        nametable = buffer[position:position+namesize]
+        if namekind == 0:
+            names = array('q', nametable.tobytes())
+            if fileorder.decode() != byteorder[0]:
+                names.byteswap()
+            names = names.tolist()
+        elif namekind == 1:
+            nameoffsets = array('q', nametable[:8*(n+1)].tobytes())
+            if fileorder.decode() != byteorder[0]:
+                nameoffsets.byteswap()
+            blob = nametable[8*(n+1):].tobytes()
+            names = [blob[nameoffsets[i]:nameoffsets[i+1]].decode() for i in range(n)]
+        else:
+            names = pickle.loads(nametable)
+        return CSRUUGraph(names, *sections, edgecount)
+
+
+# if __name__ == "__main__":
+
+#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "B"), ("C", "D")])
+#     print(mygraph.dfs("A"))
+#     print(mygraph.bfs("A"))
+#     print(mygraph.bfs_tree("A"))
+#     print(mygraph.is_bipartite())
+#     mygraph.remove_edge("B", "C")
+#     print(mygraph.is_bipartite()) # True
+#     mygraph = UUGraph.construct_via_AdjacencyList([(1, 2), (2,), (3, 4), {}, {}])
+#     print(mygraph.dfs(0))
+#     print(mygraph.bfs(0))
+#     print(mygraph.is_bipartite())
+
+#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "B"), ("C", "D")]).to_csr()
+#     print(mygraph.dfs("A"))
+#     print(mygraph.bfs("A"))
+#     print(mygraph.is_bipartite()) # False
+#     mygraph.save("graph.bin")
+#     mygraph = CSRUUGraph.load("graph.bin", use_mmap=False)
+#     print(mygraph.bfs("A"))
+
+#     mygraph = UUGraph.construct_via_EdgeList([(1, 2), (2, 3), (4, 5)])
+#     mygraph.add_node(6)
+#     print(mygraph.connected_components()) # [[1, 2, 3], [4, 5], [6]]
+#     print(mygraph.is_connected(1, 4)) # False
+#     mygraph.add_edge(3, 4)
+#     print(mygraph.is_connected(1, 4)) # True
+#     print(mygraph.to_csr().connected_components()) # [[1, 2, 3, 4, 5], [6]]
+
+#     mygraph = UUGraph.construct_via_EdgeList([("job1", "ann"), ("job1", "bob"), ("job2", "ann"), ("job3", "bob"), ("job3", "cat")])
+#     print(mygraph.maximum_matching(["job1", "job2", "job3"])) # [('job1', 'bob'), ('job2', 'ann'), ('job3', 'cat')]
+
+#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E")])
+#     print(mygraph.articulation_points()) # ['C', 'D']
+#     print(mygraph.bridges()) # [('D', 'E'), ('C', 'D')]
+#     print(mygraph.biconnected_components()) # [['D', 'E'], ['C', 'D'], ['A', 'B', 'C']]
+
+#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("A", "C"), ("C", "D"), ("D", "E")])
+#     print(next(node for node, depth in mygraph.to_csr().iter_bfs("A") if depth == 2)) # D
+#     print(list(mygraph.iter_dfs("A"))) # same order as dfs
+
+#     mygraph = UUGraph.construct_via_EdgeList([("A", "B"), ("B", "C"), ("C", "D")]).to_csr()
+#     names, distances = mygraph.multi_source_bfs(["A", "D"])
+#     print(names, list(distances[0]), list(distances[1])) # ['A', 'B', 'C', 'D'] [0, 1, 2, 3] [3, 2, 1, 0]
@@ -1,170 +1,1698 @@
-from copy import deepcopy
-from heapq import *
-
-class UWGraph: # undirected weighted simple graph
-    
-    """
-    Graph Representations
-    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours (and weight of the edge to that neighbour)
-    2. Adjacency matrix, a 2D list where matrix[a][b] represents the weight of the edge from a to b, if there is one
-    3. Edge list, an unordered list of edges in the form [a, b, w] representing an edge from a to b with weight w
-    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
-
-    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
-    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
-
-    Note that due to the graph being undirected, each edge is bi-directional i.e. edge from a to b automatically spawns edge from b to a.
-    """
-
-    def __init__(self, AdjacencyTable) -> None:
-        self.graph = AdjacencyTable
-        self.nodecount = len(AdjacencyTable)
-
-    # CONSTRUCTORS
-
-    # ==============================================================================
-
-    def construct_via_AdjacencyList(AdjacencyList) -> 'UWGraph':
-        """
-        Format:
-        [[(node1, weight1), (node2, weight2), (node3, weight3)], [(node2, weight4)], ...]
-        where inner lists contain neighbours and the weight of the edge to that neighbour
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        """
-        l = len(AdjacencyList)
-        AdjacencyList = [[tuple(neighbour) for neighbour in AdjacencyList[i]] for i in range(l)] # auto-convert to tuple
-        AdjacencyTable = {}
-        for i in range(l):
-            AdjacencyTable[i] = set(AdjacencyList[i])
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour, weight in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add((node, weight))
-                else:
-                    newAdjacencyTable[neighbour] = {(node, weight)}
-        return UWGraph(newAdjacencyTable)
-
-    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'UWGraph':
-        """
-        Format:
-        [
-            [2, None, 5], 
-            [3, 1, None], 
-            ...
-        ]
-        where matrix[a][b] contains a numeric value representing the weight of the edge from a to b, or None if edge does not exist
-
-        Note that node names are not supported by this method.
-        Therefore indexes are assigned to the name of each node.
-        """
-        l = len(AdjacencyMatrix)
-        AdjacencyTable = {}
-        for i in range(l):
-            AdjacencyTable[i] = set((j, AdjacencyMatrix[i][j]) for j in range(l) if AdjacencyMatrix[i][j] != None)
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour, weight in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add((node, weight))
-                else:
-                    newAdjacencyTable[neighbour] = {(node, weight)}
-        return UWGraph(newAdjacencyTable)
-
-    def construct_via_EdgeList(EdgeList) -> 'UWGraph':
-        """
-        Format:
-        [[node1, node2, weight1], [node2, node3, weight2] ...]
-        where inner lists contain edges between two nodes and the weight of the edge
-
-        Note that node names are supported by this method.
-        """
-        AdjacencyTable = {}
-        for edge in EdgeList:
-            srcNode, dstNode, weight = edge
-            if srcNode in AdjacencyTable:
-                AdjacencyTable[srcNode].add((dstNode, weight))
-            else:
-                AdjacencyTable[srcNode] = {(dstNode, weight)}
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour, weight in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add((node, weight))
-                else:
-                    newAdjacencyTable[neighbour] = {(node, weight)}
-        return UWGraph(newAdjacencyTable)
-
-    def construct_via_AdjacencyTable(AdjacencyTable) -> 'UWGraph':
-        """
-        Format:
-        {node0: {(node1, weight1), (node2, weight2), (node3, weight3)}, node1: {(node2, weight4)}, ...}
-        where inner lists contain neighbours and the weight of the edge to that neighbour
-
-        Note that node names are supported by this method.
-        """
-        newAdjacencyTable = deepcopy(AdjacencyTable)
-        for node in AdjacencyTable: # make edge bi-directional
-            for neighbour, weight in AdjacencyTable[node]:
-                if neighbour in newAdjacencyTable:
-                    newAdjacencyTable[neighbour].add((node, weight))
-                else:
-                    newAdjacencyTable[neighbour] = {(node, weight)}
-        return UWGraph(newAdjacencyTable)
-    
-    # ==============================================================================
-
-    # TRAVERSALS
-
-    def dijkstras(self, srcNode): # dijkstra's algorithm
-        """
-        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
-        """
-        ordered_costs = {}
-        heap = [(0, srcNode)]
-        while heap:
-            cost, current_node = heappop(heap)
-            if current_node in ordered_costs:
-                continue
-            ordered_costs[current_node] = cost
-            for neighbour, newcost in self.graph[current_node]:
-                heappush(heap, (cost + newcost, neighbour))
-        return ordered_costs
-    
-    # Note that Bellman Ford's is not supported in undirected graphs with negative edge weights
-    # This is due to the fact that any edge with a negative weight forms a negative cycle
-    
-    # ==============================================================================
-
-    # PROPERTY CHECKS
-
-    def is_bipartite(self) -> bool:
-        """
-        Detects cycles of odd length using dfs
-        Each node is assigned a depth upon exploration
-        When a visited node is encountered, compare its depth with that of the source node
-        If the difference is even, then the grahh is not bipartite
-        """
-        srcNode = tuple(self.graph.keys())[0] # any starting node would work
-        visited = dict() # node: depth
-        stack = [(srcNode, 0)]
-        while stack:
-            current_node, depth = stack.pop()
-            visited[current_node] = depth
-            for neighbour, weight in self.graph[current_node]:
-                if neighbour in visited:
-                    diff = depth - visited[neighbour]
-                    if not diff % 2:
-                        return False
-                else:
-                    stack.append((neighbour, depth+1))
-        return True
-    
-
-# if __name__ == "__main__":
-
-#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 3), ("A", "C", 1), ("C", "B", 4), ("C", "D", 1)])
-#     print(mygraph.dijkstras("A"))
-#     print(mygraph.is_bipartite())
\ No newline at end of file
+from heapq import *
+from collections import deque, OrderedDict
+from array import array
+from struct import Struct
+from mmap import mmap, ACCESS_READ
+from sys import byteorder, getsizeof
+from os import cpu_count
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, get_all_start_methods
+import pickle
+
+try:
+    import numpy as np
+except ImportError: # floyd_warshall falls back to lists of lists
+    np = None
+
+_SNAPSHOT_HEADER = Struct("<4sBcBcqqqq") # magic, version, byte order, name encoding, weight typecode, nodes, arcs, edges, name table size
+
+def _check_float(weight) -> None: # raises ValueError if an int weight would be rounded in a float weight array
+    if type(weight) is int and not -2**53 <= weight <= 2**53:
+        try:
+            exact = float(weight) == weight
+        except OverflowError:
+            exact = False
+        if not exact:
+            raise ValueError("int weight cannot be stored exactly in a float weight array", weight)
+
+def _float_weights(*parts) -> array:
+    """
+    Concatenates weights into a float array, used once a weight does not fit the 64-bit integer array
+    Raises ValueError if an int weight would be rounded, floats only hold every int up to 2**53
+    """
+    weights = array('d')
+    for part in parts:
+        for weight in part:
+            if type(weight) is int:
+                _check_float(weight)
+        weights.extend(array('d', part))
+    return weights
+
+_shared_graph = None # graph of the current worker process, see many_source_dijkstras
+
+def _share_graph(graph) -> None: # worker initializer, with fork the graph is inherited rather than pickled
+    global _shared_graph
+    _shared_graph = graph
+
+def _dijkstras_chunk(sources: list) -> list:
+    return [(srcNode, _shared_graph.dijkstras(srcNode)) for srcNode in sources]
+
+def _biconnectivity(nodecount: int, offsets, targets) -> tuple:
+    """
+    Iterative Hopcroft-Tarjan low-link over node ids 0 to nodecount-1, the edges of node i are targets[offsets[i]:offsets[i+1]]
+    Every edge must be stored in both directions, self loops are ignored and parallel edges are never bridges
+    Returns (articulation point ids, bridges, members, bounds) in O(V+E) time, results are kept flat to avoid millions of small objects
+    bridge k is bridges[2k] - bridges[2k+1], the ids of biconnected component k are members[bounds[k]:bounds[k+1]]
+    """
+    order = [0]*nodecount # discovery time, 0 while undiscovered
+    low = [0]*nodecount # smallest discovery time reachable with one back edge from the subtree
+    parent = [-1]*nodecount
+    position = list(offsets) # next edge to scan of every node
+    skipped = bytearray(nodecount) # whether the edge back to the parent was skipped, a parallel edge to it is a back edge
+    articulation = bytearray(nodecount)
+    bridges = []
+    members = []
+    bounds = [0]
+    nodes = [] # discovered nodes not yet assigned to a component
+    where = [0]*nodecount # position of every node in nodes
+    time = 0
+    for root in range(nodecount):
+        if order[root]:
+            continue
+        time += 1
+        order[root] = low[root] = time
+        stack = [root] # explicit dfs stack, recursion would overflow on long paths
+        where[root] = len(nodes)
+        nodes.append(root)
+        children = 0
+        while stack:
+            u = stack[-1]
+            j = position[u]
+            end = offsets[u+1]
+            lowu = low[u]
+            while j < end: # scan edges until an undiscovered neighbour is found
+                v = targets[j]
+                j += 1
+                if not order[v]:
+                    break
+                if v == parent[u] and not skipped[u]:
+                    skipped[u] = 1
+                elif order[v] < lowu:
+                    lowu = order[v]
+            else:
+                v = -1
+            position[u] = j
+            low[u] = lowu
+            if v != -1:
+                parent[v] = u
+                time += 1
+                order[v] = low[v] = time
+                stack.append(v)
+                where[v] = len(nodes)
+                nodes.append(v)
+                continue
+            stack.pop()
+            if not stack:
+                break
+            p = stack[-1]
+            if low[u] < low[p]:
+                low[p] = low[u]
+            if low[u] >= order[p]: # p separates the subtree of u from the rest, which forms a biconnected component with p
+                if p == root:
+                    children += 1
+                else:
+                    articulation[p] = 1
+                if low[u] > order[p]:
+                    bridges.append(p)
+                    bridges.append(u)
+                members.append(p) # the rest of the component is everything discovered from u onwards
+                members.extend(nodes[where[u]:])
+                del nodes[where[u]:]
+                bounds.append(len(members))
+        if children > 1:
+            articulation[root] = 1
+        nodes.clear()
+    return [i for i in range(nodecount) if articulation[i]], bridges, members, bounds
+
+class UWGraph: # undirected weighted simple graph
+    
+    """
+    Graph Representations
+    1. Adjacency list, a list where every index represents a node and contains a list representing the node's neighbours (and weight of the edge to that neighbour)
+    2. Adjacency matrix, a 2D list where matrix[a][b] represents the weight of the edge from a to b, if there is one
+    3. Edge list, an unordered list of edges in the form [a, b, w] representing an edge from a to b with weight w
+    4. Adjacency table*, a dictionary version of adjacency list, useful when node names cannot be easily sorted
+
+    Representation 4 will be the default representation of the graph within this class, due to its maximum compatibility.
+    Sets are used to represent neighbours in place of tuples for maximum flexibility during runtime.
+
+    Note that due to the graph being undirected, each edge is bi-directional i.e. edge from a to b automatically spawns edge from b to a.
+    """
+
+    def __init__(self, AdjacencyTable) -> None:
+        self.graph = AdjacencyTable
+        self.nodecount = len(AdjacencyTable)
+        selfloops = sum(1 for node in AdjacencyTable for neighbour, weight in AdjacencyTable[node] if neighbour == node)
+        self.edgecount = (sum(len(AdjacencyTable[node]) for node in AdjacencyTable) + selfloops) // 2 # every other edge is stored twice
+        self._parent = None # union find for connectivity queries, built on first use
+        self._frozen = None # (interned copy of the graph, version, node count and edge count when it was built), see _interned
+        self._work = 0 # nodes settled on self.graph since the last change, see _charge
+        self.version = 0 # bumped on every edge change, see enable_cache
+        self._cache = None
+        self._weightrange = None # see _weight_range
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_AdjacencyList(AdjacencyList) -> 'UWGraph':
+        """
+        Format:
+        [[(node1, weight1), (node2, weight2), (node3, weight3)], [(node2, weight4)], ...]
+        where inner lists contain neighbours and the weight of the edge to that neighbour
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        """
+        l = len(AdjacencyList)
+        AdjacencyTable = {i: set() for i in range(l)}
+        for i in range(l):
+            for neighbour, weight in AdjacencyList[i]:
+                AdjacencyTable[i].add((neighbour, weight))
+                if neighbour in AdjacencyTable: # make edge bi-directional
+                    AdjacencyTable[neighbour].add((i, weight))
+                else:
+                    AdjacencyTable[neighbour] = {(i, weight)}
+        return UWGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyMatrix(AdjacencyMatrix) -> 'UWGraph':
+        """
+        Format:
+        [
+            [2, None, 5], 
+            [3, 1, None], 
+            ...
+        ]
+        where matrix[a][b] contains a numeric value representing the weight of the edge from a to b, or None if edge does not exist
+
+        Note that node names are not supported by this method.
+        Therefore indexes are assigned to the name of each node.
+        """
+        l = len(AdjacencyMatrix)
+        AdjacencyTable = {i: set() for i in range(l)}
+        for i in range(l):
+            for j in range(l):
+                if AdjacencyMatrix[i][j] != None:
+                    AdjacencyTable[i].add((j, AdjacencyMatrix[i][j]))
+                    AdjacencyTable[j].add((i, AdjacencyMatrix[i][j])) # make edge bi-directional
+        return UWGraph(AdjacencyTable)
+
+    def construct_via_EdgeList(EdgeList) -> 'UWGraph':
+        """
+        Format:
+        [[node1, node2, weight1], [node2, node3, weight2] ...]
+        where inner lists contain edges between two nodes and the weight of the edge
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once.
+        """
+        AdjacencyTable = {}
+        for edge in EdgeList:
+            srcNode, dstNode, weight = edge
+            if srcNode in AdjacencyTable:
+                AdjacencyTable[srcNode].add((dstNode, weight))
+            else:
+                AdjacencyTable[srcNode] = {(dstNode, weight)}
+            if dstNode in AdjacencyTable: # make edge bi-directional
+                AdjacencyTable[dstNode].add((srcNode, weight))
+            else:
+                AdjacencyTable[dstNode] = {(srcNode, weight)}
+        return UWGraph(AdjacencyTable)
+
+    def construct_via_AdjacencyTable(AdjacencyTable) -> 'UWGraph':
+        """
+        Format:
+        {node0: {(node1, weight1), (node2, weight2), (node3, weight3)}, node1: {(node2, weight4)}, ...}
+        where inner lists contain neighbours and the weight of the edge to that neighbour
+
+        Note that node names are supported by this method.
+        """
+        newAdjacencyTable = {node: set(AdjacencyTable[node]) for node in AdjacencyTable} # edges are immutable tuples, so copying the sets is enough
+        for node in AdjacencyTable: # make edge bi-directional
+            for neighbour, weight in AdjacencyTable[node]:
+                if neighbour in newAdjacencyTable:
+                    newAdjacencyTable[neighbour].add((node, weight))
+                else:
+                    newAdjacencyTable[neighbour] = {(node, weight)}
+        return UWGraph(newAdjacencyTable)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def to_csr(self) -> 'CSRUWGraph': # returns a new frozen graph
+        """
+        Converts the adjacency table into compressed sparse row storage, see CSRUWGraph.
+        Runs in O(V+E) time.
+        """
+        return CSRUWGraph._construct_via_Arcs(self.graph)
+    
+    # ==============================================================================
+
+    # MUTATORS
+
+    def add_node(self, node) -> None:
+        """
+        Adds a node without any edges, does nothing if the node already exists
+        """
+        if node not in self.graph:
+            self.graph[node] = set()
+            self.nodecount += 1
+            self._frozen = None
+            self._work = 0
+            if self._parent is not None:
+                self._componentid[node] = len(self._parent)
+                self._parent.append(len(self._parent))
+                self._size.append(1)
+
+    def add_edge(self, node1, node2, weight) -> None:
+        """
+        Adds an edge between node1 and node2 with the given weight in both directions, missing nodes are created
+        Does nothing if the exact same edge already exists
+        Runs in O(1) time
+        """
+        self.add_node(node1)
+        self.add_node(node2)
+        if (node2, weight) not in self.graph[node1]:
+            self.graph[node1].add((node2, weight))
+            self.graph[node2].add((node1, weight))
+            self.edgecount += 1
+            self._frozen = None
+            self._work = 0
+            self.version += 1
+            if self._parent is not None:
+                self._union(self._componentid[node1], self._componentid[node2])
+
+    def remove_edge(self, node1, node2, weight=None) -> None:
+        """
+        Removes the edge between node1 and node2 with the given weight, or every edge between them if weight is None
+        Raises KeyError if there is no such edge
+        Runs in O(1) time if weight is given, O(degree of node1) otherwise
+        """
+        if weight is None:
+            edges = [edge for edge in self.graph[node1] if edge[0] == node2]
+        else:
+            edges = [(node2, weight)] if (node2, weight) in self.graph[node1] else []
+        if not edges:
+            raise KeyError((node1, node2))
+        for edge in edges:
+            self.graph[node1].remove(edge)
+            self.graph[node2].discard((node1, edge[1]))
+        self.edgecount -= len(edges)
+        self._frozen = None
+        self._work = 0
+        self.version += 1
+        self._parent = None # removing an edge may split a component
+
+    def remove_node(self, node) -> None:
+        """
+        Removes a node together with all of its edges
+        Raises KeyError if there is no such node
+        Runs in O(degree) time
+        """
+        for neighbour, weight in self.graph[node]:
+            if neighbour != node:
+                self.graph[neighbour].discard((node, weight))
+        self.edgecount -= len(self.graph[node])
+        del self.graph[node]
+        self.nodecount -= 1
+        self._frozen = None
+        self._work = 0
+        self.version += 1
+        self._parent = None
+    
+    # ==============================================================================
+
+    # INTERNING
+
+    def _interned(self, build=False) -> 'CSRUWGraph':
+        """
+        Frozen copy of the graph with node names interned to dense ints, see CSRUWGraph
+        Whole graph algorithms run on it with list/array state instead of hashing node names at every edge, names are translated back only in their results
+        dijkstras only uses it while the weight array holds every weight exactly, see _weight_range
+        Returns None if there is no valid copy, unless build is True, in which case it is built in O(V+E) time
+        The copy is dropped by the mutators and by clear_cache, and is only used while the version, node count and edge count match those it was built with, an O(1) check,
+        so direct edits to self.graph that add or remove nodes are caught, call clear_cache after any other direct edit (e.g. a changed weight)
+        Point to point and early exit searches never use it, they read self.graph directly
+        """
+        if self._frozen is not None:
+            frozen, built = self._frozen
+            if built == (self.version, len(self.graph), self.edgecount):
+                return frozen
+            self._frozen = None # self.graph was edited directly
+        if not build:
+            return None
+        self._frozen = (self.to_csr(), (self.version, len(self.graph), self.edgecount))
+        self._work = 0
+        return self._frozen[0]
+
+    def _charge(self, work: int) -> None:
+        """
+        Records work nodes settled on self.graph by a search that could have run on the interned copy
+        The copy is built once the work since the last change reaches the number of nodes, so a single search after a change
+        never pays for interning, while repeated searches of an unchanged graph move to the copy after at most twice their cost
+        """
+        self._work += work
+        if self._work >= len(self.graph):
+            self._interned(build=True)
+
+    # ==============================================================================
+
+    # SHORTEST PATH CACHE
+
+    def enable_cache(self, maxsize=32, maxmemory=None) -> None:
+        """
+        Turns on a least recently used cache of dijkstras results, keyed by source node
+        Keeps at most maxsize sources, and if maxmemory is given, at most about maxmemory bytes of results
+        The mutators bump self.version on every edge change, which empties the cache on the next lookup
+        Edits made directly to self.graph bypass the counter, call clear_cache after them (even with the cache disabled, to refresh the weight range used by dijkstras)
+        """
+        self._cache = OrderedDict() # srcNode: (result of dijkstras, estimated bytes), least recently used first
+        self._cachelimits = (maxsize, maxmemory)
+        self._cachememory = 0 # estimated bytes held by the cache
+        self._cacheversion = self.version
+
+    def disable_cache(self) -> None:
+        self._cache = None
+
+    def clear_cache(self) -> None:
+        self._weightrange = None # also recomputed, in case self.graph was edited directly
+        self._frozen = None
+        self._work = 0
+        self._parent = None
+        if self._cache is not None:
+            self._cache.clear()
+            self._cachememory = 0
+            self._cacheversion = self.version
+
+    def _cache_lookup(self, srcNode): # cached result for srcNode, or None
+        if self._cacheversion != self.version: # edges changed since the results were computed
+            self.clear_cache()
+            return None
+        if srcNode in self._cache:
+            self._cache.move_to_end(srcNode)
+            return self._cache[srcNode][0]
+        return None
+
+    def _cache_store(self, srcNode, ordered_costs: dict) -> None:
+        maxsize, maxmemory = self._cachelimits
+        size = getsizeof(ordered_costs) + 32*len(ordered_costs) # the table plus one cost object per entry, node names are shared with the graph
+        if maxmemory is not None and size > maxmemory: # would evict everything else and still not fit
+            return
+        self._cache[srcNode] = (ordered_costs, size)
+        self._cachememory += size
+        while len(self._cache) > maxsize or (maxmemory is not None and self._cachememory > maxmemory):
+            self._cachememory -= self._cache.popitem(last=False)[1][1]
+    
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dijkstras(self, srcNode): # dijkstra's algorithm
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        With the cache enabled (see enable_cache) repeated sources are answered from it, the dictionary is then shared and must not be modified
+        If every weight is a non-negative integer up to 1000, zero_one_bfs or dials is used instead of the heap
+        """
+        if self._cache is not None:
+            ordered_costs = self._cache_lookup(srcNode)
+            if ordered_costs is not None:
+                return ordered_costs
+        integral, minweight, maxweight, exact = self._weight_range()
+        if integral and minweight >= 0 and maxweight <= 1:
+            ordered_costs = self.zero_one_bfs(srcNode)
+        elif integral and minweight >= 0 and maxweight <= 1000:
+            ordered_costs = self.dials(srcNode, maxweight)
+        else:
+            frozen = self._interned() if exact else None
+            if frozen is not None:
+                ordered_costs = frozen.dijkstras(srcNode)
+            else:
+                ordered_costs = {}
+                heap = [(0, srcNode)]
+                while heap:
+                    cost, current_node = heappop(heap)
+                    if current_node in ordered_costs:
+                        continue
+                    ordered_costs[current_node] = cost
+                    for neighbour, newcost in self.graph[current_node]:
+                        heappush(heap, (cost + newcost, neighbour))
+                if exact:
+                    self._charge(len(ordered_costs))
+        if self._cache is not None:
+            self._cache_store(srcNode, ordered_costs)
+        return ordered_costs
+    
+    def _weight_range(self) -> tuple:
+        """
+        Returns (all weights are ints, minimum weight, maximum weight, exact), cached until the next edge change
+        exact tells whether the weight array of the interned graph holds every weight unchanged: all ints within 64 bits, or all floats
+        Mixed int and float weights are not exact, the array would give back the ints as floats
+        """
+        if self._weightrange is None or self._weightrange[0] != self.version:
+            integral = True # every weight is an int
+            floating = True # every weight is a float
+            minweight = maxweight = 0
+            for node in self.graph:
+                for neighbour, weight in self.graph[node]:
+                    if type(weight) is not int:
+                        integral = False
+                    if type(weight) is not float:
+                        floating = False
+                    if weight < minweight:
+                        minweight = weight
+                    elif weight > maxweight:
+                        maxweight = weight
+            if integral:
+                exact = -2**63 <= minweight and maxweight < 2**63
+            else:
+                exact = floating
+            self._weightrange = (self.version, integral, minweight, maxweight, exact)
+        return self._weightrange[1:]
+
+    def zero_one_bfs(self, srcNode): # 0-1 breadth first search
+        """
+        Returns the same dictionary as dijkstras for a graph whose weights are all 0 or 1
+        Nodes reached through a 0 edge go to the front of a deque and through a 1 edge to the back, so it is always sorted by cost
+        Runs in O(V+E) time without a heap, raises ValueError if an edge with another weight is relaxed
+        """
+        best = {srcNode: 0}
+        ordered_costs = {}
+        queue = deque([srcNode])
+        while queue:
+            current_node = queue.popleft()
+            if current_node in ordered_costs: # superseded by a cheaper entry
+                continue
+            cost = best[current_node]
+            ordered_costs[current_node] = cost
+            for neighbour, weight in self.graph[current_node]:
+                newcost = cost + weight
+                if newcost < best.get(neighbour, newcost + 1):
+                    best[neighbour] = newcost
+                    if weight == 1:
+                        queue.append(neighbour)
+                    elif weight == 0:
+                        queue.appendleft(neighbour)
+                    else:
+                        raise ValueError("zero_one_bfs requires weights of 0 or 1", weight)
+        return ordered_costs
+
+    def dials(self, srcNode, maxweight=None): # dial's algorithm
+        """
+        Returns the same dictionary as dijkstras for a graph whose weights are non-negative integers up to maxweight
+        maxweight defaults to the largest weight in the graph
+        Uses a circular array of maxweight+1 buckets indexed by cost instead of a heap, every pending node costs at most maxweight more than the current one
+        Empty buckets are skipped, a small heap holds the cost of every non-empty bucket so the next one is found directly
+        Runs in O(V+E+K log K) time where K is the number of distinct costs, raises ValueError if an edge outside 0 to maxweight is relaxed
+        """
+        if maxweight is None:
+            maxweight = max(self._weight_range()[2], 0)
+        size = maxweight + 1
+        buckets = [[] for i in range(size)]
+        buckets[0].append(srcNode)
+        costs = [0] # pending costs, pushed when their bucket becomes non-empty
+        best = {srcNode: 0}
+        ordered_costs = {}
+        while costs:
+            cost = heappop(costs)
+            bucket = buckets[cost % size]
+            while bucket: # 0 edges add to the bucket being emptied
+                current_node = bucket.pop()
+                if current_node in ordered_costs: # superseded by a cheaper entry
+                    continue
+                ordered_costs[current_node] = cost
+                for neighbour, weight in self.graph[current_node]:
+                    newcost = cost + weight
+                    if newcost < best.get(neighbour, newcost + 1):
+                        if not 0 <= weight <= maxweight:
+                            raise ValueError("dials requires integer weights from 0 to maxweight", weight)
+                        best[neighbour] = newcost
+                        nextbucket = buckets[newcost % size]
+                        if not nextbucket:
+                            heappush(costs, newcost)
+                        nextbucket.append(neighbour)
+        return ordered_costs
+
+    def many_source_dijkstras(self, sources=None, workers=None, chunksize=None): # dijkstra's algorithm from many sources in parallel
+        """
+        Generator of (srcNode, dijkstras(srcNode)) for every node in sources, or every node if sources is None
+        The sources are split into chunks solved by a pool of worker processes, os.cpu_count() of them if workers is None
+        Where fork is available the workers inherit the graph from the parent, otherwise it is pickled once per worker, never per task
+        Rows are yielded as soon as their chunk completes, so not necessarily in the order of sources
+        With workers=1 everything runs in the calling process
+        Without fork (Windows, macOS) the calling script must be guarded by if __name__ == "__main__"
+        """
+        sources = list(self.graph) if sources is None else list(sources)
+        if workers is None:
+            workers = cpu_count() or 1
+        if workers == 1 or len(sources) <= 1:
+            for srcNode in sources:
+                yield srcNode, self.dijkstras(srcNode)
+            return
+        if chunksize is None:
+            chunksize = max(1, len(sources) // (4*workers)) # a few chunks per worker to even out uneven sources
+        context = get_context("fork" if "fork" in get_all_start_methods() else None)
+        executor = ProcessPoolExecutor(workers, mp_context=context, initializer=_share_graph, initargs=(self,))
+        try:
+            futures = [executor.submit(_dijkstras_chunk, sources[i:i+chunksize]) for i in range(0, len(sources), chunksize)]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(cancel_futures=True) # the caller may stop iterating early
+
+    def shortest_path(self, srcNode, dstNode, heuristic=None): # dijkstra's algorithm with early exit, a* search if a heuristic is given
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        The search stops as soon as dstNode is settled instead of settling the whole graph
+        heuristic(node) estimates the remaining cost from node to dstNode and must never overestimate it (admissible)
+        Nodes are re-opened whenever a cheaper route to them is found, so inconsistent heuristics still give exact answers
+        """
+        best = {srcNode: 0} # best known cost from srcNode
+        prev_node = {srcNode: None} # maps each node to the previous node for path construction
+        heap = [(heuristic(srcNode) if heuristic else 0, 0, srcNode)]
+        while heap:
+            estimate, cost, current_node = heappop(heap)
+            if cost > best[current_node]: # outdated entry
+                continue
+            if current_node == dstNode:
+                path = [dstNode]
+                while path[-1] != srcNode:
+                    path.append(prev_node[path[-1]])
+                return cost, path[::-1]
+            for neighbour, weight in self.graph[current_node]:
+                newcost = cost + weight
+                if neighbour not in best or newcost < best[neighbour]:
+                    best[neighbour] = newcost
+                    prev_node[neighbour] = current_node
+                    heappush(heap, (newcost + heuristic(neighbour) if heuristic else newcost, newcost, neighbour))
+        return None # no path has been found
+
+    def bidirectional_dijkstras(self, srcNode, dstNode): # dijkstra's algorithm from both ends
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        A forward search from srcNode and a backward search from dstNode take turns, the side with the smaller frontier key goes first
+        Every edge relaxation that reaches a node labelled by the other side gives a candidate cost
+        The search stops once the two smallest frontier keys add up to at least the best candidate, which is then optimal
+        Only works with non-negative edge weights
+        """
+        if srcNode == dstNode:
+            return 0, [srcNode]
+        graphs = (self.graph, self.graph) # edges are bi-directional, so the backward search uses the same table
+        costs = ({srcNode: 0}, {dstNode: 0}) # best known cost from srcNode / to dstNode
+        prev_node = ({srcNode: None}, {dstNode: None}) # previous node towards srcNode / towards dstNode
+        settled = (set(), set())
+        heaps = ([(0, srcNode)], [(0, dstNode)])
+        best = float("inf")
+        meeting_node = None
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            cost, current_node = heappop(heaps[side])
+            if current_node in settled[side]:
+                continue
+            settled[side].add(current_node)
+            side_costs = costs[side]
+            other_costs = costs[1-side]
+            for neighbour, weight in graphs[side][current_node]:
+                newcost = cost + weight
+                if neighbour not in side_costs or newcost < side_costs[neighbour]:
+                    side_costs[neighbour] = newcost
+                    prev_node[side][neighbour] = current_node
+                    heappush(heaps[side], (newcost, neighbour))
+                    if neighbour in other_costs and newcost + other_costs[neighbour] < best:
+                        best = newcost + other_costs[neighbour]
+                        meeting_node = neighbour
+        if meeting_node is None:
+            return None # no path has been found
+        path = [meeting_node]
+        while path[-1] != srcNode:
+            path.append(prev_node[0][path[-1]])
+        path.reverse()
+        while path[-1] != dstNode:
+            path.append(prev_node[1][path[-1]])
+        return best, path
+
+    # Note that Bellman Ford's is not supported in undirected graphs with negative edge weights
+    # This is due to the fact that any edge with a negative weight forms a negative cycle
+    
+    # ==============================================================================
+
+    # ALL PAIRS SHORTEST PATHS
+
+    def floyd_warshall(self, nexthops=False) -> tuple: # floyd warshall's algorithm
+        """
+        Returns (names, distances), or (names, distances, nexthop) if nexthops is True
+        distances[i][j] is the minimum cost from names[i] to names[j], float("inf") if unreachable
+        nexthop[i][j] is the index of the node after names[i] on a shortest path to names[j], or -1 if unreachable
+        i.e. the path is recovered by repeatedly setting i = nexthop[i][j] until i == j
+        Raises ValueError with the nodes whose distance to themselves is negative if there is a negative cycle
+
+        With NumPy installed the matrices are NumPy arrays (costs become floats) and every step over k is one vectorized minimum of V*V entries
+        Otherwise they are lists of lists updated row by row, which is much slower
+        Runs in O(V^3) time and O(V^2) memory, suited for dense graphs, for sparse graphs run dijkstras from every node instead
+        """
+        names = list(self.graph)
+        index = {node: i for i, node in enumerate(names)}
+        n = len(names)
+        if np is not None:
+            distances = np.full((n, n), np.inf)
+            np.fill_diagonal(distances, 0)
+            for node in self.graph:
+                i = index[node]
+                for neighbour, weight in self.graph[node]:
+                    j = index[neighbour]
+                    if weight < distances[i, j]:
+                        distances[i, j] = weight
+            if nexthops:
+                nexthop = np.where(np.isfinite(distances), np.arange(n), -1)
+            candidate = np.empty((n, n)) # reused buffer for the costs through k
+            for k in range(n):
+                np.add(distances[:, k, None], distances[k], out=candidate)
+                if nexthops:
+                    better = candidate < distances
+                    distances[better] = candidate[better]
+                    nexthop[better] = np.broadcast_to(nexthop[:, k, None], (n, n))[better]
+                else:
+                    np.minimum(distances, candidate, out=distances)
+            negative = np.flatnonzero(np.diagonal(distances) < 0)
+        else:
+            inf = float("inf")
+            distances = [[inf]*n for i in range(n)]
+            for i in range(n):
+                distances[i][i] = 0
+            for node in self.graph:
+                i = index[node]
+                for neighbour, weight in self.graph[node]:
+                    j = index[neighbour]
+                    if weight < distances[i][j]:
+                        distances[i][j] = weight
+            if nexthops:
+                nexthop = [[j if distances[i][j] < inf else -1 for j in range(n)] for i in range(n)]
+            for k in range(n):
+                rowk = distances[k]
+                for i in range(n):
+                    dik = distances[i][k]
+                    if dik == inf:
+                        continue
+                    if nexthops:
+                        rowi = distances[i]
+                        nexti = nexthop[i]
+                        hop = nexti[k]
+                        for j in range(n):
+                            if dik + rowk[j] < rowi[j]:
+                                rowi[j] = dik + rowk[j]
+                                nexti[j] = hop
+                    else:
+                        distances[i] = list(map(min, distances[i], [dik + cost for cost in rowk]))
+            negative = [i for i in range(n) if distances[i][i] < 0]
+        if len(negative):
+            raise ValueError("graph contains a negative cycle", [names[i] for i in negative])
+        if nexthops:
+            return names, distances, nexthop
+        return names, distances
+
+    # ==============================================================================
+
+    # SPANNING TREES
+
+    def kruskals(self): # kruskal's algorithm
+        """
+        Returns (total weight, edges) of a minimum spanning forest, one tree per connected component
+        edges is a list of (node1, node2, weight) in the order they were added
+        Sorts every edge once by weight and merges components with a union find, runs in O(E log E) time
+        """
+        nodeid = {node: i for i, node in enumerate(self.graph)}
+        nodes = list(self.graph)
+        edges = [(weight, nodeid[node], nodeid[neighbour]) for node in self.graph for neighbour, weight in self.graph[node] if nodeid[node] < nodeid[neighbour]] # each edge once, self loops skipped
+        edges.sort()
+        parent = list(range(len(nodes)))
+        size = [1]*len(nodes)
+        total = 0
+        tree = []
+        for weight, i, j in edges:
+            root1 = i
+            while parent[root1] != root1: # find with path halving
+                parent[root1] = parent[parent[root1]]
+                root1 = parent[root1]
+            root2 = j
+            while parent[root2] != root2:
+                parent[root2] = parent[parent[root2]]
+                root2 = parent[root2]
+            if root1 == root2:
+                continue
+            if size[root1] < size[root2]: # union by size
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            size[root1] += size[root2]
+            total += weight
+            tree.append((nodes[i], nodes[j], weight))
+            if len(tree) == len(nodes) - 1: # spanning tree complete
+                break
+        return total, tree
+
+    def prims(self, srcNode=None): # lazy prim's algorithm
+        """
+        Returns (total weight, edges) of the minimum spanning tree of the component containing srcNode
+        If srcNode is None, the tree is regrown from every unvisited node, giving a minimum spanning forest
+        edges is a list of (node1, node2, weight) where node1 was already in the tree, in the order they were added
+        Grows the tree from a heap of crossing edges, stale entries are skipped on pop, runs in O(E log E) time
+        """
+        visited = set()
+        total = 0
+        tree = []
+        counter = 0 # tie breaker, node names need not be comparable
+        for root in (self.graph if srcNode is None else (srcNode,)):
+            if root in visited:
+                continue
+            visited.add(root)
+            heap = []
+            for neighbour, weight in self.graph[root]:
+                heap.append((weight, counter, root, neighbour))
+                counter += 1
+            heapify(heap)
+            while heap:
+                weight, _, node, current_node = heappop(heap)
+                if current_node in visited:
+                    continue
+                visited.add(current_node)
+                total += weight
+                tree.append((node, current_node, weight))
+                for neighbour, weight in self.graph[current_node]:
+                    if neighbour not in visited:
+                        heappush(heap, (weight, counter, current_node, neighbour))
+                        counter += 1
+        return total, tree
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Detects cycles of odd length using dfs
+        Each node is assigned a depth upon exploration
+        When a visited node is encountered, compare its depth with that of the source node
+        If the difference is even, then the grahh is not bipartite
+        """
+        srcNode = tuple(self.graph.keys())[0] # any starting node would work
+        visited = dict() # node: depth
+        stack = [(srcNode, 0)]
+        while stack:
+            current_node, depth = stack.pop()
+            visited[current_node] = depth
+            for neighbour, weight in self.graph[current_node]:
+                if neighbour in visited:
+                    diff = depth - visited[neighbour]
+                    if not diff % 2:
+                        return False
+                else:
+                    stack.append((neighbour, depth+1))
+        return True
+
+    # ==============================================================================
+
+    # MATCHING
+
+    def _bipartition(self, left=None) -> tuple:
+        """
+        Splits the nodes into (left, right) lists, with every edge between the two sides
+        If left is None, each connected component is 2-coloured with bfs, otherwise left lists the nodes of one side
+        Raises ValueError if the graph is not bipartite or an edge joins two nodes on the same side
+        """
+        if left is None:
+            side = {} # node: 0 for left, 1 for right
+            for root in self.graph:
+                if root in side:
+                    continue
+                side[root] = 0
+                queue = [root]
+                for current_node in queue:
+                    for neighbour, weight in self.graph[current_node]:
+                        if neighbour not in side:
+                            side[neighbour] = side[current_node] ^ 1
+                            queue.append(neighbour)
+                        elif side[neighbour] == side[current_node]:
+                            raise ValueError("graph is not bipartite")
+        else:
+            side = dict.fromkeys(self.graph, 1)
+            for node in left:
+                side[node] = 0
+            for current_node in self.graph:
+                for neighbour, weight in self.graph[current_node]:
+                    if side[neighbour] == side[current_node]:
+                        raise ValueError("edge within one side", (current_node, neighbour))
+        return [node for node in side if side[node] == 0], [node for node in side if side[node] == 1]
+
+    def assignment(self, left=None, maximize=False) -> tuple: # hungarian algorithm
+        """
+        Returns (total weight, edges) of a minimum weight maximum matching of a bipartite graph, or maximum weight if maximize is True
+        edges is a list of (left node, right node, weight), left optionally fixes the nodes of one side (see _bipartition)
+        Among matchings of the largest possible size, the one with the smallest (largest) total weight is returned
+        Of parallel edges only the lightest (heaviest) one is used, negative weights are allowed
+
+        Hungarian method in its successive shortest path form for sparse graphs
+        Every round grows the matching along the cheapest augmenting path, found by a dijkstra from all free left nodes at once
+        on reduced costs, then the potentials are updated so that reduced costs stay non-negative and matched edges stay tight
+        Each dijkstra stops as soon as no cheaper path can be found and only touches the potentials of the nodes it settled
+        Runs in O(V E log V) time, unlike the O(V^3) matrix version it never builds a V*V cost matrix
+        """
+        leftnodes, rightnodes = self._bipartition(left)
+        L = len(leftnodes)
+        rightid = {node: j for j, node in enumerate(rightnodes)}
+        sign = -1 if maximize else 1
+        adjacency = [] # (right id, cost) for every left id
+        for node in leftnodes:
+            costs = {}
+            for neighbour, weight in self.graph[node]:
+                j = rightid[neighbour]
+                if j not in costs or sign*weight < costs[j]:
+                    costs[j] = sign*weight
+            adjacency.append(list(costs.items()))
+        # potentials of left ids 0 to L-1 and right ids L onwards, starting with every reduced cost non-negative
+        potential = [0] * (L + len(rightnodes))
+        for edges in adjacency:
+            for j, cost in edges:
+                if cost < potential[L+j]:
+                    potential[L+j] = cost
+        sourcepotential = 0 # implicit source linked to every free left id, and sink linked from every free right id
+        sinkpotential = min(potential[L:], default=0)
+        matchleft = [-1] * L
+        matchright = [-1] * len(rightnodes)
+        matchcost = [0] * len(rightnodes)
+        free = set(range(L))
+        inf = float("inf")
+        while free:
+            dist = [inf] * len(potential)
+            parent = {} # id: (id it was reached from, cost of that edge)
+            for i in free:
+                dist[i] = sourcepotential - potential[i]
+            heap = [(dist[i], i) for i in free]
+            heapify(heap)
+            settled = []
+            best = inf # reduced distance to the sink
+            bestright = -1
+            while heap and heap[0][0] < best:
+                d, u = heappop(heap)
+                if d > dist[u]:
+                    continue
+                settled.append(u)
+                if u < L: # left id, move along unmatched edges
+                    for j, cost in adjacency[u]:
+                        v = L + j
+                        newdist = d + cost + potential[u] - potential[v]
+                        if newdist < dist[v] and j != matchleft[u]:
+                            dist[v] = newdist
+                            parent[v] = (u, cost)
+                            heappush(heap, (newdist, v))
+                else: # right id, move back along its matched edge or finish at the sink
+                    i = matchright[u-L]
+                    if i == -1:
+                        if d + potential[u] - sinkpotential < best:
+                            best = d + potential[u] - sinkpotential
+                            bestright = u
+                    else:
+                        newdist = d - matchcost[u-L] + potential[u] - potential[i]
+                        if newdist < dist[i]:
+                            dist[i] = newdist
+                            heappush(heap, (newdist, i))
+            if bestright == -1: # no augmenting path, the matching is maximum
+                break
+            # nodes not settled keep their potential relative to the others, so only the settled ones change
+            for u in settled:
+                potential[u] += dist[u] - best
+            sourcepotential -= best
+            # every shortest augmenting path now uses only edges of reduced cost 0, augment along as many disjoint ones as a dfs finds
+            augmented = False
+            visited = [False] * L
+            for root in list(free):
+                if potential[root] != sourcepotential or visited[root]:
+                    continue
+                visited[root] = True
+                stack = [root]
+                position = [0] # next edge to try of every left id on the stack
+                path = [] # (right id, cost) taken from every left id on the stack
+                while stack:
+                    u = stack[-1]
+                    edges = adjacency[u]
+                    k = position[-1]
+                    size = len(edges)
+                    while k < size:
+                        j, cost = edges[k]
+                        k += 1
+                        if j == matchleft[u] or cost + potential[u] != potential[L+j]:
+                            continue
+                        i = matchright[j]
+                        if i == -1 and potential[L+j] == sinkpotential:
+                            path.append((j, cost))
+                            break
+                        if i != -1 and not visited[i]:
+                            visited[i] = True
+                            path.append((j, cost))
+                            break
+                    else: # dead end
+                        stack.pop()
+                        position.pop()
+                        if path:
+                            path.pop()
+                        continue
+                    position[-1] = k
+                    if matchright[path[-1][0]] == -1: # reached a free right id, flip the path
+                        for u, (j, cost) in zip(stack, path):
+                            matchleft[u] = j
+                            matchright[j] = u
+                            matchcost[j] = cost
+                        free.discard(root)
+                        augmented = True
+                        break
+                    stack.append(matchright[path[-1][0]])
+                    position.append(0)
+            if augmented:
+                continue
+            # rounding of non-integral weights can hide the tight edges, fall back to the path found by the dijkstra
+            v = bestright
+            while True:
+                i, cost = parent[v]
+                j = matchleft[i]
+                matchleft[i] = v - L
+                matchright[v-L] = i
+                matchcost[v-L] = cost
+                if j == -1:
+                    free.discard(i)
+                    break
+                v = L + j
+        edges = []
+        total = 0
+        for i in range(L):
+            if matchleft[i] != -1:
+                weight = sign * matchcost[matchleft[i]]
+                edges.append((leftnodes[i], rightnodes[matchleft[i]], weight))
+                total += weight
+        return total, edges
+
+    # ==============================================================================
+
+    # CONNECTIVITY
+
+    def _build_components(self) -> None:
+        """
+        Builds a union find over the node ids, merging the two ends of every edge
+        add_node and add_edge keep it up to date, removals discard it as a union find cannot split sets
+        """
+        self._componentid = {node: i for i, node in enumerate(self.graph)} # node: id in the union find
+        self._parent = list(range(len(self._componentid)))
+        self._size = [1]*len(self._componentid)
+        componentid = self._componentid
+        for node in self.graph:
+            i = componentid[node]
+            for neighbour, weight in self.graph[node]:
+                self._union(i, componentid[neighbour])
+
+    def _find(self, i: int) -> int: # representative of the component of node id i, with path compression
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def _union(self, i: int, j: int) -> None: # merges the components of node ids i and j, union by size
+        i = self._find(i)
+        j = self._find(j)
+        if i != j:
+            if self._size[i] < self._size[j]:
+                i, j = j, i
+            self._parent[j] = i
+            self._size[i] += self._size[j]
+
+    def connected_components(self) -> list:
+        """
+        Returns the connected components as lists of nodes
+        Runs in O(V+E) time the first time, the union find is then reused until an edge or node is removed
+        """
+        if self._parent is None:
+            self._build_components()
+        components = {} # representative: nodes
+        for node, i in self._componentid.items():
+            root = self._find(i)
+            if root in components:
+                components[root].append(node)
+            else:
+                components[root] = [node]
+        return list(components.values())
+
+    def is_connected(self, node1, node2) -> bool:
+        """
+        Checks if there is a path between node1 and node2
+        Runs in amortized O(1) time once the union find is built, even as edges are added in between queries
+        Raises KeyError if either node does not exist
+        """
+        if self._parent is None:
+            self._build_components()
+        return self._find(self._componentid[node1]) == self._find(self._componentid[node2])
+
+    # ==============================================================================
+
+    # BICONNECTIVITY
+
+    def _biconnectivity(self) -> tuple: # interns the nodes and runs _biconnectivity, returns names followed by its results
+        frozen = self._interned()
+        if frozen is not None: # already interned, see _interned
+            return (frozen.names, *_biconnectivity(frozen.nodecount, frozen.offsets, frozen.targets))
+        names = list(self.graph) # weights are ignored, so any weights can be interned here unlike in to_csr
+        index = {node: i for i, node in enumerate(names)}
+        offsets = [0]
+        targets = []
+        for node in names:
+            targets.extend(index[neighbour] for neighbour, weight in self.graph[node])
+            offsets.append(len(targets))
+        return (names, *_biconnectivity(len(names), offsets, targets))
+
+    def articulation_points(self) -> list:
+        """
+        Returns the nodes whose removal disconnects their connected component, a.k.a. cut vertices
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [names[i] for i in articulation]
+
+    def bridges(self) -> list:
+        """
+        Returns the edges (node1, node2) whose removal disconnects their connected component, a.k.a. cut edges
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [(names[bridges[k]], names[bridges[k+1]]) for k in range(0, len(bridges), 2)]
+
+    def biconnected_components(self) -> list:
+        """
+        Returns the biconnected components as lists of nodes, i.e. the maximal subgraphs that stay connected after removing any one node
+        Every edge belongs to exactly one component, articulation points appear in several, nodes without edges in none
+        Iterative low-link dfs in O(V+E) time, no recursion limit applies
+        """
+        names, articulation, bridges, members, bounds = self._biconnectivity()
+        return [[names[members[j]] for j in range(bounds[k], bounds[k+1])] for k in range(len(bounds)-1)]
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, see CSRUWGraph.save
+        Raises ValueError unless load would give back every weight unchanged, which needs all ints within 64 bits or all floats, see _weight_range
+        """
+        if not self._weight_range()[3]:
+            raise ValueError("weights cannot be saved exactly, convert them all to ints within 64 bits or all to floats")
+        self.to_csr().save(path)
+
+    def load(path) -> 'UWGraph':
+        """
+        Reads a snapshot written by save (of either UWGraph or CSRUWGraph) back into an adjacency table
+        For the fastest startup, load the CSRUWGraph directly with CSRUWGraph.load, which memory-maps the file
+        Only load files from trusted sources, see CSRUWGraph.load
+        """
+        return UWGraph(CSRUWGraph.load(path, use_mmap=False).to_adjacency_table())
+
+
+class CSRUWGraph: # undirected weighted graph, frozen compressed sparse row storage
+
+    """
+    Compressed sparse row (CSR) representation of an undirected weighted graph
+    1. names, a list where names[i] is the original name of node i
+    2. index, a dictionary mapping each node name to its integer id
+    3. offsets, an array of length V+1 where the edges of node i occupy positions offsets[i] to offsets[i+1]-1
+    4. targets, an array where targets[j] is the integer id of the neighbour at the other end of edge j
+    5. weights, an array where weights[j] is the weight of edge j
+
+    Node names are interned to contiguous integers once during construction.
+    Traversals run on integer ids with list/bytearray state, names are only translated back when returning results.
+    Costs 8 bytes per node and 24 bytes per undirected edge (plus the name table), compared to 200+ bytes per edge for the adjacency table.
+
+    The graph is frozen, edges cannot be added or removed after construction.
+    Each edge is stored once in each direction, unlike UWGraph parallel edges are kept as separate entries.
+    """
+
+    def __init__(self, names: list, offsets: array, targets: array, weights: array, edgecount: int) -> None:
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.nodecount = len(names)
+        self.edgecount = edgecount # self loops are stored once, every other edge twice, so this is not len(targets) // 2
+        self._labels = None # connected component labels, computed on first use
+
+    # CONSTRUCTORS
+
+    # ==============================================================================
+
+    def construct_via_EdgeList(EdgeList) -> 'CSRUWGraph':
+        """
+        Format:
+        [[node1, node2, weight1], [node2, node3, weight2] ...]
+        where inner lists contain edges between two nodes and the weight of the edge
+
+        Note that node names are supported by this method.
+        EdgeList may be any iterable (e.g. a generator from EdgeListReader), it is only consumed once and never copied into tuples or sets.
+        Edges are bucketed into CSR order with a counting sort in O(V+E) time.
+        Weights are stored as int64, or as floats once a weight does not fit, raises ValueError if an int weight would then be rounded.
+        """
+        index = {}
+        names = []
+        srcs = array('i')
+        dsts = array('i')
+        weights = array('q') # switches to floats on the first non-integer weight
+        floating = False # ints are checked once the weights are floats, see _check_float
+        for srcNode, dstNode, weight in EdgeList:
+            u = index.get(srcNode)
+            if u is None:
+                u = index[srcNode] = len(names)
+                names.append(srcNode)
+            v = index.get(dstNode)
+            if v is None:
+                v = index[dstNode] = len(names)
+                names.append(dstNode)
+            srcs.append(u)
+            dsts.append(v)
+            if floating and type(weight) is int:
+                _check_float(weight)
+            try:
+                weights.append(weight)
+            except (TypeError, OverflowError): # floats, or ints beyond 64 bits
+                weights = _float_weights(weights, (weight,))
+                floating = True
+        return CSRUWGraph._construct_via_Arrays(names, srcs, dsts, weights)
+
+    def _construct_via_Arrays(names: list, srcs: array, dsts: array, weights: array) -> 'CSRUWGraph':
+        # counting sort of the edge arrays by endpoint, every edge is placed in both directions (self-loops once)
+        n = len(names)
+        m = len(srcs)
+        offsets = array('q', [0]) * (n+1)
+        for j in range(m):
+            offsets[srcs[j]+1] += 1
+            if srcs[j] != dsts[j]:
+                offsets[dsts[j]+1] += 1
+        for i in range(n):
+            offsets[i+1] += offsets[i]
+        position = offsets[:-1] # next free slot of every node
+        targets = array('i', [0]) * offsets[n]
+        typecode = weights.typecode if isinstance(weights, array) else weights.format # weights of a loaded snapshot are memoryviews
+        sorted_weights = array(typecode, [0]) * offsets[n]
+        for j in range(m):
+            u = srcs[j]
+            v = dsts[j]
+            p = position[u]
+            targets[p] = v
+            sorted_weights[p] = weights[j]
+            position[u] = p + 1
+            if u != v:
+                p = position[v]
+                targets[p] = u
+                sorted_weights[p] = weights[j]
+                position[v] = p + 1
+        return CSRUWGraph(names, offsets, targets, sorted_weights, m)
+
+    def _construct_via_Arcs(AdjacencyTable) -> 'CSRUWGraph':
+        # the adjacency table must already be symmetric, every entry becomes exactly one arc
+        names = list(AdjacencyTable)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('q')
+        floating = False # ints are checked once the weights are floats, see _check_float
+        selfloops = 0
+        for node in AdjacencyTable:
+            for neighbour, weight in AdjacencyTable[node]:
+                targets.append(index[neighbour])
+                if neighbour == node:
+                    selfloops += 1
+                if floating and type(weight) is int:
+                    _check_float(weight)
+                try:
+                    weights.append(weight)
+                except (TypeError, OverflowError): # floats, or ints beyond 64 bits
+                    weights = _float_weights(weights, (weight,))
+                    floating = True
+            offsets.append(len(targets))
+        return CSRUWGraph(names, offsets, targets, weights, (len(targets) + selfloops) // 2)
+
+    # ==============================================================================
+
+    # CONVERTERS
+
+    def _sources(self) -> array: # node at the near end of every edge, in CSR order
+        offsets = self.offsets
+        srcs = array('i')
+        for u in range(self.nodecount):
+            srcs.extend(array('i', [u]) * (offsets[u+1] - offsets[u]))
+        return srcs
+
+    def to_adjacency_table(self) -> dict:
+        """
+        Returns the equivalent adjacency table, for use with UWGraph
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        return {names[u]: {(names[targets[j]], weights[j]) for j in range(offsets[u], offsets[u+1])} for u in range(self.nodecount)}
+
+    # ==============================================================================
+
+    # TRAVERSALS
+
+    def dijkstras(self, srcNode): # dijkstra's algorithm
+        """
+        Returns a dictionary where keys are destination nodes and values are minimum weights/costs
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        best = [float("inf")] * self.nodecount # best known cost, only improvements are pushed
+        settled = bytearray(self.nodecount)
+        ordered_costs = {}
+        src = self.index[srcNode]
+        best[src] = 0
+        heap = [(0, src)]
+        while heap:
+            cost, u = heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = 1
+            ordered_costs[names[u]] = cost
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < best[v]:
+                    best[v] = newcost
+                    heappush(heap, (newcost, v))
+        return ordered_costs
+
+    def shortest_path(self, srcNode, dstNode, heuristic=None): # dijkstra's algorithm with early exit, a* search if a heuristic is given
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        The search stops as soon as dstNode is settled instead of settling the whole graph
+        heuristic(node) receives node names, estimates the remaining cost from node to dstNode and must never overestimate it (admissible)
+        Nodes are re-opened whenever a cheaper route to them is found, so inconsistent heuristics still give exact answers
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        src = self.index[srcNode]
+        dst = self.index[dstNode]
+        best = [float("inf")] * self.nodecount # best known cost from srcNode
+        prev_node = array('i', [-1]) * self.nodecount # previous node for path construction
+        best[src] = 0
+        heap = [(heuristic(srcNode) if heuristic else 0, 0, src)]
+        while heap:
+            estimate, cost, u = heappop(heap)
+            if cost > best[u]: # outdated entry
+                continue
+            if u == dst:
+                path = [dst]
+                while path[-1] != src:
+                    path.append(prev_node[path[-1]])
+                return cost, [names[v] for v in reversed(path)]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < best[v]:
+                    best[v] = newcost
+                    prev_node[v] = u
+                    heappush(heap, (newcost + heuristic(names[v]) if heuristic else newcost, newcost, v))
+        return None # no path has been found
+
+    def bidirectional_dijkstras(self, srcNode, dstNode): # dijkstra's algorithm from both ends
+        """
+        Returns a tuple (cost, path) where path lists the nodes from srcNode to dstNode inclusive, or None if dstNode is unreachable
+        A forward search from srcNode and a backward search from dstNode take turns, the side with the smaller frontier key goes first
+        Every edge relaxation that reaches a node labelled by the other side gives a candidate cost
+        The search stops once the two smallest frontier keys add up to at least the best candidate, which is then optimal
+        Only works with non-negative edge weights
+        """
+        if srcNode == dstNode:
+            return 0, [srcNode]
+        n = self.nodecount
+        src = self.index[srcNode]
+        dst = self.index[dstNode]
+        graphs = (self, self) # edges are bi-directional, so the backward search uses the same arrays
+        costs = ([float("inf")] * n, [float("inf")] * n) # best known cost from srcNode / to dstNode
+        prev_node = (array('i', [-1]) * n, array('i', [-1]) * n) # previous node towards srcNode / towards dstNode
+        settled = (bytearray(n), bytearray(n))
+        heaps = ([(0, src)], [(0, dst)])
+        costs[0][src] = 0
+        costs[1][dst] = 0
+        best = float("inf")
+        meeting_node = -1
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            cost, u = heappop(heaps[side])
+            if settled[side][u]:
+                continue
+            settled[side][u] = 1
+            offsets, targets, weights = graphs[side].offsets, graphs[side].targets, graphs[side].weights
+            side_costs = costs[side]
+            other_costs = costs[1-side]
+            for j in range(offsets[u], offsets[u+1]):
+                v = targets[j]
+                newcost = cost + weights[j]
+                if newcost < side_costs[v]:
+                    side_costs[v] = newcost
+                    prev_node[side][v] = u
+                    heappush(heaps[side], (newcost, v))
+                    if newcost + other_costs[v] < best:
+                        best = newcost + other_costs[v]
+                        meeting_node = v
+        if meeting_node == -1:
+            return None # no path has been found
+        path = [meeting_node]
+        while path[-1] != src:
+            path.append(prev_node[0][path[-1]])
+        path.reverse()
+        while path[-1] != dst:
+            path.append(prev_node[1][path[-1]])
+        names = self.names
+        return best, [names[v] for v in path]
+
+    # ==============================================================================
+
+    # SPANNING TREES
+
+    def kruskals(self): # kruskal's algorithm
+        """
+        Returns (total weight, edges) of a minimum spanning forest, one tree per connected component
+        edges is a list of (node1, node2, weight) in the order they were added
+        Sorts the edge ids once by weight and merges components with a union find, runs in O(E log E) time
+        """
+        names, targets, weights = self.names, self.targets, self.weights
+        sources = self._sources()
+        edges = sorted((j for j in range(len(targets)) if sources[j] < targets[j]), key=weights.__getitem__) # each edge once, self loops skipped
+        parent = list(range(self.nodecount))
+        size = [1]*self.nodecount
+        total = 0
+        tree = []
+        for j in edges:
+            u = sources[j]
+            v = targets[j]
+            while parent[u] != u: # find with path halving
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            if u == v:
+                continue
+            if size[u] < size[v]: # union by size
+                u, v = v, u
+            parent[v] = u
+            size[u] += size[v]
+            total += weights[j]
+            tree.append((names[sources[j]], names[targets[j]], weights[j]))
+            if len(tree) == self.nodecount - 1: # spanning tree complete
+                break
+        return total, tree
+
+    def prims(self, srcNode=None): # lazy prim's algorithm
+        """
+        Returns (total weight, edges) of the minimum spanning tree of the component containing srcNode
+        If srcNode is None, the tree is regrown from every unvisited node, giving a minimum spanning forest
+        edges is a list of (node1, node2, weight) where node1 was already in the tree, in the order they were added
+        Grows the tree from a heap of crossing edge ids, stale entries are skipped on pop, runs in O(E log E) time
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        visited = bytearray(self.nodecount)
+        total = 0
+        tree = []
+        for root in (range(self.nodecount) if srcNode is None else (self.index[srcNode],)):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            heap = [(weights[j], j, root) for j in range(offsets[root], offsets[root+1])]
+            heapify(heap)
+            while heap:
+                weight, j, u = heappop(heap)
+                v = targets[j]
+                if visited[v]:
+                    continue
+                visited[v] = 1
+                total += weight
+                tree.append((names[u], names[v], weight))
+                for k in range(offsets[v], offsets[v+1]):
+                    if not visited[targets[k]]:
+                        heappush(heap, (weights[k], k, v))
+        return total, tree
+
+    # ==============================================================================
+
+    # PROPERTY CHECKS
+
+    def is_bipartite(self) -> bool:
+        """
+        Two-colours every component with bfs, fails when an edge joins two nodes of the same colour
+        Runs in O(V+E) time
+        """
+        offsets, targets = self.offsets, self.targets
+        colour = bytearray(self.nodecount) # 0 = unvisited, 1 or 2 otherwise
+        for root in range(self.nodecount):
+            if colour[root]:
+                continue
+            colour[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for u in frontier:
+                    other = 3 - colour[u]
+                    for j in range(offsets[u], offsets[u+1]):
+                        v = targets[j]
+                        if not colour[v]:
+                            colour[v] = other
+                            next_frontier.append(v)
+                        elif colour[v] != other:
+                            return False
+                frontier = next_frontier
+        return True
+
+    # ==============================================================================
+
+    # CONNECTIVITY
+
+    def _component_labels(self) -> array: # representative node id of the component of every node, cached as the graph is frozen
+        if self._labels is None:
+            offsets = self.offsets
+            targets = self.targets
+            parent = list(range(self.nodecount))
+            size = [1]*self.nodecount
+
+            def find(i): # path halving
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            for node in range(self.nodecount):
+                for j in range(offsets[node], offsets[node+1]):
+                    if targets[j] < node: # every edge is stored in both directions, merge it once
+                        continue
+                    root1 = find(node)
+                    root2 = find(targets[j])
+                    if root1 != root2: # union by size
+                        if size[root1] < size[root2]:
+                            root1, root2 = root2, root1
+                        parent[root2] = root1
+                        size[root1] += size[root2]
+            self._labels = array('i', (find(i) for i in range(self.nodecount)))
+        return self._labels
+
+    def connected_components(self) -> list:
+        """
+        Returns the connected components as lists of nodes
+        Runs in O(V+E) time the first time, later calls reuse the component labels
+        """
+        components = {} # representative: nodes
+        for i, root in enumerate(self._component_labels()):
+            if root in components:
+                components[root].append(self.names[i])
+            else:
+                components[root] = [self.names[i]]
+        return list(components.values())
+
+    def is_connected(self, node1, node2) -> bool:
+        """
+        Checks if there is a path between node1 and node2 in O(1) time once the component labels are computed
+        Raises KeyError if either node does not exist
+        """
+        labels = self._component_labels()
+        return labels[self.index[node1]] == labels[self.index[node2]]
+
+    # ==============================================================================
+
+    # BICONNECTIVITY
+
+    def articulation_points(self) -> list:
+        """
+        Returns the nodes whose removal disconnects their connected component, a.k.a. cut vertices
+        Iterative low-link dfs in O(V+E) time directly on the arrays, no recursion limit applies
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        return [self.names[i] for i in articulation]
+
+    def bridges(self) -> list:
+        """
+        Returns the edges (node1, node2) whose removal disconnects their connected component, a.k.a. cut edges
+        Parallel edges are kept by the CSR graph, so they are never bridges
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        names = self.names
+        return [(names[bridges[k]], names[bridges[k+1]]) for k in range(0, len(bridges), 2)]
+
+    def biconnected_components(self) -> list:
+        """
+        Returns the biconnected components as lists of nodes, see UWGraph.biconnected_components
+        """
+        articulation, bridges, members, bounds = _biconnectivity(self.nodecount, self.offsets, self.targets)
+        names = self.names
+        return [[names[members[j]] for j in range(bounds[k], bounds[k+1])] for k in range(len(bounds)-1)]
+
+    # ==============================================================================
+
+    # SNAPSHOTS
+
+    def save(self, path) -> None:
+        """
+        Writes the graph to a binary snapshot file, which load can map straight back into memory
+        Layout: a 40 byte header, then offsets, targets, weights and the node name table, each section padded to 8 bytes
+        Integer names are stored as an int64 array, string names as utf-8 with an offset array, any other names are pickled
+        """
+        names = self.names
+        if all(type(name) is int and -(1<<63) <= name < (1<<63) for name in names):
+            namekind = 0
+            nametable = array('q', names).tobytes()
+        elif all(type(name) is str for name in names):
+            namekind = 1
+            encoded = [name.encode() for name in names]
+            nameoffsets = array('q', [0])
+            for name in encoded:
+                nameoffsets.append(nameoffsets[-1] + len(name))
+            nametable = nameoffsets.tobytes() + b"".join(encoded)
+        else:
+            namekind = 2
+            nametable = pickle.dumps(names, protocol=pickle.HIGHEST_PROTOCOL)
+        weightcode = (self.weights.typecode if isinstance(self.weights, array) else self.weights.format).encode()
+        with open(path, "wb") as file:
+            file.write(_SNAPSHOT_HEADER.pack(b"CSRG", 2, byteorder[0].encode(), namekind, weightcode, self.nodecount, len(self.targets), self.edgecount, len(nametable)))
+            for section in (self.offsets, self.targets, self.weights):
+                size = len(section) * section.itemsize
+                file.write(section)
+                file.write(bytes(-size % 8))
+            file.write(nametable)
+
+    def load(path, use_mmap=True) -> 'CSRUWGraph':
+        """
+        Reads a snapshot written by save
+        With use_mmap the file is memory-mapped and offsets, targets and weights are read-only views of the mapped pages,
+        so loading costs O(V) (rebuilding the name index) instead of O(V+E), and processes loading the same file share its pages
+        Without use_mmap, the sections are copied into regular arrays
+        Only load files from trusted sources, names other than ints and strings are unpickled
+        """
+        with open(path, "rb") as file:
+            magic, version, fileorder, namekind, weightcode, n, m, edgecount, namesize = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+            if magic != b"CSRG" or version != 2: # version 2 adds the edge count of undirected graphs
+                raise ValueError(f"{path} is not a graph snapshot")
+            if fileorder.decode() != byteorder[0]: # written on a machine of the other endianness, so the views cannot be used directly
+                use_mmap = False
+            if use_mmap:
+                buffer = memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                file.seek(0)
+                buffer = memoryview(file.read())
+        position = _SNAPSHOT_HEADER.size
+        sections = []
+        for typecode, count in (('q', n+1), ('i', m), (weightcode.decode(), m)):
+            size = count * array(typecode).itemsize
+            section = buffer[position:position+size]
+            if use_mmap:
+                section = section.cast(typecode)
+            else:
+                section = array(typecode, section.tobytes())
+                if fileorder.decode() != byteorder[0]:
+                    section.byteswap()
+            sections.append(section)
+            position += size + (-size % 8)
+        nametable = buffer[position:position+namesize]
+        if namekind == 0:
+            names = array('q', nametable.tobytes())
+            if fileorder.decode() != byteorder[0]:
+                names.byteswap()
+            names = names.tolist()
+        elif namekind == 1:
+            nameoffsets = array('q', nametable[:8*(n+1)].tobytes())
+            if fileorder.decode() != byteorder[0]:
+                nameoffsets.byteswap()
+            blob = nametable[8*(n+1):].tobytes()
+            names = [blob[nameoffsets[i]:nameoffsets[i+1]].decode() for i in range(n)]
+        else:
+            names = pickle.loads(nametable)
+        return CSRUWGraph(names, *sections, edgecount)
+
+
+# if __name__ == "__main__":
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 3), ("A", "C", 1), ("C", "B", 4), ("C", "D", 1)])
+#     print(mygraph.dijkstras("A"))
+#     print(mygraph.shortest_path("B", "D")) # (5, ['B', 'C', 'D'])
+#     print(mygraph.shortest_path("B", "D", heuristic=lambda node: 0)) # a* with a trivial heuristic
+#     print(mygraph.bidirectional_dijkstras("B", "D")) # (5, ['B', 'C', 'D'])
+#     print(mygraph.is_bipartite())
+#     mygraph.remove_edge("C", "B")
+#     mygraph.add_edge("B", "D", 1)
+#     print(mygraph.dijkstras("A"), mygraph.edgecount) # {..., "B": 3} 4
+
+#     mygraph = CSRUWGraph.construct_via_EdgeList([("A", "B", 3), ("A", "C", 1), ("C", "B", 4), ("C", "D", 1)])
+#     print(mygraph.dijkstras("A"))
+#     print(mygraph.is_bipartite()) # False
+#     mygraph.save("graph.bin")
+#     mygraph = CSRUWGraph.load("graph.bin")
+#     print(mygraph.dijkstras("A"))
+
+#     mygraph = UWGraph.construct_via_EdgeList([(1, 2, 8), (2, 3, 2**70 + 1)])
+#     mygraph.save("graph.bin") # ValueError, the int64 weight array cannot hold 2**70 + 1
+#     mygraph.remove_edge(2, 3)
+#     mygraph.add_edge(2, 3, 5)
+#     mygraph.save("graph.bin")
+#     print(UWGraph.load("graph.bin").graph == mygraph.graph) # True, 8 comes back as 8 and not 8.0
+
+#     mygraph = UWGraph.construct_via_EdgeList([(1, 2, 4), (2, 3, 1), (4, 5, 2)])
+#     mygraph.add_node(6)
+#     print(mygraph.connected_components()) # [[1, 2, 3], [4, 5], [6]]
+#     print(mygraph.is_connected(1, 4)) # False
+#     mygraph.add_edge(3, 4, 7)
+#     print(mygraph.is_connected(1, 4)) # True
+#     print(mygraph.to_csr().connected_components()) # [[1, 2, 3, 4, 5], [6]]
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 4), ("A", "C", 1), ("B", "C", 2), ("C", "D", 5), ("B", "D", 3), ("E", "F", 7)])
+#     print(mygraph.kruskals()) # (13, [('A', 'C', 1), ('B', 'C', 2), ('B', 'D', 3), ('E', 'F', 7)]), a forest as E-F is disconnected
+#     print(mygraph.prims("A")) # (6, [('A', 'C', 1), ('C', 'B', 2), ('B', 'D', 3)])
+#     print(mygraph.to_csr().prims()) # (13, ...)
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 2), ("A", "C", 5)])
+#     mygraph.enable_cache(maxsize=8, maxmemory=1<<20)
+#     print(mygraph.dijkstras("C")) # {'C': 0, 'B': 2, 'A': 3}, computed
+#     print(mygraph.dijkstras("C")) # served from the cache
+#     mygraph.remove_edge("B", "C")
+#     print(mygraph.dijkstras("C")) # {'C': 0, 'A': 5, 'B': 6}
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 2), ("A", "C", 5)])
+#     table = dict(mygraph.many_source_dijkstras(["A", "C"], workers=2))
+#     print(table["C"]["A"]) # 3
+
+#     mygraph = UWGraph.construct_via_AdjacencyMatrix([[0, 2, 9], [2, 0, 3], [9, 3, 0]])
+#     names, distances = mygraph.floyd_warshall()
+#     print(distances[0][2]) # 5.0 with NumPy, 5 without
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 3), ("B", "C", 0), ("A", "C", 5), ("C", "D", 2)])
+#     print(mygraph.dials("A")) # {'A': 0, 'B': 3, 'C': 3, 'D': 5}
+
+#     mygraph = UWGraph.construct_via_EdgeList([("job1", "ann", 4), ("job1", "bob", 1), ("job2", "ann", 2), ("job2", "bob", 6)])
+#     print(mygraph.assignment(["job1", "job2"])) # (3, [('job1', 'bob', 1), ('job2', 'ann', 2)])
+#     print(mygraph.assignment(["job1", "job2"], maximize=True)) # (10, [('job1', 'ann', 4), ('job2', 'bob', 6)])
+
+#     mygraph = UWGraph.construct_via_EdgeList([("A", "B", 1), ("B", "C", 1), ("C", "A", 1), ("C", "D", 2)]).to_csr()
+#     print(mygraph.articulation_points()) # ['C']
+#     print(mygraph.bridges()) # [('C', 'D')]
@@ -198,13 +198,54 @@ class AVLTree:
     def inOrder(self, root: AVLTreeNode):
         if root == None:
             return []
-        return self.preOrder(root.left) + [root] + self.preOrder(root.right)
+        return self.inOrder(root.left) + [root] + self.inOrder(root.right)
 
     @default_to_tree_root
     def postOrder(self, root: AVLTreeNode):
         if root == None:
             return []
-        return self.preOrder(root.left) + self.preOrder(root.right) + [root]
+        return self.postOrder(root.left) + self.postOrder(root.right) + [root]
+
+    # generator versions of the traversals, nodes are yielded one at a time using an explicit stack
+    # callers can stop early, and deep trees do not hit the recursion limit
+
+    @default_to_tree_root
+    def iter_preOrder(self, root: AVLTreeNode = None): # root, left child, right child
+        stack = [root] if root != None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right != None:
+                stack.append(node.right)
+            if node.left != None:
+                stack.append(node.left)
+
+    @default_to_tree_root
+    def iter_inOrder(self, root: AVLTreeNode = None): # left child, root, right child
+        stack = []
+        node = root
+        while stack or node != None:
+            while node != None: # descend to the leftmost node not yet yielded
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    @default_to_tree_root
+    def iter_postOrder(self, root: AVLTreeNode = None): # left child, right child, root
+        stack = []
+        node = root
+        last = None # last node yielded, tells whether the right subtree of the top of the stack is done
+        while stack or node != None:
+            if node != None:
+                stack.append(node)
+                node = node.left
+            elif stack[-1].right != None and stack[-1].right is not last:
+                node = stack[-1].right
+            else:
+                last = stack.pop()
+                yield last
     
     def getDiameter(self) -> int: # maximum distance from one treenode to another
         branch_diameters = []
@@ -264,4 +305,6 @@ class AVLTree:
 
 # print(myTree.preOrder(root))
 # myTree.printTree()
-# print(myTree.getDiameter())
\ No newline at end of file
+# print(myTree.getDiameter())
+
+# print([node.key for node in myTree.iter_inOrder()]) # keys in sorted order, [8, 9, 11, 13, 21, 33, 52, 61]
\ No newline at end of file
@@ -49,6 +49,47 @@ class BinaryTree:
         if root == None:
             return []
         return self.postOrder(root.left) + self.postOrder(root.right) + [root]
+
+    # generator versions of the traversals, nodes are yielded one at a time using an explicit stack
+    # callers can stop early, and deep trees do not hit the recursion limit
+
+    @default_to_tree_root
+    def iter_preOrder(self, root: BinaryTreeNode = None): # root, left child, right child
+        stack = [root] if root != None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right != None:
+                stack.append(node.right)
+            if node.left != None:
+                stack.append(node.left)
+
+    @default_to_tree_root
+    def iter_inOrder(self, root: BinaryTreeNode = None): # left child, root, right child
+        stack = []
+        node = root
+        while stack or node != None:
+            while node != None: # descend to the leftmost node not yet yielded
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    @default_to_tree_root
+    def iter_postOrder(self, root: BinaryTreeNode = None): # left child, right child, root
+        stack = []
+        node = root
+        last = None # last node yielded, tells whether the right subtree of the top of the stack is done
+        while stack or node != None:
+            if node != None:
+                stack.append(node)
+                node = node.left
+            elif stack[-1].right != None and stack[-1].right is not last:
+                node = stack[-1].right
+            else:
+                last = stack.pop()
+                yield last
     
     def getDiameter(self) -> int: # maximum distance from one treenode to another
         branch_diameters = []
@@ -82,4 +123,7 @@ class BinaryTree:
 # print(tree.preOrder())
 # print(tree.inOrder())
 # print(tree.postOrder())
-# print(tree.getDiameter())
\ No newline at end of file
+# print(tree.getDiameter())
+
+# print(list(tree.iter_postOrder())) # same as postOrder, one node at a time
+# print(next(node for node in tree.iter_inOrder() if node.key != "B")) # stops at A
\ No newline at end of file
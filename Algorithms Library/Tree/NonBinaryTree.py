@@ -49,6 +49,32 @@ class Tree:
             order += self.postOrder(child)
         order += [root]
         return order
+
+
+    # generator versions of the traversals, nodes are yielded one at a time using an explicit stack
+    # callers can stop early, and deep trees do not hit the recursion limit
+
+    @default_to_tree_root
+    def iter_preOrder(self, root: TreeNode = None): # root, children
+        stack = [root] if root != None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    @default_to_tree_root
+    def iter_postOrder(self, root: TreeNode = None): # children, root
+        if root == None:
+            return
+        stack = [(root, iter(root.children))] # node, its children not yet visited
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child == None:
+                stack.pop()
+                yield node
+            else:
+                stack.append((child, iter(child.children)))
     
     def getDiameter(self) -> int: # maximum distance from one treenode to another
         branch_diameters = []
@@ -82,4 +108,6 @@ class Tree:
 
 # print(tree.preOrder())
 # print(tree.postOrder())
-# print(tree.getDiameter())
\ No newline at end of file
+# print(tree.getDiameter())
+
+# print(next(node for node in tree.iter_preOrder() if not node.children)) # first leaf E, C and D are never visited
\ No newline at end of file